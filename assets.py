@@ -0,0 +1,1042 @@
+"""
+    file: assets.py
+    description: Contains the process-wide caches for assets, such as the TextureCache sharing decoded and scaled
+    images between every Image of the application, the Atlas slicing sprite sheets, the TextCache for rendered
+    texts, the FontRegistry and the Prefetcher decoding the assets of the games in the background. Every surface passes
+    the BlitPipeline, converting it to the pixel format of the display, before it is drawn.
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+import pygame
+from loguru import logger
+
+from config import Configuration
+
+
+class BlitPipeline:
+    """
+    A static pipeline preparing surfaces before they are drawn. Surfaces are converted to the pixel format of the
+    display, otherwise every blit converts every pixel again. Surfaces with a colorkey are RLE encoded, so their
+    transparent pixels are skipped instead of compared, surfaces with per-pixel alpha keep their alpha channel.
+    Prepared surfaces must never be drawn on, RLE encoded surfaces are slow to modify.
+    While the FrameProfiler is enabled, the game times every blit of a surface that isn't prepared and report() lists
+    them.
+
+    Tests:
+        - Ergebnis hat das Pixelformat des Displays
+        - Gezeichnete Pixel sind identisch zur unvorbereiteten Surface
+    """
+
+    # Pixel formats of the display without and with per-pixel alpha, determined once per display
+    display = None
+    formats = None
+
+    # Number of blits and their total duration in seconds of every surface that isn't prepared, keyed by its
+    # description
+    slowBlits = {}
+
+    @classmethod
+    def prepare(cls, surface, colorkey=None) -> pygame.surface.Surface:
+        """
+        This method returns the surface converted to the pixel format of the display. Surfaces already in that format
+        aren't copied.
+
+        Tests:
+            - Surfaces mit Alphakanal behalten ihre Transparenz
+            - Colorkey wird RLE-beschleunigt gesetzt
+
+        Args:
+            surface (pygame.surface.Surface): The surface to prepare
+            colorkey (tuple[int, int, int]): The color to be replaced with transparent pixels. Defaults to the colorkey
+                of the surface
+
+        Returns: The prepared surface
+        """
+
+        if surface.get_flags() & pygame.SRCALPHA:
+            if not cls.isDisplayFormat(surface):
+                surface = surface.convert_alpha()
+
+            return surface
+
+        if colorkey is None:
+            colorkey = surface.get_colorkey()
+
+        if not cls.isDisplayFormat(surface):
+            surface = surface.convert()
+
+        if colorkey is not None:
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+
+        return surface
+
+    @classmethod
+    def isDisplayFormat(cls, surface) -> bool:
+        """
+        This method checks whether a surface is in the pixel format of the display, the format of convert() or
+        convert_alpha() depending on its per-pixel alpha.
+
+        Tests:
+            - Konvertierte Surfaces haben das Format des Displays
+            - Geladene Bilder haben in der Regel ein anderes Format
+
+        Args:
+            surface (pygame.surface.Surface): The surface to check
+
+        Returns: Whether the surface can be drawn without converting its pixels
+        """
+
+        display = pygame.display.get_surface()
+        if display is not cls.display:
+            alpha = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            cls.display = display
+            cls.formats = (
+                (display.get_bitsize(), display.get_masks()),
+                (alpha.get_bitsize(), alpha.get_masks())
+            )
+
+        hasAlpha = surface.get_flags() & pygame.SRCALPHA != 0
+
+        return (surface.get_bitsize(), surface.get_masks()) == cls.formats[hasAlpha]
+
+    @classmethod
+    def track(cls, surface, duration) -> None:
+        """
+        This method saves the duration of a blit if the surface isn't prepared, i.e. not in the pixel format of the
+        display or colorkeyed without RLE. It is called for every blit of a game while the FrameProfiler is enabled.
+
+        Tests:
+            - Vorbereitete Surfaces werden nicht gezählt
+            - Dauer wird pro Surface aufsummiert
+
+        Args:
+            surface (pygame.surface.Surface): The drawn surface
+            duration (float): The duration of the blit in seconds
+
+        Returns: None
+        """
+
+        flags = surface.get_flags()
+        if not cls.isDisplayFormat(surface):
+            problem = "format"
+        elif surface.get_colorkey() is not None and not flags & pygame.RLEACCELOK:
+            problem = "colorkey without RLE"
+        else:
+            return
+
+        width, height = surface.get_size()
+        key = f"{width}x{height} {surface.get_bitsize()}-bit{' alpha' if flags & pygame.SRCALPHA else ''} ({problem})"
+
+        blits = cls.slowBlits.get(key)
+        if blits is None:
+            cls.slowBlits[key] = [1, duration]
+        else:
+            blits[0] += 1
+            blits[1] += duration
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        This method logs the surfaces that were drawn without being prepared, sorted by their total duration, and
+        resets them.
+
+        Tests:
+            - Ohne unvorbereitete Surfaces wird nichts geloggt
+            - Kosten pro Blit werden korrekt berechnet
+
+        Returns: A dict containing the number of blits and the microseconds per blit of every surface
+        """
+
+        stats = {
+            key: {"blits": blits, "perBlit": duration / blits * 1000000}
+            for key, (blits, duration) in sorted(cls.slowBlits.items(), key=lambda item: -item[1][1])
+        }
+        cls.slowBlits.clear()
+
+        if stats:
+            logger.warning("Surfaces drawn without being converted to the display format ({}):", len(stats))
+            for key, entry in stats.items():
+                logger.warning("    {}: {} blits, {:.1f} µs per blit", key, entry["blits"], entry["perBlit"])
+
+        return stats
+
+
+class TextureCache:
+    """
+    A static cache of decoded and scaled image surfaces. Images with the same path, size and colorkey share a single
+    surface, which is why surfaces from the cache must never be drawn on. Once the memory budget is exceeded, the least
+    recently used surfaces are evicted.
+
+    Tests:
+        - Gleicher Schlüssel liefert die selbe Surface
+        - Speicherbudget wird eingehalten und die am längsten ungenutzte Surface entfernt
+    """
+
+    surfaces = OrderedDict()
+    usedBytes = 0
+    budget = Configuration.TEXTURE_CACHE_BUDGET
+
+    # Statistics
+    hits = 0
+    misses = 0
+    evictions = 0
+
+    @classmethod
+    def get(cls, path, size, colorkey=None) -> pygame.surface.Surface:
+        """
+        This method returns the surface of an image scaled to the given size. The image is only loaded from disk if
+        it isn't cached already.
+
+        Tests:
+            - Bild wird nur beim ersten Aufruf geladen
+            - Colorkey wird korrekt angewendet
+
+        Args:
+            path (str): The path to the image file
+            size (tuple[int, int]): The size to scale the image to
+            colorkey (tuple[int, int, int]): The color to be replaced with transparent pixels, None for no colorkey
+
+        Returns: The shared surface of the image
+        """
+
+        key = (path, tuple(size), colorkey)
+
+        surface = cls.surfaces.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls.surfaces.move_to_end(key)
+
+            return surface
+
+        cls.misses += 1
+        Prefetcher.checkListed(key)
+
+        # Raises FileNotFoundError, which is handled by the caller
+        surface = pygame.transform.smoothscale(pygame.image.load(path).convert(), size)
+        surface = BlitPipeline.prepare(surface, colorkey)
+
+        cls.put(key, surface)
+
+        return surface
+
+    @classmethod
+    def put(cls, key, surface) -> None:
+        """
+        This method adds a surface to the cache and evicts the least recently used surfaces if the memory budget is
+        exceeded. The newest surface is always kept.
+
+        Tests:
+            - Speicherverbrauch wird korrekt berechnet
+            - Älteste Einträge werden zuerst entfernt
+
+        Args:
+            key (tuple): The key of the surface
+            surface (pygame.surface.Surface): The surface to cache
+
+        Returns: None
+        """
+
+        if key in cls.surfaces:
+            cls.usedBytes -= cls.getSurfaceBytes(cls.surfaces.pop(key))
+
+        cls.surfaces[key] = surface
+        cls.usedBytes += cls.getSurfaceBytes(surface)
+
+        while cls.usedBytes > cls.budget and len(cls.surfaces) > 1:
+            evictedKey, evicted = cls.surfaces.popitem(last=False)
+            cls.usedBytes -= cls.getSurfaceBytes(evicted)
+            cls.evictions += 1
+
+            logger.debug("Evicted texture {} from the cache", evictedKey[0])
+
+    @staticmethod
+    def getSurfaceBytes(surface) -> int:
+        """
+        This method returns the memory used by the pixels of a surface.
+
+        Tests:
+            - Ergebnis entspricht Breite * Höhe * Bytes pro Pixel
+            - Zeilenabstand (Pitch) wird berücksichtigt
+
+        Args:
+            surface (pygame.surface.Surface): The surface to measure
+
+        Returns: The size of the pixel data in bytes
+        """
+
+        return surface.get_pitch() * surface.get_height()
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        This method removes every surface from the cache and resets the statistics.
+
+        Tests:
+            - Cache ist danach leer
+            - Statistiken werden zurückgesetzt
+
+        Returns: None
+        """
+
+        cls.surfaces.clear()
+        cls.usedBytes = 0
+        cls.hits = cls.misses = cls.evictions = 0
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        This method logs and returns the statistics of the cache.
+
+        Tests:
+            - Alle Zähler sind enthalten
+            - Trefferquote wird korrekt berechnet
+
+        Returns: A dict containing the hits, misses, evictions, number of surfaces and used memory in bytes
+        """
+
+        stats = {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+            "surfaces": len(cls.surfaces),
+            "bytes": cls.usedBytes
+        }
+
+        lookups = cls.hits + cls.misses
+        hitRate = cls.hits / lookups * 100 if lookups else 0.0
+        logger.info(
+            "Texture cache: {hits} hits, {misses} misses ({rate:.1f}% hit rate), {evictions} evictions, "
+            "{surfaces} surfaces using {mb:.1f} MB",
+            rate=hitRate, mb=cls.usedBytes / 1024 / 1024, **stats
+        )
+
+        return stats
+
+
+class Atlas:
+    # Every loaded atlas, keyed by path and sprite size
+    atlases = {}
+
+    def __init__(self, path, manifest, cellSize, spriteSize):
+        """
+        This class represents a sprite sheet. The sheet is decoded once and sliced into named sprites through a
+        manifest. Every sprite is scaled to the same size and packed into a single surface, the sprites themselves are
+        subsurfaces of it. All four rotations, each with and without mirroring, are precomputed for every sprite.
+        Use Atlas.load() to share an atlas across the application.
+
+        Tests:
+            - Alle Sprites des Manifests werden korrekt ausgeschnitten
+            - Transparenz der Sprites bleibt erhalten
+
+        Args:
+            path (str): The path to the sprite sheet
+            manifest (dict[str, tuple[int, int]]): The column and row of the cell of every sprite, keyed by its name
+            cellSize (int): The width and height of a cell of the sheet in pixels
+            spriteSize (tuple[int, int]): The size to scale every sprite to
+        """
+
+        self.path = path
+        self.spriteSize = spriteSize
+
+        sheet = Prefetcher.getSheet(path).convert_alpha()
+        width, height = spriteSize
+
+        # Pack the scaled cells next to each other. The max blend copies the pixels including their alpha value
+        self.surface = pygame.Surface((width * len(manifest), height), pygame.SRCALPHA).convert_alpha()
+        self.sprites = {}
+        for index, (name, (column, row)) in enumerate(manifest.items()):
+            cell = sheet.subsurface((column * cellSize, row * cellSize, cellSize, cellSize))
+            self.surface.blit(
+                pygame.transform.smoothscale(cell, spriteSize),
+                (index * width, 0),
+                special_flags=pygame.BLEND_RGBA_MAX
+            )
+
+            self.sprites[name] = self.surface.subsurface((index * width, 0, width, height))
+
+        # Precompute the rotated and horizontally mirrored variants
+        self.variants = {}
+        for name, sprite in self.sprites.items():
+            for quarterTurns in range(4):
+                rotated = sprite
+                if quarterTurns != 0:
+                    rotated = pygame.transform.rotate(sprite, quarterTurns * 90)
+
+                self.variants[(name, quarterTurns, False)] = BlitPipeline.prepare(rotated)
+                self.variants[(name, quarterTurns, True)] = BlitPipeline.prepare(
+                    pygame.transform.flip(rotated, True, False)
+                )
+
+        logger.info("Loaded atlas {} with {} sprites", path, len(self.sprites))
+
+    @classmethod
+    def load(cls, path, manifest, cellSize, spriteSize):
+        """
+        This method returns the atlas of a sprite sheet. The sheet is only loaded the first time.
+
+        Tests:
+            - Gleiche Parameter liefern das selbe Atlas-Objekt
+            - Unterschiedliche Größen werden getrennt gespeichert
+
+        Args:
+            path (str): The path to the sprite sheet
+            manifest (dict[str, tuple[int, int]]): The column and row of the cell of every sprite, keyed by its name
+            cellSize (int): The width and height of a cell of the sheet in pixels
+            spriteSize (tuple[int, int]): The size to scale every sprite to
+
+        Returns (Atlas): The shared atlas
+        """
+
+        key = (path, tuple(spriteSize))
+
+        atlas = cls.atlases.get(key)
+        if atlas is None:
+            atlas = cls(path, manifest, cellSize, spriteSize)
+            cls.atlases[key] = atlas
+
+        return atlas
+
+    def getSprite(self, name) -> pygame.surface.Surface:
+        """
+        This method returns a sprite of the atlas. Like every cached surface it must not be drawn on.
+
+        Tests:
+            - Sprite hat die konfigurierte Größe
+            - Unbekannte Namen führen zu einem KeyError
+
+        Args:
+            name (str): The name of the sprite in the manifest
+
+        Returns: The sprite as a subsurface of the atlas
+        """
+
+        return self.sprites[name]
+
+    def getVariant(self, name, quarterTurns, flip=False) -> pygame.surface.Surface:
+        """
+        This method returns a precomputed rotated and mirrored variant of a sprite. It is the same as
+        pygame.transform.flip(pygame.transform.rotate(sprite, quarterTurns * 90), flip, False) without any transform.
+
+        Tests:
+            - Ergebnis entspricht der Rotation und Spiegelung des Sprites
+            - Negative und große Vierteldrehungen werden korrekt umgerechnet
+
+        Args:
+            name (str): The name of the sprite in the manifest
+            quarterTurns (int): The number of counterclockwise rotations by 90 degrees
+            flip (bool): Specifies whether the rotated sprite is mirrored horizontally
+
+        Returns: The variant of the sprite
+        """
+
+        return self.variants[(name, quarterTurns % 4, flip)]
+
+
+class TextCache:
+    """
+    A static cache of rendered texts. Texts are rendered once per font, text, color and antialiasing and reused while
+    they are drawn every frame. Once the cache is full, the least recently used text is evicted.
+    Like every cached surface, rendered texts must never be drawn on.
+
+    Tests:
+        - Gleicher Text wird nur einmal gerendert
+        - Maximale Anzahl an Einträgen wird eingehalten
+    """
+
+    surfaces = OrderedDict()
+    maxSize = Configuration.TEXT_CACHE_SIZE
+
+    # Statistics
+    hits = 0
+    misses = 0
+    evictions = 0
+
+    @classmethod
+    def render(cls, font, text, color, antialias=True) -> pygame.surface.Surface:
+        """
+        This method returns the rendered surface of a text. The text is only rendered if it isn't cached already.
+
+        Tests:
+            - Ergebnis entspricht font.render()
+            - Unterschiedliche Farben werden getrennt gespeichert
+
+        Args:
+            font (pygame.font.Font): The font to render the text with
+            text (str): The text to render
+            color (tuple[int, int, int]): The color of the text
+            antialias (bool): Specifies whether the text is rendered with smooth edges
+
+        Returns: The shared surface of the rendered text
+        """
+
+        key = (font, text, color, antialias)
+
+        surface = cls.surfaces.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls.surfaces.move_to_end(key)
+
+            return surface
+
+        cls.misses += 1
+
+        surface = BlitPipeline.prepare(font.render(text, antialias, color))
+        cls.surfaces[key] = surface
+
+        if len(cls.surfaces) > cls.maxSize:
+            cls.surfaces.popitem(last=False)
+            cls.evictions += 1
+
+        return surface
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        This method removes every text from the cache and resets the statistics.
+
+        Tests:
+            - Cache ist danach leer
+            - Statistiken werden zurückgesetzt
+
+        Returns: None
+        """
+
+        cls.surfaces.clear()
+        cls.hits = cls.misses = cls.evictions = 0
+
+    @classmethod
+    def getHitRate(cls) -> float:
+        """
+        This method returns the share of texts that didn't have to be rendered.
+
+        Tests:
+            - Ohne Aufrufe ist die Quote 0
+            - Quote liegt zwischen 0 und 1
+
+        Returns: The hit rate ranging from 0.0 to 1.0
+        """
+
+        lookups = cls.hits + cls.misses
+
+        return cls.hits / lookups if lookups else 0.0
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        This method logs and returns the statistics of the cache.
+
+        Tests:
+            - Alle Zähler sind enthalten
+            - Trefferquote wird korrekt berechnet
+
+        Returns: A dict containing the hits, misses, evictions, number of texts and the hit rate
+        """
+
+        stats = {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+            "texts": len(cls.surfaces),
+            "hitRate": cls.getHitRate()
+        }
+
+        logger.info(
+            "Text cache: {hits} hits, {misses} misses ({rate:.1f}% hit rate), {evictions} evictions, {texts} texts",
+            rate=stats["hitRate"] * 100, **stats
+        )
+
+        return stats
+
+
+class FontRegistry:
+    """
+    A static registry of fonts. Every font is created once per family, size and boldness and shared afterwards.
+    Resolving a font family to its file requires pygame to scan the system fonts, which is slow. That's why resolved
+    files are saved to an index on disk (Configuration.FONT_INDEX), so later starts of the application skip the scan.
+    Delete the index to pick up newly installed fonts.
+
+    Tests:
+        - Gleiche Parameter liefern das selbe Font-Objekt
+        - Index wird gespeichert und beim nächsten Start ohne Scan verwendet
+    """
+
+    fonts = {}
+    index = None  # Loaded on first use
+
+    @classmethod
+    def get(cls, family, size, bold=False) -> pygame.font.Font:
+        """
+        This method returns a font. It replaces pygame.font.SysFont().
+
+        Tests:
+            - Font wird nur beim ersten Aufruf erstellt
+            - Fett wird simuliert, falls es keine fette Schriftdatei gibt
+
+        Args:
+            family (str): The name of the font family, e.g. "arial"
+            size (int): The size of the font
+            bold (bool): Specifies whether the font is bold
+
+        Returns: The shared font
+        """
+
+        key = (family.lower(), size, bold)
+
+        font = cls.fonts.get(key)
+        if font is None:
+            path, fakeBold = cls.resolve(family, bold)
+
+            font = pygame.font.Font(path, size)
+            if fakeBold:
+                font.set_bold(True)
+
+            cls.fonts[key] = font
+
+        return font
+
+    @classmethod
+    def resolve(cls, family, bold=False) -> (str, bool):
+        """
+        This method returns the file of a font family. The system fonts are only scanned if the family isn't in the
+        index yet. Families without a matching system font are resolved to the default font of pygame.
+
+        Tests:
+            - Bekannte Familie wird ohne Scan aus dem Index gelesen
+            - Nicht mehr vorhandene Dateien werden neu aufgelöst
+
+        Args:
+            family (str): The name of the font family, e.g. "arial"
+            bold (bool): Specifies whether the bold variant is needed
+
+        Returns: The path to the font file and whether bold has to be simulated
+        """
+
+        if cls.index is None:
+            cls.loadIndex()
+
+        key = f"{family.lower()}|{'bold' if bold else 'regular'}"
+
+        entry = cls.index.get(key)
+        if entry is None or not os.path.isfile(entry["path"]):
+            logger.debug("Font {} is not indexed, scanning the system fonts", key)
+
+            # match_font falls back to the regular file if there is no bold one
+            path = pygame.font.match_font(family, bold)
+            fakeBold = bold and path is not None and path == pygame.font.match_font(family)
+
+            if path is None:
+                path = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+                fakeBold = bold
+
+            entry = {
+                "path": path,
+                "fakeBold": fakeBold
+            }
+            cls.index[key] = entry
+            cls.saveIndex()
+
+        return entry["path"], entry["fakeBold"]
+
+    @classmethod
+    def loadIndex(cls) -> None:
+        """
+        This method loads the font index from disk. A missing or broken index results in an empty one.
+
+        Tests:
+            - Vorhandener Index wird korrekt gelesen
+            - Fehlerhafte Dateien führen zu einem leeren Index
+
+        Returns: None
+        """
+
+        try:
+            with open(Configuration.FONT_INDEX, "r") as file:
+                cls.index = json.load(file)
+        except FileNotFoundError:
+            cls.index = {}
+        except (OSError, ValueError):
+            logger.warning("Font index {} could not be read", Configuration.FONT_INDEX)
+            cls.index = {}
+
+    @classmethod
+    def saveIndex(cls) -> None:
+        """
+        This method saves the font index to disk.
+
+        Tests:
+            - Ordner wird bei Bedarf angelegt
+            - Fehler beim Schreiben beenden das Spiel nicht
+
+        Returns: None
+        """
+
+        try:
+            os.makedirs(os.path.dirname(Configuration.FONT_INDEX), exist_ok=True)
+            with open(Configuration.FONT_INDEX, "w") as file:
+                json.dump(cls.index, file, indent=4)
+        except OSError:
+            logger.warning("Font index {} could not be saved", Configuration.FONT_INDEX)
+
+
+class Prefetcher:
+    """
+    A static service decoding the assets of every game in a thread pool while the menu is idle. Images are decoded and
+    scaled in the background, their conversion to the pixel format of the display is finalized on the main thread,
+    which adds them to the TextureCache. Sprite sheets and sounds are kept until a game asks for them.
+    The assets of a game are read from the manifest of its class, Game.ASSETS, once its module is imported. Assets
+    loaded by a game without being listed there are logged as a warning.
+    A game launched after all of its assets were finalized starts "warm", otherwise "cold".
+
+    Tests:
+        - Jedes Asset wird nur einmal geladen
+        - Zustand eines Spiels wechselt von cold über loading zu warm
+    """
+
+    executor = None
+    pending = []  # [game, kind, key, future] of every asset not finalized yet
+    remaining = {}  # Number of assets of every game not finalized yet
+    launches = {}  # State of every game at its last launch
+
+    listed = set()  # Paths of the sheets and sounds and TextureCache keys of the images of every manifest
+
+    sheets = {}  # Decoded sprite sheets, keyed by path
+    sounds = {}  # Loaded sounds, keyed by path
+
+    @classmethod
+    def start(cls, games=None) -> None:
+        """
+        This method submits the import of every game to the thread pool, its assets are submitted once the import is
+        finalized. Only the first call has an effect.
+
+        Tests:
+            - Wiederholter Aufruf startet keine neuen Aufträge
+            - Jedes Spiel wird im Hintergrund importiert
+
+        Args:
+            games (dict[str, str]): The class of every game, e.g. "games.Snake.Snake". Defaults to
+                Configuration.PREFETCH_GAMES
+
+        Returns: None
+        """
+
+        if cls.executor is not None:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        if games is None:
+            games = Configuration.PREFETCH_GAMES
+
+        cls.executor = ThreadPoolExecutor(max_workers=Configuration.PREFETCH_WORKERS, thread_name_prefix="prefetch")
+
+        for game, path in games.items():
+            cls.pending.append([game, "module", path, cls.executor.submit(cls.importClass, path)])
+            cls.remaining[game] = 1
+
+        logger.info("Prefetching the assets of {} games", len(games))
+
+    @staticmethod
+    def importClass(path):
+        """
+        This method imports the module of a game and returns the class of the game. It runs on a worker thread.
+
+        Tests:
+            - Klasse des Spiels wird zurückgegeben
+            - Fehlende Module werfen einen ImportError
+
+        Args:
+            path (str): The module and the name of the class, e.g. "games.Snake.Snake"
+
+        Returns (type): The class of the game
+        """
+
+        from importlib import import_module
+
+        module, name = path.rsplit(".", 1)
+
+        return getattr(import_module(module), name)
+
+    @classmethod
+    def submit(cls, game, assets) -> None:
+        """
+        This method submits every asset of the manifest of a game to the thread pool, that isn't loaded or submitted
+        already.
+
+        Tests:
+            - Bereits gecachte oder gelistete Assets werden übersprungen
+            - Alle Assets werden als gelistet vermerkt
+
+        Args:
+            game (str): The name of the game
+            assets (dict[str, dict | list]): The images, sprite sheets and sounds of the game, see Game.getAssets()
+
+        Returns: None
+        """
+
+        jobs = []
+
+        # Assets shared with a game listed before, e.g. of the Game class, are only prefetched once
+        for path, size, colorkey in assets["images"].values():
+            key = (path, tuple(size), colorkey)
+            if key not in cls.listed and key not in TextureCache.surfaces:
+                jobs.append(("image", key, cls.executor.submit(cls.decodeImage, path, size)))
+            cls.listed.add(key)
+
+        for path in assets["sheets"]:
+            if path not in cls.listed:
+                jobs.append(("sheet", path, cls.executor.submit(pygame.image.load, path)))
+            cls.listed.add(path)
+
+        for path in assets["sounds"].values():
+            if path not in cls.listed and path not in cls.sounds:
+                jobs.append(("sound", path, cls.executor.submit(pygame.mixer.Sound, path)))
+            cls.listed.add(path)
+
+        cls.pending.extend([game, kind, key, future] for kind, key, future in jobs)
+        cls.remaining[game] += len(jobs)
+
+    @staticmethod
+    def decodeImage(path, size) -> pygame.surface.Surface:
+        """
+        This method decodes and scales an image. It runs on a worker thread, which is why the surface isn't converted
+        to the pixel format of the display. smoothscale() only accepts 24 and 32 bit surfaces, so paletted images are
+        converted to 32 bit without alpha first, like TextureCache.get() does with convert().
+
+        Tests:
+            - Bild hat danach die gewünschte Größe
+            - Bilder mit Farbpalette werden ebenfalls skaliert
+
+        Args:
+            path (str): The path to the image file
+            size (tuple[int, int]): The size to scale the image to
+
+        Returns: The scaled surface in a 32 bit pixel format
+        """
+
+        return pygame.transform.smoothscale(pygame.image.load(path).convert(32), size)
+
+    @classmethod
+    def update(cls) -> None:
+        """
+        This method is called every frame of the menu. It starts prefetching on the first call and finalizes the
+        decoded assets, at most Configuration.PREFETCH_FINALIZE_PER_FRAME images per frame to keep the menu smooth.
+
+        Tests:
+            - Nur fertige Aufträge werden abgeschlossen
+            - Limit pro Frame wird eingehalten
+
+        Returns: None
+        """
+
+        if cls.executor is None:
+            cls.start()
+
+        finalized = 0
+        index = 0
+        while index < len(cls.pending) and finalized < Configuration.PREFETCH_FINALIZE_PER_FRAME:
+            job = cls.pending[index]
+            if job[3].done():
+                del cls.pending[index]
+                if cls.finalize(*job):
+                    finalized += 1
+            else:
+                index += 1
+
+    @classmethod
+    def finish(cls, game) -> str:
+        """
+        This method is called right before a game is launched. Assets of the game that are still being decoded are
+        waited for, assets that haven't been started yet are cancelled and loaded by the game itself.
+
+        Tests:
+            - Alle Assets des Spiels sind danach abgeschlossen oder abgebrochen
+            - Zustand beim Start wird gespeichert und geloggt
+
+        Args:
+            game (str): The name of the game
+
+        Returns: The state of the game at its launch, either "warm" or "cold"
+        """
+
+        isCold = game not in cls.remaining
+
+        # Finalizing the import of the game submits its assets, which are handled in the next iteration
+        jobs = [job for job in cls.pending if job[0] == game]
+        while jobs:
+            for job in jobs:
+                cls.pending.remove(job)
+
+                # Waiting for an asset queued behind others would take longer than loading it directly. The import is
+                # always waited for, the game is imported right afterwards and its manifest is needed
+                if job[1] != "module" and job[3].cancel():
+                    cls.remaining[game] -= 1
+                    isCold = True
+                    continue
+
+                cls.finalize(*job)
+
+            jobs = [job for job in cls.pending if job[0] == game]
+
+        state = "cold" if isCold else "warm"
+        cls.launches[game] = state
+        logger.info("Launching {} {}", game, state)
+
+        return state
+
+    @classmethod
+    def finalize(cls, game, kind, key, future) -> bool:
+        """
+        This method takes the result of a finished asset. Images are converted to the pixel format of the display and
+        added to the TextureCache, which is why it has to be called on the main thread.
+
+        Tests:
+            - Bilder landen mit Colorkey im TextureCache
+            - Fehlgeschlagene Assets beenden das Programm nicht
+
+        Args:
+            game (str): The name of the game the asset belongs to
+            kind (str): The kind of the asset, one of "module", "image", "sheet" or "sound"
+            key: The key of the asset. The class for modules, the path for sheets and sounds, the TextureCache key for
+                images
+            future (concurrent.futures.Future): The finished job of the asset
+
+        Returns: Whether an image was converted
+        """
+
+        # Any failure only means the game loads the asset itself, it must never end the menu
+        try:
+            result = future.result()
+        except Exception as error:
+            logger.warning("Prefetching {} failed: {!r}", key, error)
+            result = None
+
+        # The assets of the game are submitted before the import is counted, so the game doesn't appear prefetched
+        if kind == "module" and result is not None:
+            cls.submit(game, result.getAssets())
+
+        cls.remaining[game] -= 1
+        if cls.remaining[game] == 0:
+            logger.info("Assets of {} prefetched", game)
+
+        if result is None:
+            return False
+
+        if kind == "image" and key not in TextureCache.surfaces:
+            # Like TextureCache.get(), the alpha channel of the file is replaced by the colorkey
+            TextureCache.put(key, BlitPipeline.prepare(result.convert(), key[2]))
+
+            return True
+        elif kind == "sheet":
+            cls.sheets[key] = result
+        elif kind == "sound":
+            cls.sounds[key] = result
+
+        return False
+
+    @classmethod
+    def isDone(cls) -> bool:
+        """
+        This method checks whether prefetching has been started and every asset has been finalized.
+
+        Tests:
+            - Vor dem Start ist das Vorladen nicht fertig
+            - Ausstehende Assets verhindern den Abschluss
+
+        Returns: Whether there is nothing left to finalize
+        """
+
+        return cls.executor is not None and not cls.pending
+
+    @classmethod
+    def getState(cls, game) -> str:
+        """
+        This method returns the prefetch state of a game.
+
+        Tests:
+            - Nicht gestartete Spiele sind cold
+            - Spiele ohne ausstehende Assets sind warm
+
+        Args:
+            game (str): The name of the game
+
+        Returns: "cold" if prefetching hasn't started, "loading" while assets are pending and "warm" once all are ready
+        """
+
+        if game not in cls.remaining:
+            return "cold"
+        elif cls.remaining[game] > 0:
+            return "loading"
+
+        return "warm"
+
+    @classmethod
+    def getSound(cls, path) -> pygame.mixer.Sound:
+        """
+        This method returns the prefetched sound of a file or loads it if it wasn't prefetched.
+
+        Tests:
+            - Vorgeladener Sound wird wiederverwendet
+            - Fehlende Dateien werfen einen FileNotFoundError
+
+        Args:
+            path (str): The path to the sound file
+
+        Returns: The sound
+        """
+
+        sound = cls.sounds.get(path)
+        if sound is None:
+            cls.checkListed(path)
+            sound = pygame.mixer.Sound(path)
+            cls.sounds[path] = sound
+
+        return sound
+
+    @classmethod
+    def getSheet(cls, path) -> pygame.surface.Surface:
+        """
+        This method returns the prefetched, not converted sprite sheet of a file or loads it if it wasn't prefetched.
+
+        Tests:
+            - Vorgeladenes Bild wird wiederverwendet
+            - Fehlende Dateien werfen einen FileNotFoundError
+
+        Args:
+            path (str): The path to the sprite sheet
+
+        Returns: The decoded sprite sheet
+        """
+
+        sheet = cls.sheets.pop(path, None)
+        if sheet is None:
+            cls.checkListed(path)
+            sheet = pygame.image.load(path)
+
+        return sheet
+
+    @classmethod
+    def checkListed(cls, key) -> None:
+        """
+        This method is called whenever an asset is loaded by a game instead of the Prefetcher and logs a warning if
+        the asset is missing in the manifest of every game, so it is never prefetched. Nothing is checked as long as
+        prefetching hasn't started, e.g. in headless runs.
+
+        Tests:
+            - Gelistete Assets erzeugen keine Warnung
+            - Ohne gestartetes Vorladen wird nichts geprüft
+
+        Args:
+            key: The path of a sheet or sound or the TextureCache key of an image
+
+        Returns: None
+        """
+
+        if cls.executor is not None and key not in cls.listed:
+            logger.warning("Asset {} is loaded without being listed in the ASSETS of its game", key)
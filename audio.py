@@ -0,0 +1,196 @@
+"""
+    file: audio.py
+    description: Contains the AudioManager playing the sounds of every game on a fixed pool of mixer channels. The
+    mixer is configured once with a small buffer for a low latency, repeated triggers of the same sound are coalesced.
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+from time import perf_counter
+
+import pygame
+from loguru import logger
+
+from config import Configuration
+
+
+class AudioManager:
+    """
+    A static class owning the channels of the mixer. Every sound is played on a channel of a pool allocated once. If
+    every channel is busy, a sound with a higher priority stops the oldest sound with the lowest priority, otherwise
+    it is dropped. A sound triggered again within Configuration.SOUND_COOLDOWN seconds isn't started a second time.
+
+    Tests:
+        - Gleicher Sound wird innerhalb der Sperrzeit nur einmal abgespielt
+        - Sounds mit höherer Priorität verdrängen Sounds mit niedrigerer
+    """
+
+    # Pool of channels and the priority and start time of the sound playing on each of them
+    channels = []
+    priorities = []
+    starts = []
+
+    # Time every sound was last started, keyed by the sound
+    lastPlayed = {}
+
+    played = 0
+    coalesced = 0  # Triggers within the cooldown of a sound
+    dropped = 0  # Sounds without a free channel
+    preempted = 0  # Sounds stopped for a sound with a higher priority
+
+    @staticmethod
+    def preInit() -> None:
+        """
+        This method sets the arguments of the mixer. It has to be called before pygame is initialized, which
+        initializes the mixer.
+
+        Tests:
+            - Puffergröße entspricht Configuration.AUDIO_BUFFER
+            - Wird vor pygame.init() aufgerufen
+
+        Returns: None
+        """
+
+        pygame.mixer.pre_init(
+            frequency=Configuration.AUDIO_FREQUENCY,
+            size=-16,
+            channels=2,
+            buffer=Configuration.AUDIO_BUFFER
+        )
+
+    @classmethod
+    def init(cls) -> None:
+        """
+        This method initializes the mixer, if pygame didn't already, and allocates the pool of channels. The channels
+        are reserved, so sounds played directly with Sound.play() can't take them.
+
+        Tests:
+            - Pool enthält Configuration.AUDIO_CHANNELS Kanäle
+            - Zähler werden nicht zurückgesetzt
+
+        Returns: None
+        """
+
+        pygame.mixer.init()
+
+        count = Configuration.AUDIO_CHANNELS
+        pygame.mixer.set_num_channels(count)
+        pygame.mixer.set_reserved(count)
+
+        cls.channels = [pygame.mixer.Channel(index) for index in range(count)]
+        cls.priorities = [0] * count
+        cls.starts = [0.0] * count
+        cls.lastPlayed.clear()
+
+        frequency, _, _ = pygame.mixer.get_init()
+        logger.debug(
+            "Mixer initialized with {} channels and a latency of {:.1f} ms",
+            count, Configuration.AUDIO_BUFFER / frequency * 1000
+        )
+
+    @classmethod
+    def play(cls, sound, volume=1.0, priority=0):
+        """
+        This method plays a sound on a channel of the pool.
+
+        Tests:
+            - Wiederholter Aufruf innerhalb der Sperrzeit wird zusammengefasst
+            - Ohne freien Kanal wird der Sound verworfen oder verdrängt einen mit niedrigerer Priorität
+
+        Args:
+            sound (pygame.mixer.Sound): The sound to play
+            volume (float): The volume of the sound. Ranges from 0.0 to 1.0, where 1.0 is the loudest
+            priority (int): Sounds with a higher priority, e.g. the end of a game, stop sounds with a lower one if
+                every channel is busy
+
+        Returns (pygame.mixer.Channel): The channel playing the sound or None if it wasn't played
+        """
+
+        if not cls.channels:
+            return None
+
+        now = perf_counter()
+
+        # The same sound was just started, e.g. by a check running every step
+        if now - cls.lastPlayed.get(sound, -Configuration.SOUND_COOLDOWN) < Configuration.SOUND_COOLDOWN:
+            cls.coalesced += 1
+            return None
+
+        index = cls.findChannel(priority)
+        if index is None:
+            cls.dropped += 1
+            return None
+
+        channel = cls.channels[index]
+        if channel.get_busy():
+            channel.stop()
+            cls.preempted += 1
+
+        # The volume is set on the channel, the sound is shared by every game
+        channel.play(sound)
+        channel.set_volume(volume)
+
+        cls.priorities[index] = priority
+        cls.starts[index] = now
+        cls.lastPlayed[sound] = now
+        cls.played += 1
+
+        return channel
+
+    @classmethod
+    def findChannel(cls, priority):
+        """
+        This method returns a free channel of the pool. If every channel is busy, the channel playing the oldest sound
+        with the lowest priority is returned if that priority is lower than the given one.
+
+        Tests:
+            - Freie Kanäle werden zuerst verwendet
+            - Kanäle mit gleicher oder höherer Priorität werden nie verdrängt
+
+        Args:
+            priority (int): The priority of the sound to play
+
+        Returns (int): The index of the channel or None if every channel is busy with a sound of the same or higher
+            priority
+        """
+
+        lowest = None
+        for index, channel in enumerate(cls.channels):
+            if not channel.get_busy():
+                return index
+
+            if lowest is None or (cls.priorities[index], cls.starts[index]) < lowest[0]:
+                lowest = ((cls.priorities[index], cls.starts[index]), index)
+
+        if lowest is not None and lowest[0][0] < priority:
+            return lowest[1]
+
+        return None
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        This method logs and returns the counters of the played sounds.
+
+        Tests:
+            - Alle Zähler sind enthalten
+            - Verworfene und zusammengefasste Sounds werden getrennt gezählt
+
+        Returns: A dict containing the number of played, coalesced, dropped and preempted sounds
+        """
+
+        stats = {
+            "played": cls.played,
+            "coalesced": cls.coalesced,
+            "dropped": cls.dropped,
+            "preempted": cls.preempted
+        }
+
+        logger.info(
+            "Audio: {played} sounds played, {coalesced} coalesced, {dropped} dropped, {preempted} preempted",
+            **stats
+        )
+
+        return stats
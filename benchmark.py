@@ -0,0 +1,489 @@
+"""
+    file: benchmark.py
+    description: Contains the benchmark suite. Every game is run headless with a frame drawn to the dummy display
+    after every step, scripted input and fixed seeds. The results are saved as JSON and compared against the checked-in
+    baseline benchmark_baseline.json, e.g.:
+    python benchmark.py --threshold p99=0.5
+    Only the deterministic metrics are compared by default, the frame times are printed for information.
+    python benchmark.py --update-baseline
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+import os
+# Hide pygame support message
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
+
+import json
+import math
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from time import perf_counter
+
+import pygame
+from loguru import logger
+
+from config import Configuration
+from engine import Engine
+from perf import FrameProfiler
+from util import runHeadless
+
+BASELINE = "benchmark_baseline.json"
+RESULTS = "cache/benchmark.json"
+
+# Allowed relative deviation from the baseline of the metrics compared by default. They only depend on the code and
+# the seed, so they are reproducible on the machine the baseline was measured on. Frames per second must not drop
+# below (1 - threshold) * baseline, every other metric must not exceed (1 + threshold) * baseline
+THRESHOLDS = {
+    "peakMemory": 0.1,
+    "allocatedPerFrame": 0.25,
+    "blocksPerFrame": 1.0
+}
+
+# Smallest deviation allowed in absolute numbers. The memory blocks are counted for the whole process, so background
+# threads like the log writer add a fraction of a block per frame, only a block left by every frame is a leak
+TOLERANCES = {
+    "blocksPerFrame": 0.5
+}
+
+# Metrics depending on the load of the machine. They are only compared if their threshold is given as a parameter,
+# the maximum frame time isn't compared at all, as a single pause of the garbage collector determines it
+TIMINGS = ["fps", "p50", "p99"]
+
+
+class ScriptedInput:
+    def __init__(self, script, trackMemory=False):
+        """
+        An event source feeding the events of a script to a game, frame by frame. It is called once at the start of
+        every frame, which is why it also measures the duration of the frames and, if enabled, their memory usage.
+
+        Tests:
+            - Script erhält fortlaufende Frame-Nummern
+            - Dauer jedes Frames wird gespeichert
+
+        Args:
+            script (callable): Returns the events of a frame, called with the number of the frame
+            trackMemory (bool): Specifies whether the memory allocated in every frame is measured with tracemalloc
+        """
+
+        self.script = script
+        self.trackMemory = trackMemory
+
+        self.frame = 0
+        self.frameStart = None
+        self.frameTimes = []
+
+        self.frameMemory = 0
+        self.peakMemory = 0
+        self.frameAllocations = []
+
+        # Memory blocks left allocated by every frame, only measured without tracemalloc, which would count the list
+        self.frameBlocks = 0
+        self.frameAllocatedBlocks = []
+
+    def getEvents(self, game) -> list:
+        """
+        This method finishes the measurement of the previous frame and returns the events of the next one.
+
+        Tests:
+            - Erster Aufruf misst keinen Frame
+            - Spitzenwert des Speichers wird pro Frame zurückgesetzt
+
+        Args:
+            game (util.Game): The game requesting the events
+
+        Returns: The events of the frame
+        """
+
+        now = perf_counter()
+        blocks = FrameProfiler.getAllocatedBlocks()
+        if self.frameStart is not None:
+            self.frameTimes.append(now - self.frameStart)
+            if not self.trackMemory:
+                self.frameAllocatedBlocks.append(max(blocks - self.frameBlocks, 0))
+
+        if self.trackMemory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.peakMemory = max(self.peakMemory, peak)
+            if self.frameStart is not None:
+                self.frameAllocations.append(peak - self.frameMemory)
+
+            # Measure the next frame on its own
+            tracemalloc.reset_peak()
+            self.frameMemory = current
+
+        events = self.script(self.frame)
+        self.frame += 1
+
+        # Measured after the bookkeeping above, which isn't part of the frame
+        self.frameBlocks = FrameProfiler.getAllocatedBlocks()
+        self.frameStart = perf_counter()
+
+        return events
+
+    def leave(self, game) -> None:
+        """
+        This method is called once the game has ended. The measurements are already complete.
+
+        Tests:
+            - Keine Änderung der Messwerte
+            - Aufruf ohne laufendes Spiel ohne Fehler
+
+        Args:
+            game (util.Game): The game that has ended
+
+        Returns: None
+        """
+
+        pass
+
+
+def keyEvent(eventType, key) -> pygame.event.Event:
+    """
+    This function creates a keyboard event.
+
+    Tests:
+        - Typ und Taste werden korrekt gesetzt
+        - Event wird von handleEvent der Spiele erkannt
+
+    Args:
+        eventType (int): pygame.KEYDOWN or pygame.KEYUP
+        key (int): The key, e.g. pygame.K_UP
+
+    Returns: The event
+    """
+
+    return pygame.event.Event(eventType, key=key, mod=0, unicode="", scancode=0)
+
+
+def snakeScript(frame) -> list:
+    """
+    This function steers the snake clockwise on a 4x4 square in the middle of the field, which keeps it alive.
+
+    Tests:
+        - Schlange biegt nach jeweils vier Schritten rechts ab
+        - Schlange berührt nie den Rand
+
+    Args:
+        frame (int): The number of the frame
+
+    Returns: The events of the frame
+    """
+
+    turn = 4 * Configuration.SNAKE_SPEED
+    if frame % turn == turn - 1:
+        keys = (pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP)
+        return [keyEvent(pygame.KEYDOWN, keys[(frame // turn) % 4])]
+
+    return []
+
+
+def pongScript(twoPlayers):
+    """
+    This function creates the script of Pong. The players move up and down alternately, every 45 frames.
+
+    Tests:
+        - Zweiter Spieler wird nur im Zweispielermodus gesteuert
+        - Gedrückte Tasten werden vor dem Richtungswechsel losgelassen
+
+    Args:
+        twoPlayers (bool): Specifies whether the second player is steered too
+
+    Returns (callable): The script
+    """
+
+    def script(frame) -> list:
+        if frame % 45 != 0:
+            return []
+
+        up = (frame // 45) % 2 == 0
+        events = [
+            keyEvent(pygame.KEYUP, pygame.K_d if up else pygame.K_a),
+            keyEvent(pygame.KEYDOWN, pygame.K_a if up else pygame.K_d)
+        ]
+        if twoPlayers:
+            events += [
+                keyEvent(pygame.KEYUP, pygame.K_LEFT if up else pygame.K_RIGHT),
+                keyEvent(pygame.KEYDOWN, pygame.K_RIGHT if up else pygame.K_LEFT)
+            ]
+
+        return events
+
+    return script
+
+
+def tttScript(frame) -> list:
+    """
+    This function moves the mouse in a circle over the field and clicks a field every 30 frames. The clicks result
+    in a draw, so every field is used.
+
+    Tests:
+        - Maus bewegt sich in jedem Frame
+        - Klicks ergeben ein Unentschieden
+
+    Args:
+        frame (int): The number of the frame
+
+    Returns: The events of the frame
+    """
+
+    centerX, centerY = Configuration.windowWidth // 2, Configuration.windowHeight // 2
+    angle = frame / 30
+    position = (int(centerX + math.cos(angle) * 300), int(centerY + math.sin(angle) * 300))
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=position, rel=(0, 0), buttons=(0, 0, 0))]
+
+    # Indices of the fields in the order they are clicked, X and O alternate
+    draw = (0, 4, 8, 1, 7, 6, 2, 5, 3)
+    if frame % 30 == 20 and frame // 30 < len(draw):
+        index = draw[frame // 30]
+        tileSize = Configuration.TTT_TILE_SIZE
+        fieldX = int(centerX - tileSize * 1.5 + tileSize // 2 + (index % 3) * tileSize)
+        fieldY = int(centerY - tileSize * 1.5 + tileSize // 2 + (index // 3) * tileSize)
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(fieldX, fieldY), button=1))
+
+    return events
+
+
+# Game, keyword arguments and script of every scenario
+SCENARIOS = {
+    "Snake": (Configuration.GAME_SNAKE, {}, snakeScript),
+    "Pong1P": (Configuration.GAME_PONG, {"hasComputerPlayer": True}, pongScript(False)),
+    "Pong2P": (Configuration.GAME_PONG, {"hasComputerPlayer": False}, pongScript(True)),
+    "TicTacToe": (Configuration.GAME_TTT, {}, tttScript)
+}
+
+
+def runScenario(name, frames, seed, trackMemory=False) -> ScriptedInput:
+    """
+    This function runs a single scenario headless with a frame drawn after every step.
+
+    Tests:
+        - Seed der Zufallsgeneratoren wird vor jedem Lauf gesetzt
+        - Event-Quelle wird danach wieder entfernt
+
+    Args:
+        name (str): The name of the scenario, a key of SCENARIOS
+        frames (int): The maximum number of frames
+        seed (int): The seed of the random generators of the game
+        trackMemory (bool): Specifies whether the memory is measured with tracemalloc
+
+    Returns: The event source containing the measurements
+    """
+
+    game, kwargs, script = SCENARIOS[name]
+
+    source = ScriptedInput(script, trackMemory)
+    Engine.seed = seed
+    Engine.eventSource = source
+
+    if trackMemory:
+        tracemalloc.start()
+
+    try:
+        runHeadless(game, frames, render=True, **kwargs)
+    finally:
+        Engine.seed = None
+        Engine.eventSource = None
+        if trackMemory:
+            tracemalloc.stop()
+
+    return source
+
+
+def benchmark(name, frames, seed) -> dict:
+    """
+    This function measures a scenario. The frame times are measured in a first run, the memory in a second run with
+    the same seed, as tracemalloc slows down every frame.
+
+    Tests:
+        - Alle Metriken sind enthalten
+        - Perzentile werden korrekt berechnet
+
+    Args:
+        name (str): The name of the scenario
+        frames (int): The maximum number of frames
+        seed (int): The seed of the random generators of the game
+
+    Returns: The frames, frames per second, p50, p99 and max frame time in ms, the peak memory in KiB, the memory
+        allocated per frame in KiB and the memory blocks left allocated per frame
+    """
+
+    timing = runScenario(name, frames, seed)
+    memory = runScenario(name, frames, seed, trackMemory=True)
+
+    frameTimes = sorted(timing.frameTimes)
+    count = len(frameTimes)
+    allocations = memory.frameAllocations
+
+    return {
+        "frames": count,
+        "fps": round(count / sum(frameTimes), 1),
+        "p50": round(frameTimes[int(0.5 * (count - 1))] * 1000, 3),
+        "p99": round(frameTimes[int(0.99 * (count - 1))] * 1000, 3),
+        "max": round(frameTimes[-1] * 1000, 3),
+        "peakMemory": round(memory.peakMemory / 1024, 1),
+        "allocatedPerFrame": round(sum(allocations) / len(allocations) / 1024, 3),
+        "blocksPerFrame": round(sum(timing.frameAllocatedBlocks) / count, 2)
+    }
+
+
+def compare(results, baseline, thresholds) -> list:
+    """
+    This function compares the results against the baseline.
+
+    Tests:
+        - Höherer Speicherverbrauch und weniger Frames pro Sekunde gelten als Verschlechterung
+        - Abweichungen innerhalb der absoluten Toleranz gelten nicht als Verschlechterung
+
+    Args:
+        results (dict[str, dict[str, float]]): The metrics of every scenario
+        baseline (dict[str, dict[str, float]]): The metrics of every scenario in the baseline
+        thresholds (dict[str, float]): The allowed relative deviation of every metric
+
+    Returns (list[str]): A description of every regression
+    """
+
+    regressions = []
+
+    for name, metrics in results.items():
+        if name not in baseline:
+            logger.warning("Scenario {} is missing in the baseline", name)
+            continue
+
+        for metric, threshold in thresholds.items():
+            # Metrics added after the baseline was saved
+            if metric not in baseline[name]:
+                continue
+
+            value = metrics[metric]
+            reference = baseline[name][metric]
+
+            deviation = max(reference * threshold, TOLERANCES.get(metric, 0))
+            if metric == "fps":
+                isRegression = value < reference - deviation
+            else:
+                isRegression = value > reference + deviation
+
+            if isRegression:
+                regressions.append(f"{name} {metric}: {value:.2f} (baseline {reference:.2f}, threshold {threshold})")
+
+    return regressions
+
+
+def main():
+    """
+    This function runs the benchmarks, saves the results and compares them against the baseline.
+    Exits with 1 if a metric regressed beyond its threshold. The frame times are only compared if their threshold is
+    given as a parameter, otherwise their deviation is printed for information.
+
+    Tests:
+        - Schwellwerte können per Parameter überschrieben werden
+        - Baseline wird nur auf Wunsch überschrieben
+    """
+
+    parser = ArgumentParser(description="Benchmarks of the games")
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run, all by default: {', '.join(SCENARIOS)}")
+    parser.add_argument("--frames", type=int, default=1200, help="Maximum number of frames of every scenario")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the random generators of the games")
+    parser.add_argument("--baseline", default=BASELINE, help="Path to the baseline")
+    parser.add_argument("--output", default=RESULTS, help="Path to save the results to")
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        metavar="METRIC=VALUE",
+        help=f"Overrides the allowed relative deviation of a metric, e.g. fps=0.3. {', '.join(TIMINGS)} are only "
+             f"compared if given"
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="Save the results as the new baseline")
+    args = parser.parse_args()
+
+    # Invalid thresholds are rejected before the benchmarks are run
+    overrides = {}
+    for override in args.threshold:
+        metric, _, value = override.partition("=")
+        if metric not in THRESHOLDS and metric not in TIMINGS:
+            parser.error(f"Unknown metric: {metric}")
+        try:
+            overrides[metric] = float(value)
+        except ValueError:
+            parser.error(f"Invalid threshold: {override}, expected METRIC=VALUE, e.g. p99=0.5")
+
+    scenarios = args.scenarios or list(SCENARIOS)
+    for name in scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"Unknown scenario: {name}")
+
+    # Only warnings, the games log every start and end
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    results = {}
+    for name in scenarios:
+        results[name] = benchmark(name, args.frames, args.seed)
+        print(
+            f"{name}: {results[name]['frames']} frames, {results[name]['fps']:.0f} FPS, "
+            f"p50 {results[name]['p50']:.2f} ms, p99 {results[name]['p99']:.2f} ms, max {results[name]['max']:.2f} ms, "
+            f"peak {results[name]['peakMemory']:.0f} KiB, {results[name]['allocatedPerFrame']:.1f} KiB per frame, "
+            f"{results[name]['blocksPerFrame']:.2f} blocks per frame"
+        )
+
+    report = {"frames": args.frames, "seed": args.seed, "results": results}
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=4)
+
+    # Thresholds: Defaults, overwritten by the baseline, overwritten by the parameters. Timings of the baseline are
+    # ignored, they are only compared on request
+    thresholds = dict(THRESHOLDS)
+    baseline = None
+    try:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        thresholds.update({
+            metric: value for metric, value in baseline.get("thresholds", {}).items() if metric in THRESHOLDS
+        })
+    except FileNotFoundError:
+        logger.warning("Baseline {} is missing", args.baseline)
+
+    thresholds.update(overrides)
+
+    if args.update_baseline:
+        # Thresholds of the timings only apply to the current run, they are never read from the baseline
+        report["thresholds"] = {metric: value for metric, value in thresholds.items() if metric in THRESHOLDS}
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=4)
+        print(f"Saved the baseline to {args.baseline}")
+        return
+
+    if baseline is None:
+        return
+
+    if (baseline["frames"], baseline["seed"]) != (args.frames, args.seed):
+        logger.warning("Baseline was measured with {} frames and seed {}", baseline["frames"], baseline["seed"])
+
+    for name, metrics in results.items():
+        reference = baseline["results"].get(name, {})
+        deviations = [
+            f"{metric} {(metrics[metric] / reference[metric] - 1) * 100:+.0f}%"
+            for metric in TIMINGS + ["max"] if metric not in thresholds and reference.get(metric)
+        ]
+        if deviations:
+            print(f"{name} timings compared to the baseline (not checked): {', '.join(deviations)}")
+
+    regressions = compare(results, baseline["results"], thresholds)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+
+    if regressions:
+        sys.exit(1)
+
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
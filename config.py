@@ -7,9 +7,48 @@
     licence: free
 """
 
-import pandas
-from pandas.errors import EmptyDataError
-from loguru import logger
+
+class ScoreData(dict):
+    def __init__(self, headers):
+        """
+        A dict containing the ScoreStore of each game. The scores of a game are read the first time they are
+        accessed. This keeps the startup fast.
+
+        Tests:
+            - Scores werden erst beim ersten Zugriff gelesen
+            - Unbekannte Spiele führen zu einem KeyError
+
+        Args:
+            headers (dict[str, list[str]]): The headers of the csv file of every game
+        """
+
+        super().__init__()
+
+        self.headers = headers
+
+    def __missing__(self, game):
+        """
+        This method is called by dict if the scores of a game are accessed, but weren't loaded yet.
+
+        Tests:
+            - Scores werden korrekt aus der CSV und dem Log gelesen
+            - Fehlende oder leere Dateien ergeben einen leeren ScoreStore
+
+        Args:
+            game (str): The name of the game
+
+        Returns (scores.ScoreStore): The scores of the game
+        """
+
+        if game not in self.headers:
+            raise KeyError(game)
+
+        from scores import ScoreStore
+
+        store = ScoreStore(game, self.headers[game])
+        self[game] = store
+
+        return store
 
 
 class Configuration:
@@ -18,7 +57,7 @@ class Configuration:
 
     Tests:
         - Variablen werden korrekt angelegt
-        - DataFrame wird korrekt aus der CSV gelesen
+        - Scores werden erst beim ersten Zugriff geladen
     """
 
     windowWidth, windowHeight = 1920, 1080
@@ -27,7 +66,40 @@ class Configuration:
     isFullscreen = False
 
     MUSIC_VOLUME = 0.1
-    FRAMERATE = 60
+    FRAMERATE = 60  # Maximum rendered frames per second, independent of the game speed
+    TICKRATE = 60  # Game logic steps per second
+    MAX_STEPS_PER_FRAME = 5  # Slow the game down instead of catching up endlessly on very slow machines
+    DIRTY_RECTS = True  # Only push the changed regions of the window to the display
+    IDLE_REDRAW = True  # Static screens, e.g. the menus, wait for input instead of drawing the same frame again
+    IDLE_TIMEOUT = 1.0  # Longest time in seconds a static screen waits before it is drawn again
+
+    # Assets
+    TEXTURE_CACHE_BUDGET = 64 * 1024 * 1024  # Maximum memory used by cached images in bytes
+    TEXT_CACHE_SIZE = 256  # Maximum number of cached rendered texts
+    FONT_INDEX = "cache/fonts.json"  # Resolved font files, saves scanning the system fonts on every start
+
+    # Audio
+    AUDIO_FREQUENCY = 44100
+    AUDIO_BUFFER = 512  # Samples per buffer of the mixer, smaller buffers play sounds with a lower latency
+    AUDIO_CHANNELS = 8  # Maximum number of sounds playing at the same time
+    SOUND_COOLDOWN = 0.1  # Triggers of the same sound within this time in seconds are coalesced
+
+    # Logging: Messages are written in batches by a background thread
+    LOG_FILE = "logs/{time}.log"
+    LOG_ROTATION = 1024 * 1024  # Size of a log file in bytes before it is compressed and a new one is started
+    LOG_FLUSH_INTERVAL = 0.5  # Seconds between two batches written to the log
+    LOG_QUEUE_SIZE = 10000  # Messages waiting to be written, newer ones are dropped if the disk can't keep up
+    LOG_FRAME_BUDGET = 20  # Messages per frame before messages below WARNING are sampled
+    LOG_SAMPLE_RATE = 10  # Only every n-th message of a call site is kept once the budget of a frame is used up
+
+    # Headless simulation: No window, no sound and no frame pacing
+    isHeadless = False
+    HEADLESS_STEPS = 10000  # Maximum number of steps of a headless run, 0 runs until the game quits itself
+    HEADLESS_RENDER = False  # Draw a frame after every step of a headless run, used by the benchmarks
+
+    # Recordings of the input of a game
+    REPLAY_DIRECTORY = "replays"
+    REPLAY_CHECKPOINT_INTERVAL = 60  # Steps between two checksums of the game state
     
     GAME_SNAKE = "Snake"
     GAME_TTT = "TicTacToe"
@@ -37,6 +109,9 @@ class Configuration:
     PLAYER_HEADER = "Player"
     SCORE_HEADER = "Score"
     WIN_HEADER = "Wins"
+    SCORE_DIRECTORY = "scores"
+    SCORE_COMPACT_INTERVAL = 100  # Results appended to the log of a game before its csv file is rewritten
+    LEADERBOARD_SIZE = 10  # Best scores shown in the highscore table
 
     DATA_HEADERS = {
         GAME_SNAKE: [PLAYER_HEADER, SCORE_HEADER],
@@ -44,34 +119,8 @@ class Configuration:
         GAME_PONG: [PLAYER_HEADER, SCORE_HEADER]
     }
 
-    # Create the score dict containing a dataframe for each game
-    SCORE_DATA = {}
-    for game in DATA_HEADERS.keys():
-        # Get the highest scores from the csv file
-        frame = None
-        try:
-            frame = pandas.read_csv(f"scores/{game}.csv")
-        except EmptyDataError:
-            logger.debug("CSV file for {} is empty", game)
-        except FileNotFoundError:
-            logger.critical("CSV file for {} is missing", game)
-        finally:
-            if frame is None:
-                # Create a new DataFrame
-                dataDict = {}
-                for header in DATA_HEADERS[game]:
-                    dataDict.update({
-                        header: []
-                    })
-
-                frame = pandas.DataFrame(data=dataDict)
-
-                #  logging
-                logger.info("New Dataframe for {} has been created.", game)
-
-        SCORE_DATA.update({
-            game: frame
-        })
+    # Create the score dict containing a ScoreStore for each game, loaded on first access
+    SCORE_DATA = ScoreData(DATA_HEADERS)
 
     # Needed for dynamic table updates
     UPDATE_GAME_SCORE = ""
@@ -83,9 +132,30 @@ class Configuration:
     SNAKE_SPEED = 15
     SNAKE_FOOD = ["apple", "cherry", "pear", "strawberry"]
 
+    # Sprite sheet of the snake, cells are facing upwards
+    SNAKE_ATLAS = "images/Snake/snake-graphics.png"
+    SNAKE_ATLAS_CELL_SIZE = 64
+    SNAKE_ATLAS_MANIFEST = {
+        "head": (3, 0),
+        "body": (2, 1),
+        "tail": (3, 2),
+        "corner": (0, 0)
+    }
+
     # TicTacToe
     TTT_TILE_SIZE = 250
 
+    # Prefetching: The assets of every game are decoded in the background while the menu is idle
+    PREFETCH_WORKERS = 2
+    PREFETCH_FINALIZE_PER_FRAME = 1  # Surfaces converted per menu frame, conversion has to happen on the main thread
+
+    # Class of every game, its module is imported in the background. The assets are read from the ASSETS of the class
+    PREFETCH_GAMES = {
+        GAME_SNAKE: "games.Snake.Snake",
+        GAME_TTT: "games.TicTacToe.TicTacToe",
+        GAME_PONG: "games.Pong.Pong"
+    }
+
 
 class Colors:
     """
@@ -0,0 +1,448 @@
+"""
+    file: engine.py
+    description: Contains the Engine, the context shared by every game. It owns the display, mixer, fonts and the
+    pause menu, which are created once instead of on every game launch, and the stack of scenes run by the main loop.
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+import os
+from time import perf_counter
+
+import pygame
+from loguru import logger
+
+from audio import AudioManager
+from config import Configuration
+from logpipeline import LogPipeline
+from perf import Startup, IdleMonitor
+
+
+class Scene:
+    """
+    A screen of the application on the scene stack of the Engine, e.g. the menu, a game, the pause menu or the name
+    input. The main loop only runs the scene on top of the stack, the scenes below are suspended and resumed later
+    without being created again.
+
+    Tests:
+        - Nur die oberste Szene wird aktualisiert
+        - Pausierte Szenen behalten ihren Zustand
+    """
+
+    # Name of the game shown in the title of the window, empty for the menu
+    game = ""
+
+    def frame(self) -> None:
+        """
+        This method updates and draws a single frame of the scene. It is called by the main loop of the Engine while
+        the scene is on top of the stack. Overwrite this method in your class!
+
+        Tests:
+            - Wird genau einmal pro Frame aufgerufen
+            - Szene verlässt den Stapel selbst mit Engine.leave()
+
+        Returns: None
+        """
+
+        pass
+
+    def getIdleTimeout(self):
+        """
+        This method is called by the main loop after every frame. A static scene, which would draw the same frame
+        again, returns how long the loop may wait for the next event before the next frame. Scenes that are animated
+        return None to be drawn continuously.
+
+        Tests:
+            - Animierte Szenen werden ohne Wartezeit gezeichnet
+            - Wartezeit endet vor der nächsten Änderung der Szene
+
+        Returns (float): The time to wait for an event in seconds or None to draw the next frame right away
+        """
+
+        return None
+
+    def getScreenName(self) -> str:
+        """
+        This method returns the name of the scene in reports, e.g. of the IdleMonitor.
+
+        Tests:
+            - Spiele werden nach ihrem Namen benannt
+            - Menü wird als "Menu" benannt
+
+        Returns: The name of the scene
+        """
+
+        return self.game or "Menu"
+
+    def suspend(self) -> None:
+        """
+        This method is called once another scene is entered on top of this one.
+
+        Tests:
+            - Wird beim Betreten einer neuen Szene aufgerufen
+            - Zustand der Szene bleibt erhalten
+
+        Returns: None
+        """
+
+    def resume(self) -> None:
+        """
+        This method is called once the scene is on top of the stack again.
+
+        Tests:
+            - Wird nach dem Verlassen der oberen Szene aufgerufen
+            - Szene wird nicht neu erstellt
+
+        Returns: None
+        """
+
+
+class Engine:
+    """
+    A static class initializing pygame once and handing the display to every scene. The scenes are kept on a stack
+    run by a single main loop, the scene on top is the active one receiving the callbacks of the shared pause menu.
+
+    Tests:
+        - Pygame und das Fenster werden nur einmal initialisiert
+        - Die aktive Szene ist immer die zuletzt betretene
+    """
+
+    surface = None
+    pauseMenu = None
+    scenes = []
+    isRunning = False
+
+    # Replaces the events of the window if set. Needs the methods getEvents(game), returning a list of events, and
+    # leave(game), called once a game has ended. Static scenes only wait for the events of the window if the source
+    # reads them through Engine.getEvents() and sets isLive to True
+    eventSource = None
+
+    # Events read while the main loop waited for input, returned first by the next call of getEvents()
+    pendingEvents = []
+
+    # Seed of the random generators of every game, a new one is drawn for every game if None
+    seed = None
+
+    # Time from entering a game until its first frame was drawn
+    switchStart = 0.0
+    switchLatencies = {}
+
+    @classmethod
+    def init(cls, windowSize) -> None:
+        """
+        This method initializes pygame, the display, the mixer and the fonts. It is called by the first game entering
+        the engine.
+
+        Tests:
+            - Fenster wird mit der richtigen Größe erstellt
+            - Headless werden die Dummy-Treiber von SDL verwendet
+
+        Args:
+            windowSize (tuple[int, int]): The size of the pygame window
+
+        Returns: None
+        """
+
+        start = perf_counter()
+
+        # Use the SDL dummy drivers to run without a window and sound device
+        if Configuration.isHeadless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        # The mixer is initialized by pygame.init() and uses a small buffer for a low latency
+        AudioManager.preInit()
+        pygame.init()
+
+        # Display
+        if Configuration.isFullscreen:
+            cls.surface = pygame.display.set_mode(size=windowSize, flags=pygame.FULLSCREEN)
+        else:
+            cls.surface = pygame.display.set_mode(size=windowSize)
+
+        # Channels of the sounds and fonts
+        AudioManager.init()
+        pygame.font.init()
+
+        logger.info("Engine initialized in {:.0f} ms", (perf_counter() - start) * 1000)
+
+    @classmethod
+    def enter(cls, scene) -> pygame.surface.Surface:
+        """
+        This method pushes the given scene on the stack, making it the active one, and returns the display it draws
+        on. The previous scene is suspended.
+
+        Tests:
+            - Szene liegt danach oben auf dem Stapel
+            - Titel des Fensters wird angepasst
+
+        Args:
+            scene (Scene): The scene that is entered, e.g. a game that is launched
+
+        Returns: The surface of the pygame window
+        """
+
+        cls.switchStart = perf_counter()
+
+        if cls.surface is None:
+            cls.init(getattr(scene, "windowSize", Configuration.windowSize))
+
+        previous = cls.getActiveScene()
+        if previous is not None:
+            previous.suspend()
+
+        cls.scenes.append(scene)
+        cls.setCaption(scene.game)
+
+        return cls.surface
+
+    @classmethod
+    def leave(cls, scene) -> None:
+        """
+        This method removes a finished scene from the stack. The previous scene, usually the menu, is resumed.
+
+        Tests:
+            - Szene wird vom Stapel entfernt
+            - Vorherige Szene wird fortgesetzt und misst die Wechselzeit erneut
+
+        Args:
+            scene (Scene): The scene that has ended
+
+        Returns: None
+        """
+
+        if cls.eventSource is not None:
+            cls.eventSource.leave(scene)
+
+        if scene in cls.scenes:
+            cls.scenes.remove(scene)
+
+        previous = cls.getActiveScene()
+        if previous is not None:
+            cls.switchStart = perf_counter()
+            cls.setCaption(previous.game)
+
+            previous.resume()
+
+    @classmethod
+    def run(cls) -> None:
+        """
+        This method is the main loop of the application. It runs a frame of the scene on top of the stack until every
+        scene has left it. Scenes entered while the loop is already running are simply run by it, no scene has its
+        own loop.
+
+        Tests:
+            - Schleife läuft nur einmal gleichzeitig
+            - Pygame wird beendet, sobald der Stapel leer ist
+
+        Returns: None
+        """
+
+        if cls.isRunning:
+            return
+
+        cls.isRunning = True
+        try:
+            while cls.scenes:
+                scene = cls.scenes[-1]
+                start = IdleMonitor.getTimes()
+
+                scene.frame()
+
+                # Static scenes wait for the next event instead of drawing the same frame again
+                idle = 0.0
+                if scene is cls.getActiveScene() and cls.canWait():
+                    timeout = scene.getIdleTimeout()
+                    if timeout is not None:
+                        idle = cls.waitForEvent(timeout)
+
+                IdleMonitor.record(scene.getScreenName(), start, idle)
+                LogPipeline.nextFrame()
+        finally:
+            cls.isRunning = False
+
+        IdleMonitor.report()
+        LogPipeline.report()
+
+        pygame.quit()
+        cls.surface = cls.pauseMenu = None
+
+    @classmethod
+    def canWait(cls) -> bool:
+        """
+        This method checks whether the main loop may wait for the events of the window.
+
+        Tests:
+            - Aufgezeichnete Eingaben erlauben das Warten
+            - Skriptgesteuerte Eingaben werden nie blockiert
+
+        Returns: Whether waiting is enabled and the events are read from the window
+        """
+
+        return Configuration.IDLE_REDRAW and (cls.eventSource is None or getattr(cls.eventSource, "isLive", False))
+
+    @classmethod
+    def waitForEvent(cls, timeout) -> float:
+        """
+        This method blocks until an event arrives or the timeout has passed. The events are kept for the next call of
+        getEvents(). Events that were blocked with pygame.event.set_blocked() don't wake the loop.
+
+        Tests:
+            - Wartet nicht, wenn bereits Events anstehen
+            - Events gehen nicht verloren und behalten ihre Reihenfolge
+
+        Args:
+            timeout (float): The longest time to wait in seconds, capped at Configuration.IDLE_TIMEOUT
+
+        Returns: The waited time in seconds
+        """
+
+        timeout = int(min(timeout, Configuration.IDLE_TIMEOUT) * 1000)
+
+        # A timeout of 0 would wait forever
+        if timeout <= 0 or cls.pendingEvents:
+            return 0.0
+
+        # Events that arrived during the frame are read instead of peeked at, pygame.event.peek() drops the attributes
+        # of posted events
+        cls.pendingEvents = pygame.event.get()
+        if cls.pendingEvents:
+            return 0.0
+
+        start = perf_counter()
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            cls.pendingEvents.append(event)
+
+        return perf_counter() - start
+
+    @classmethod
+    def getEvents(cls) -> list:
+        """
+        This method returns the events of the window, starting with the events read while the main loop waited.
+
+        Tests:
+            - Events des Wartens stehen an erster Stelle
+            - Jedes Event wird nur einmal zurückgegeben
+
+        Returns: The events since the last call
+        """
+
+        events = pygame.event.get()
+
+        if cls.pendingEvents:
+            events[:0] = cls.pendingEvents
+            cls.pendingEvents = []
+
+        return events
+
+    @classmethod
+    def getActiveScene(cls):
+        """
+        This method returns the scene on top of the stack.
+
+        Tests:
+            - Zuletzt betretene Szene wird zurückgegeben
+            - Leerer Stapel gibt None zurück
+
+        Returns (Scene): The active scene or None if no scene is running
+        """
+
+        if cls.scenes:
+            return cls.scenes[-1]
+
+        return None
+
+    @classmethod
+    def getSeed(cls) -> int:
+        """
+        This method returns the seed of the random generators of a new game.
+
+        Tests:
+            - Fester Seed wird unverändert zurückgegeben
+            - Ohne festen Seed erhält jedes Spiel einen neuen
+
+        Returns: The fixed seed or a new random one
+        """
+
+        if cls.seed is not None:
+            return cls.seed
+
+        return int.from_bytes(os.urandom(4), "little")
+
+    @classmethod
+    def markFirstFrame(cls, game) -> float:
+        """
+        This method is called once a game drew its first frame after it has been entered and logs the switch latency.
+
+        Tests:
+            - Wechselzeit wird pro Spiel gespeichert
+            - Startbericht wird nur beim ersten Frame der Applikation geloggt
+
+        Args:
+            game (util.Game): The game that drew the frame
+
+        Returns: The switch latency in seconds
+        """
+
+        latency = perf_counter() - cls.switchStart
+        name = game.game or "Menu"
+
+        cls.switchLatencies[name] = latency
+        logger.info("Switched to {} in {:.1f} ms", name, latency * 1000)
+
+        Startup.markFirstFrame()
+
+        return latency
+
+    @classmethod
+    def getPauseMenu(cls):
+        """
+        This method returns the pause menu shared by every game. It is created on the first call to not load
+        pygame_menu before it is needed. The buttons call togglePause() and quit() of the active scene, which is the
+        pause scene passing them on to the paused game.
+
+        Tests:
+            - Menü wird nur einmal erstellt
+            - Buttons rufen die Methoden der aktiven Szene auf
+
+        Returns (pygame_menu.Menu): The pause menu
+        """
+
+        if cls.pauseMenu is None:
+            with Startup.measureImport("pygame_menu"):
+                import pygame_menu
+
+            width, height = cls.surface.get_size()
+            cls.pauseMenu = pygame_menu.Menu(
+                title="Spiel pausiert",
+                width=width / 2,
+                height=height / 2,
+                theme=pygame_menu.themes.THEME_DARK  # title_close_button=False
+            )
+            cls.pauseMenu.add.button("Resume Playing", lambda: cls.getActiveScene().togglePause())
+            cls.pauseMenu.add.button("Quit", lambda: cls.getActiveScene().quit())
+
+        return cls.pauseMenu
+
+    @staticmethod
+    def setCaption(game) -> None:
+        """
+        This method sets the title of the window to the name of the given game.
+
+        Tests:
+            - Titel enthält den Namen des Spiels
+            - Menü verwendet den Standardtitel
+
+        Args:
+            game (str): The name of the game, empty for the menu
+
+        Returns: None
+        """
+
+        title = Configuration.windowTitle
+        if game != "":
+            title += f" | {game}"
+        pygame.display.set_caption(title)
@@ -12,11 +12,10 @@
 import pygame
 
 from util import Game, Image
+from assets import FontRegistry, Prefetcher
 from config import Configuration
 from random import randint
 import numpy as np
-from time import time
-from time import sleep
 from config import Colors
 from loguru import logger
 
@@ -45,16 +44,36 @@ class Pong(Game):
         - game initializes with/ without a computer player based on "hasComputerPlayer"
     """
 
+    ASSETS = {
+        "images": {
+            "endscreen": ("images/Pong/PongEndscreen.png", Configuration.windowSize, None),
+            "logo": ("images/Pong/PongLogo.png", (750, 120), (0, 0, 0)),
+            "controlsOne": ("images/Pong/AandD.png", (300, 100), (0, 0, 0)),
+            "controlsTwo": ("images/Pong/ArrowLeftRight.png", (300, 100), (0, 0, 0)),
+            "spacer": ("images/Pong/spacer.png", (10, 30), (0, 0, 0)),
+            "player": ("images/Pong/plane.png", (20, 150), (0, 0, 0)),
+            "ball": ("images/Pong/ballbyte.png", (30, 30), (0, 0, 0))
+        },
+        "sounds": {
+            "wall_collision": "sounds/Pong/wall_collision.wav",
+            "player_collision": "sounds/Pong/player_collision.wav",
+            "fail": "sounds/Pong/fail.wav"
+        }
+    }
+
     def __init__(self, hasComputerPlayer):
         super().__init__(game=Configuration.GAME_PONG)
 
+        # numpy is seeded as well, so a recording of the game can be replayed exactly
+        np.random.seed(self.seed)
+
         self.hasComputerPlayer = hasComputerPlayer  # determines, if player two should be a computer player
 
         # deactivate the internal scoring system of the gaming to use an own scoring system
         self.hasScore = False
         self.showGameOver = True
 
-        self.font = pygame.font.SysFont("arial", 78)  # initialize the game font
+        self.font = FontRegistry.get("arial", 78)  # initialize the game font
 
         # Player Setup
         self.player_one = Player(100, 50)
@@ -63,9 +82,12 @@ class Pong(Game):
         # Ball Setup
         self.ball = Ball(Configuration.windowWidth / 2, Configuration.windowHeight / 2)
 
+        # draw players and ball smoothly between two game steps
+        self.addInterpolatedImages(self.player_one, self.player_two, self.ball)
+
         # counter
         self._score = [0, 0]
-        self.startTime = time()  # time of the game start --> is used to calculate a score
+        self.scoreLabels = ["0000", "0000"]  # byte representation of the scores, only updated if a player scores
 
         # calculate the number of spacers by windowheight
         number_of_spacers = Configuration.windowHeight // 40
@@ -73,78 +95,129 @@ class Pong(Game):
         self.spacers = list()
         for i in range(number_of_spacers):
             # image was edited on my own
-            self.spacers.append(
-                Image(Configuration.windowWidth / 2, 40 * i, (10, 30), "spacer.png", pathToImage="images/Pong/"))
+            self.spacers.append(Image.fromAsset(Configuration.windowWidth / 2, 40 * i, self.ASSETS["images"]["spacer"]))
 
         # load sounds
         try:
             self.sounds = {
-                "wall_collision": pygame.mixer.Sound("sounds/Pong/wall_collision.wav"),
-                "player_collision": pygame.mixer.Sound("sounds/Pong/player_collision.wav"),
-                "fail": pygame.mixer.Sound("sounds/Pong/fail.wav")
+                name: Prefetcher.getSound(path) for name, path in self.ASSETS["sounds"].items()
             }
         except():
             logger.critical("Pong Sounds could not be loaded")
 
         # set gameover screen settings
         # load endscreen image
-        self.nameBackground = Image(
-            x=0,
-            y=0,
-            size=Configuration.windowSize,
-            pathToImage="images/Pong/",
-            image="PongEndscreen.png",
-            hasColorkey=False
-        )
+        self.nameBackground = Image.fromAsset(0, 0, self.ASSETS["images"]["endscreen"])
+
+        # player one moves with the A and D keys, player two with the arrow keys if it is no computer player
+        self.bindPlayer(self.player_one, pygame.K_a, pygame.K_d)
+        if not self.hasComputerPlayer:
+            self.bindPlayer(self.player_two, pygame.K_LEFT, pygame.K_RIGHT)
 
-        # render the pregame animation screen
-        self.preGameScreen()
+        # show the pregame screen for four seconds before the ball starts moving. It is part of the game time in every
+        # run, so a recording of a windowed game is replayed headless exactly
+        self.isPreGame = True
+        self.schedule(4, self.endPreGameScreen)
+        self.loadPreGameScreen()
+
+        # the pregame screen never changes, it is drawn once onto the background until it has ended
+        self.addStaticLayer(self.preGameScreen)
 
         # start the gameloop
         self.run()
 
-    def preGameScreen(self) -> None:
+    def loadPreGameScreen(self) -> None:
         """
-        This function loads the pregame animation and renders it on the screen.
+        This function loads the images of the pregame screen.
 
         Return:
             None
 
         Tests:
-            - The pregame screen is displayed correctly
-            - all textures are on their correct positions
+            - all textures of the pregame screen are loaded
+            - the controls of player two are only loaded, if he isn´t a computer player
         """
 
-        # load all images
         # created with: https://de.flamingtext.com/Free-Logo-Designs/
-        logo = Image(Configuration.windowWidth / 2 - 750 / 2, Configuration.windowHeight / 4 - 120 / 2, (750, 120),
-                     "PongLogo.png", pathToImage="images/Pong/")
-        keys_player_one = Image(Configuration.windowWidth / 4 - 150, Configuration.windowHeight * 3 / 4 - 50,
-                                (300, 100),
-                                "AandD.png", pathToImage="images/Pong/")
-        keys_player_two = Image(Configuration.windowWidth * 3 / 4 - 150, Configuration.windowHeight * 3 / 4 - 50,
-                                (300, 100),
-                                "ArrowLeftRight.png", pathToImage="images/Pong/")
+        self.preGameImages = [
+            Image.fromAsset(Configuration.windowWidth / 2 - 750 / 2, Configuration.windowHeight / 4 - 120 / 2,
+                            self.ASSETS["images"]["logo"]),
+            Image.fromAsset(Configuration.windowWidth / 4 - 150, Configuration.windowHeight * 3 / 4 - 50,
+                            self.ASSETS["images"]["controlsOne"])
+        ]
+        if not self.hasComputerPlayer:  # only draw the control of the second player, if he isn´t a computer player
+            self.preGameImages.append(
+                Image.fromAsset(Configuration.windowWidth * 3 / 4 - 150, Configuration.windowHeight * 3 / 4 - 50,
+                                self.ASSETS["images"]["controlsTwo"])
+            )
+
+        logger.info("Displaying prescreen animation")
+
+    def preGameScreen(self, surface) -> None:
+        """
+        This function renders the pregame screen. It is a static layer of the background until endPreGameScreen() is
+        called.
+
+        Args:
+            surface(pygame.surface.Surface): the surface of the background
+
+        Return:
+            None
+
+        Tests:
+            - The pregame screen is displayed correctly
+            - all textures are on their correct positions
+        """
 
         # draw text and images
-        self.surface.fill(Colors.Black)
-        self.drawImageOnSurface(logo)
-        self.drawImageOnSurface(keys_player_one)
-        if not self.hasComputerPlayer:  # only draw the control of the second player, if he isn´t a computer player
-            self.drawImageOnSurface(keys_player_two)
+        for image in self.preGameImages:
+            self.drawImageOnSurface(image, surface=surface)
         self.drawTextOnSurface("First player that reaches 1000 points wins!",
                                (Configuration.windowWidth / 2, Configuration.windowHeight / 2), Colors.ByteGreen,
-                               font=self.font)
+                               font=self.font, surface=surface)
 
         self.drawTextOnSurface("Controls",
                                (Configuration.windowWidth / 2, Configuration.windowHeight * 3 / 4), Colors.ByteGreen,
-                               font=self.font)
+                               font=self.font, surface=surface)
+
+    def drawSpacers(self, surface) -> None:
+        """
+        This function draws the spacers in the middle of the game. They never move, so they are a static layer of the
+        background once the pregame screen has ended.
 
-        super().updateScreen()  # display images on screen
+        Args:
+            surface(pygame.surface.Surface): the surface of the background
 
-        logger.info("Displaying prescreen animation")
+        Return:
+            None
+
+        Tests:
+            - all spacers are drawn in the middle of the window
+            - the spacers are not drawn on the pregame screen
+        """
+
+        for image in self.spacers:
+            self.drawImageOnSurface(image, surface=surface)
+
+    def endPreGameScreen(self) -> None:
+        """
+        This function ends the pregame screen and starts the game. It is called by the scheduler four seconds after
+        the game has been started.
+
+        Return:
+            None
+
+        Tests:
+            - the ball starts moving afterwards
+            - the pregame screen is replaced by the spacers in the background
+        """
 
-        sleep(4)  # wait for seconds
+        self.isPreGame = False
+        self.preGameImages = []
+
+        # replace the pregame screen in the background, this updates the whole window
+        self.removeStaticLayer(self.preGameScreen)
+        self.addStaticLayer(self.drawSpacers)
 
     def startGameOverScreen(self, player: int) -> None:
         """
@@ -162,10 +235,9 @@ class Pong(Game):
             - The gameOver Screen is started
         """
 
-        # calculate the score of the player based on the time it took to win
-        endTime = time()
+        # calculate the score of the player based on the game time it took to win
         score = int(
-            10000 // (endTime - self.startTime))  # the faster a player wins, the more points he gets
+            10000 // self.getGameTime())  # the faster a player wins, the more points he gets
 
         # generate gameover text
         self.setGameOverText(f"Player {player} has won! Score: {score}")
@@ -193,65 +265,70 @@ class Pong(Game):
         elif player == 2:
             self._score[1] += 1
 
+        # format the scores in byte representation
+        self.scoreLabels = [format(score, "04b") for score in self._score]
+
         # logging
         logger.info("Player {winner} has scored a goal. Score: {score}", winner=player, score=str(self._score))
 
-    def handleEvent(self, event) -> None:
+    def getState(self) -> tuple:
+        """
+        This function returns the state of the game, which is compared when a recording is replayed.
+
+        Return:
+            tuple: The state of the parent class, the score, the position and velocity of the ball and the positions
+            of both players
+
+        Tests:
+            - the state changes once the ball moves
+            - the same recording always results in the same state
+        """
+
+        return super().getState() + (
+            tuple(self._score),
+            self.ball.getX(),
+            self.ball.getY(),
+            tuple(int(velocity) for velocity in self.ball.speed),
+            self.player_one.getY(),
+            self.player_two.getY()
+        )
+
+    def getOptions(self) -> dict:
+        """
+        This function returns the arguments needed to construct the game again.
+
+        Return:
+            dict: Whether player two is a computer player
+
+        Tests:
+            - the computer player is part of the options
+            - the game can be constructed with the options
+        """
+
+        return {"hasComputerPlayer": self.hasComputerPlayer}
+
+    def bindPlayer(self, player, upKey, downKey) -> None:
         """
-        This function overrides the handleEvent function of it´s parent class. It handles all keyboard events
-        that are necessary for updating the players movement and sets their movement flags accordingly.
+        This function binds the keys of a player to its movement flags. Pressing a key sets the flag, releasing it
+        clears the flag again.
 
         Args:
-            event (pygame.event.Event): The to be handled event
+            player (Player): The player controlled by the keys
+            upKey (int): The pygame key moving the player up
+            downKey (int): The pygame key moving the player down
 
         Return:
             None
 
         Tests:
-            - The A and D keys set move_up and move down for player one
-            - The Arrow_left and Arrow_right keys set move_up and move down for player two
-            - The Arrow_left and Arrow_right keys do not work if player two is a computer player
-        """
-
-        # event handling
-        # Handle keydown events and sets movements flags accordingly
-        if event.type == pygame.KEYDOWN:
-
-            # player_one
-            # Move up with A Key
-            if event.key == pygame.K_a:
-                self.player_one.move_up = True
-            # Move down with D Key
-            if event.key == pygame.K_d:
-                self.player_one.move_down = True
-
-            # player_two, allow movements only, if player two is no computer player
-            if not self.hasComputerPlayer:
-                # move up with left arrow key
-                if event.key == pygame.K_LEFT:
-                    self.player_two.move_up = True
-                # Move down with right arrow key
-                if event.key == pygame.K_RIGHT:
-                    self.player_two.move_down = True
-
-        # Handle keyup events
-        elif event.type == pygame.KEYUP:
-            # player one movement
-            # Stop moving up
-            if event.key == pygame.K_a:
-                self.player_one.move_up = False
-            # Stop moving down
-            if event.key == pygame.K_d:
-                self.player_one.move_down = False
-
-            # player_two, allow movements only, if player two is no computer player
-            if not self.hasComputerPlayer:
-                # Stop moving up
-                if event.key == pygame.K_LEFT:
-                    self.player_two.move_up = False
-                    # Stop moving down
-                if event.key == pygame.K_RIGHT:
-                    self.player_two.move_down = False
+            - Pressing the keys sets move_up and move_down of the player
+            - Releasing the keys stops the movement of the player
+        """
+
+        self.bind(pygame.KEYDOWN, lambda event: setattr(player, "move_up", True), upKey)
+        self.bind(pygame.KEYDOWN, lambda event: setattr(player, "move_down", True), downKey)
+        self.bind(pygame.KEYUP, lambda event: setattr(player, "move_up", False), upKey)
+        self.bind(pygame.KEYUP, lambda event: setattr(player, "move_down", False), downKey)
 
     def updateGameState(self) -> None:
         """
@@ -267,6 +344,10 @@ class Pong(Game):
             - scoring a goal resets the balls velocity
         """
 
+        # nothing moves while the pregame screen is shown
+        if self.isPreGame:
+            return
+
         # movement updates of players and ball
         self.ball.move()
         self.player_one.move()
@@ -277,7 +358,7 @@ class Pong(Game):
 
         # collision handling of the ball
         if self.ball.didCollideWithPlayer(self.player_one) or self.ball.didCollideWithPlayer(self.player_two):
-            if self.ball.flip_velocity(mode="x"):  # flip velocity vector on x-axis
+            if self.ball.flip_velocity(self.getGameTime(), mode="x"):  # flip velocity vector on x-axis
                 self.playSound("player_collision", 0.6)
 
             # change the sensitivity and speed of the computer player every bounce to make the game more interesting
@@ -285,14 +366,14 @@ class Pong(Game):
                 self.player_two.setRandomSensitivitySpeed()
 
         if self.ball.did_collide_top_bottom():
-            self.ball.flip_velocity(mode="y")  # flip velocity vector on y-axis
+            self.ball.flip_velocity(self.getGameTime(), mode="y")  # flip velocity vector on y-axis
             self.playSound("wall_collision")
 
         # determine winner of the round
         round_winner = self.ball.determine_round_winner()
         if round_winner:
 
-            self.playSound("fail", 0.3)
+            self.playSound("fail", 0.3, priority=1)
 
             if round_winner == 1:
                 # increase player one score
@@ -311,8 +392,8 @@ class Pong(Game):
 
     def updateScreen(self) -> None:
         """
-        This method updates the pygame window by drawing object. Here it draws the ball and the player,
-        as well as the spacers in the middle of the game and the score counters
+        This method updates the pygame window by drawing object. Here it draws the ball and the player
+        and the score counters. The spacers in the middle of the game are part of the background
 
         Return:
             None
@@ -322,23 +403,21 @@ class Pong(Game):
             - The score counter is updating after each goal
         """
 
-        # fill game display black
-        self.surface.fill(Colors.Black)
+        # the pregame screen in the background replaces the game until it has ended
+        if self.isPreGame:
+            super().updateScreen()
+            return
 
         # draw players and ball
         self.drawImageOnSurface(self.player_one)
         self.drawImageOnSurface(self.player_two)
         self.drawImageOnSurface(self.ball)
 
-        # draw all the spacer images
-        for image in self.spacers:
-            self.drawImageOnSurface(image)
-
-        # draw scores and format the scores in byte representation
-        self.drawTextOnSurface(format(self._score[0], "04b"),
+        # draw scores, their rendered text is cached until the score changes
+        self.drawTextOnSurface(self.scoreLabels[0],
                                (Configuration.windowWidth / 4, Configuration.windowHeight / 2), Colors.ByteGreen,
                                font=self.font)
-        self.drawTextOnSurface(format(self._score[1], "04b"),
+        self.drawTextOnSurface(self.scoreLabels[1],
                                (3 * Configuration.windowWidth / 4, Configuration.windowHeight / 2), Colors.ByteGreen,
                                font=self.font)
 
@@ -357,12 +436,14 @@ class Player(Image):
         - The image of the player is loaded
     """
 
+    __slots__ = ("player_size", "move_up", "move_down", "speed", "sensitivity")
+
     def __init__(self, x, y):
-        self.player_size = (20, 150)
+        path, self.player_size, colorkey = Pong.ASSETS["images"]["player"]
 
         # image from: https://www.bienenfisch-design.de/produkt/bits-and-bytes/
         # and edited
-        super().__init__(x, y, self.player_size, "plane.png", pathToImage="images/Pong/")
+        super().__init__(x, y, self.player_size, path, pathToImage="", colorkey=colorkey)
 
         # movement flags --> These determine in which direction the player is moved,
         # when move() is called
@@ -485,17 +566,20 @@ class Ball(Image):
         - the image of the ball is loaded
     """
 
+    __slots__ = ("ball_size", "speed", "lastFlip")
+
     def __init__(self, x, y):
-        self.ball_size = (30, 30)
+        path, self.ball_size, colorkey = Pong.ASSETS["images"]["ball"]
         # image was edited on my own
-        super().__init__(x, y, self.ball_size, "ballbyte.png", pathToImage="images/Pong/")
+        super().__init__(x, y, self.ball_size, path, pathToImage="", colorkey=colorkey)
 
-        # speed
-        self.speed = self.getRandomVelocity()
+        # speed, the list is updated in place
+        self.speed = [0, 0]
+        self.setRandomVelocity()
 
-        # time since last velocity flip, this is needed to prevent a bug,
+        # game time of the last velocity flip, this is needed to prevent a bug,
         # where the ball would glitch into the player
-        self.lastFlip = time()
+        self.lastFlip = 0.0
 
     def didCollideWithPlayer(self, player: Player):
         """
@@ -531,11 +615,12 @@ class Ball(Image):
         y_coord = self.getY()
         return y_coord < 0 or (y_coord + self.ball_size[1]) > Configuration.windowHeight
 
-    def flip_velocity(self, mode="x") -> bool:
+    def flip_velocity(self, currentTime, mode="x") -> bool:
         """
         This function flips the velocity vector of the ball.
 
         Args:
+            currentTime (Float): The current game time in seconds, used to limit the flips on the x-axis
             mode (String): The axis, on which the velocity vector is flipped. When mode is x, it flips the velocity
             on the x- axis (1,1) -> ( 1,-1). When mode is y, it flips the velocity on the y- axis (1,1) -> (-1, 1).
 
@@ -548,16 +633,15 @@ class Ball(Image):
         """
 
         if mode == "x":
-            currentTime = time()
             # The ball can only flip it´s velocity, when the last flip is more than 0.2 seconds ago
 
             if (currentTime - self.lastFlip) > 0.2:
-                self.speed = (-self.speed[0], self.speed[1])
+                self.speed[0] = -self.speed[0]
                 self.lastFlip = currentTime  # set the last flip to the current time
             else:
                 return False  # indicates, that the ball has not been flipped
         elif mode == "y":
-            self.speed = (self.speed[0], -self.speed[1])
+            self.speed[1] = -self.speed[1]
 
         return True
 
@@ -610,29 +694,33 @@ class Ball(Image):
             - check, if ball is in the middle of the screen
         """
 
-        self.speed = self.getRandomVelocity()
+        self.setRandomVelocity()
         self.setX(Configuration.windowWidth / 2)
         self.setY(Configuration.windowHeight / 2)
+        self.savePosition()  # don't draw the ball between the goal and the middle of the screen
 
-    def getRandomVelocity(self) -> (int, int):
+    def setRandomVelocity(self) -> None:
         """
-        Generates a random velocity tuple, that has random x/y values and signs.
+        Sets the speed of the ball to a random velocity, that has random x/y values and signs. The speed is updated in
+        place.
 
         Return:
-            (Integer, Integer): random velocity
+            None
 
         Tests:
             - check, if the velocity is within the correct boundaries
-            - check, if multiple function calls return different signs of the speed
+            - check, if multiple function calls set different signs of the speed
         """
 
         v_x, v_y = randint(9, 15), randint(5, 8)
-        pos_or_negativ = np.random.randint(2, size=2)  # 1 --> negative sign, 0 --> positive sign
 
-        if pos_or_negativ[0]:
+        # 1 --> negative sign, 0 --> positive sign. Drawn one at a time instead of as an array, which is the same
+        # sequence of random numbers
+        if np.random.randint(2):
             v_x *= -1
 
-        if pos_or_negativ[1]:
+        if np.random.randint(2):
             v_y *= -1
 
-        return v_x, v_y
+        self.speed[0] = v_x
+        self.speed[1] = v_y
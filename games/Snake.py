@@ -10,14 +10,34 @@
 import random
 import pygame
 from enum import IntEnum
-from threading import Timer
 
 from config import Configuration, Colors
 from util import Game, Image
+from assets import Atlas, Prefetcher
 from loguru import logger
 
 
 class Snake(Game):
+    ASSETS = {
+        "images": {
+            "background": ("images/Snake/snake_background.png", Configuration.windowSize, None),
+            "endscreen": ("images/Snake/SnakeEndscreen.png", Configuration.windowSize, None),
+            **{
+                f"food_{food}": (
+                    f"images/Snake/food_{food}.png",
+                    (Configuration.SNAKE_TILE_SIZE, Configuration.SNAKE_TILE_SIZE),
+                    (0, 0, 0)
+                )
+                for food in Configuration.SNAKE_FOOD
+            }
+        },
+        "sheets": [Configuration.SNAKE_ATLAS],
+        "sounds": {
+            "food": "sounds/snake/food.wav",
+            "death": "sounds/snake/death.wav"
+        }
+    }
+
     def __init__(self):
         """
         Snake is a game where the player moves around a given map controlling a snake.
@@ -59,24 +79,13 @@ class Snake(Game):
 
         # Initialize the background image
         # Image modified after: https://www.slynyrd.com/blog/2019/8/27/pixelblog-20-top-down-tiles
-        self.backgroundImage = Image(
-            x=0,
-            y=0,
-            size=Configuration.windowSize,
-            image="snake_background.png",
-            pathToImage="images/snake",
-            hasColorkey=False
-        )
+        self.backgroundImage = Image.fromAsset(0, 0, self.ASSETS["images"]["background"])
+
+        # The field never changes, it is drawn once onto the background
+        self.addStaticLayer(self.drawField)
 
         # load Endscreen image
-        self.nameBackground = Image(
-            x=0,
-            y=0,
-            size=Configuration.windowSize,
-            pathToImage="images/snake/",
-            image="SnakeEndscreen.png",
-            hasColorkey=False
-        )
+        self.nameBackground = Image.fromAsset(0, 0, self.ASSETS["images"]["endscreen"])
 
         # Initialize background music and sounds
         # https://patrickdearteaga.com/royalty-free-music/childs-nightmare/
@@ -84,9 +93,9 @@ class Snake(Game):
         try:
             self.sounds = {
                 # https://mixkit.co/free-sound-effects/eat/ "Chewing something crunchy":
-                "food": pygame.mixer.Sound("sounds/snake/food.wav"),
+                "food": Prefetcher.getSound(self.ASSETS["sounds"]["food"]),
                 # https://mixkit.co/free-sound-effects/arcade/ "Arcade retro game over"
-                "death": pygame.mixer.Sound("sounds/snake/death.wav")
+                "death": Prefetcher.getSound(self.ASSETS["sounds"]["death"])
             }
         except:
             logger.critical("Snake Sounds could not be loaded")
@@ -119,46 +128,64 @@ class Snake(Game):
         self.updateFood()
         self.foodEaten = False
 
+        # Control the snake with the arrow keys
+        self.bind(pygame.KEYDOWN, lambda event: self.changeDirection(Direction.UP), pygame.K_UP)
+        self.bind(pygame.KEYDOWN, lambda event: self.changeDirection(Direction.RIGHT), pygame.K_RIGHT)
+        self.bind(pygame.KEYDOWN, lambda event: self.changeDirection(Direction.DOWN), pygame.K_DOWN)
+        self.bind(pygame.KEYDOWN, lambda event: self.changeDirection(Direction.LEFT), pygame.K_LEFT)
+
         # Start the game
         self.run()
 
-    def handleEvent(self, event) -> None:
+    def getState(self) -> tuple:
+        """
+        This method returns the state of the game, which is compared when a recording is replayed.
+
+        Tests:
+            - Zustand ändert sich mit jeder Bewegung der Schlange
+            - Gleiche Aufnahme ergibt immer den selben Zustand
+
+        Returns: The state of the parent class, the positions of the tiles and the food, the direction and whether
+            the snake has died
+        """
+
+        return super().getState() + (
+            tuple((tile.getX(), tile.getY()) for tile in self.snakeTiles),
+            self.food.getX(),
+            self.food.getY(),
+            int(self.currentDirection),
+            self.hasDied
+        )
+
+    def changeDirection(self, direction) -> None:
         """
-        This method handles the snake specific events, such as controlling the snake by key presses.
+        This method changes the direction of the snake. It is bound to the arrow keys.
 
         Tests:
-            - Nur bestimmte Events werden beachtet
-            - Korrekte Reaktion auf die jeweiligen Events
+            - Richtung wird nur einmal pro Bewegung geändert
+            - Schlange kann nicht in die entgegengesetzte Richtung umkehren
 
         Args:
-            event (pygame.event.Event): The to be handled event
+            direction (Direction): The new direction of the snake
 
         Returns: None
         """
 
-        # Only react to keydown if snake is allowed to move
-        if event.type == pygame.KEYDOWN and self.allowMove:
+        # Only change the direction once per move and prevent the snake going in the opposite direction
+        if self.allowMove and direction != (self.currentDirection + 2) % 4:
+            self.currentDirection = direction
             self.allowMove = False
 
-            # Prevent the snake going in the opposite direction
-            if event.key == pygame.K_UP and self.currentDirection is not Direction.DOWN:
-                self.currentDirection = Direction.UP
-            elif event.key == pygame.K_RIGHT and self.currentDirection is not Direction.LEFT:
-                self.currentDirection = Direction.RIGHT
-            elif event.key == pygame.K_DOWN and self.currentDirection is not Direction.UP:
-                self.currentDirection = Direction.DOWN
-            elif event.key == pygame.K_LEFT and self.currentDirection is not Direction.RIGHT:
-                self.currentDirection = Direction.LEFT
-            else:
-                self.allowMove = True
-
-    def updateScreen(self) -> None:
+    def drawField(self, surface) -> None:
         """
-        This methods handles the drawing of elements on the screen.
+        This method draws the checkered field and its border. It is a static layer of the background.
 
         Tests:
-            - Alle Elemente sind vorhanden und werden an die richtigen Stellen gezeichnet
-            - Reihenfolge beim Zeichnen der Elemente wird eingehalten -> Keine Überlappungen
+            - Schachbrettmuster wird korrekt gezeichnet
+            - Rand liegt genau um das Spielfeld
+
+        Args:
+            surface (pygame.surface.Surface): The surface of the background
 
         Returns: None
         """
@@ -171,10 +198,21 @@ class Snake(Game):
                     color = Colors.LightGreen
                 else:
                     color = Colors.VeryLightGreen
-                pygame.draw.rect(self.surface, color, (x, y, size, size))
+                pygame.draw.rect(surface, color, (x, y, size, size))
 
         # Draw border
-        pygame.draw.rect(self.surface, Colors.Red, self.borderRect, self.borderThickness)
+        pygame.draw.rect(surface, Colors.Red, self.borderRect, self.borderThickness)
+
+    def updateScreen(self) -> None:
+        """
+        This methods handles the drawing of elements on the screen. The field is part of the background.
+
+        Tests:
+            - Alle Elemente sind vorhanden und werden an die richtigen Stellen gezeichnet
+            - Reihenfolge beim Zeichnen der Elemente wird eingehalten -> Keine Überlappungen
+
+        Returns: None
+        """
 
         # Draw Snake
         # Use the reversed list to make sure the head is always on top
@@ -184,9 +222,6 @@ class Snake(Game):
         # Draw food
         self.drawImageOnSurface(self.food)
 
-        if self.hasDied and not self.isGameOver:
-            self.animateDeath()
-
         super().updateScreen()
 
     def updateGameState(self) -> None:
@@ -207,6 +242,10 @@ class Snake(Game):
                 self.updateSnakeTiles()
                 self.eatFood()
 
+            # Animate the death here instead of in updateScreen to also end headless runs
+            if self.hasDied:
+                self.animateDeath()
+
             # Increase the tick counter
             self.tickCounter += 1
 
@@ -251,19 +290,12 @@ class Snake(Game):
                 startIndex -= 1
 
             for index in range(startIndex, 0, -1):
-                # Retrieve direction and position of the previous element
-                prevTile = self.snakeTiles[index - 1]
-                prevDirection = prevTile.getDirection()
-                prevPos = prevTile.getRect()
-
                 # Set direction and position to the values of the previous Element
-                self.snakeTiles[index].move(prevPos, prevDirection)
+                prevTile = self.snakeTiles[index - 1]
+                self.snakeTiles[index].move(prevTile.getX(), prevTile.getY(), prevTile.getDirection())
 
             # Move the head
-            self.head.move(
-                pygame.rect.Rect(nextX, nextY, Configuration.SNAKE_TILE_SIZE, Configuration.SNAKE_TILE_SIZE),
-                self.currentDirection
-            )
+            self.head.move(nextX, nextY, self.currentDirection)
 
             # Update body tiles to represent corners
             # Check whether a snake body-tile is at a corner and change the picture if so
@@ -375,24 +407,38 @@ class Snake(Game):
         """
 
         # Create a new pair of coordinates
-        newRect = self.head.getRect()
+        newX, newY = self.head.getX(), self.head.getY()
 
         # Choose new random positions if the random coordinate is inside the snake
-        while newRect in [tile.getRect() for tile in self.snakeTiles]:
+        while self.isOnSnake(newX, newY):
             newX = random.randrange(self.startX, self.startX + self.width, Configuration.SNAKE_TILE_SIZE)
             newY = random.randrange(self.startY, self.startY + self.height, Configuration.SNAKE_TILE_SIZE)
 
-            newRect = pygame.rect.Rect(newX, newY, Configuration.SNAKE_TILE_SIZE, Configuration.SNAKE_TILE_SIZE)
-
         # Create the food item at the created position
         # Choose a random image
-        self.food = Image(
-            x=newRect.x,
-            y=newRect.y,
-            size=(Configuration.SNAKE_TILE_SIZE, Configuration.SNAKE_TILE_SIZE),
-            image=f"food_{Configuration.SNAKE_FOOD[random.randint(0, len(Configuration.SNAKE_FOOD) - 1)]}.png",
-            pathToImage="images/Snake"
-        )
+        food = Configuration.SNAKE_FOOD[random.randint(0, len(Configuration.SNAKE_FOOD) - 1)]
+        self.food = Image.fromAsset(newX, newY, self.ASSETS["images"][f"food_{food}"])
+
+    def isOnSnake(self, x, y) -> bool:
+        """
+        This method checks whether a tile of the snake is placed at the given position.
+
+        Tests:
+            - Position eines Teils der Schlange ergibt True
+            - Freie Felder ergeben False
+
+        Args:
+            x (int): The x coordinate of the field
+            y (int): The y coordinate of the field
+
+        Returns: Whether the field is occupied by the snake
+        """
+
+        for tile in self.snakeTiles:
+            if tile.getX() == x and tile.getY() == y:
+                return True
+
+        return False
 
     def animateDeath(self) -> None:
         """
@@ -406,15 +452,16 @@ class Snake(Game):
         """
 
         # Play death sound
-        self.playSound("death")
+        self.playSound("death", priority=1)
 
         # Reset the tiles to their previous state
-        self.snakeTiles = [tile.getPreviousState() for tile in self.snakeTiles]
+        for tile in self.snakeTiles:
+            tile.restoreState()
 
         self.isGameOver = True
 
-        # Quit the game and ask for the users name
-        Timer(1, self.quit).start()
+        # Quit the game in a second and ask for the users name
+        self.schedule(1, self.quit)
 
 
 class Direction(IntEnum):
@@ -433,6 +480,11 @@ class Direction(IntEnum):
 
 
 class SnakeTile(Image):
+    __slots__ = (
+        "atlas", "tileType", "direction", "isBendable", "isTail", "orientation",
+        "stateX", "stateY", "stateDirection", "stateImage", "stateOrientation"
+    )
+
     def __init__(self, x, y, tileType):
         """
         A SnakeTile represents a tile-fragment of the snake. There is always a head tile, at least two body tiles and a
@@ -448,17 +500,20 @@ class SnakeTile(Image):
             tileType (str): The type of the tile. "head", "body" or "tail"
         """
 
-        # Choose the image depending on the tileType
-        image = "snake_" + tileType + ".png"
-        path = "images/snake"
+        # Choose the sprite of the shared snake atlas depending on the tileType
         size = (Configuration.SNAKE_TILE_SIZE, Configuration.SNAKE_TILE_SIZE)
+        self.atlas = Atlas.load(
+            Configuration.SNAKE_ATLAS,
+            Configuration.SNAKE_ATLAS_MANIFEST,
+            Configuration.SNAKE_ATLAS_CELL_SIZE,
+            size
+        )
 
         super().__init__(
             x=x,
             y=y,
             size=size,
-            image=image,
-            pathToImage=path
+            surface=self.atlas.getSprite(tileType)
         )
 
         # Save the type of the tile
@@ -473,26 +528,16 @@ class SnakeTile(Image):
         # Save whether the tile is the tail of the snake for later use
         self.isTail = tileType == "tail"
 
-        # Save a copy of the image to switch back to after using the cornerImage
-        self.defaultImage = self.image
-
-        # Load the corner image if the tile is a body tile
-        if self.isBendable:
-            self.cornerImage = Image(
-                x=x,
-                y=y,
-                size=size,
-                image="snake_corner.png",
-                pathToImage=path
-            )
+        # Number of counterclockwise quarter turns of the default image. Used to look up the precomputed variant
+        # to switch back to after using the corner image
+        self.orientation = 0
 
-        # Save a the previous state to animate the death of the snake
-        self.prevState = None
+        # Save the previous state to animate the death of the snake
+        self.saveState()
 
     def __copy__(self):
         """
-        This method deepcopies a snake tile and is used for increasing the length of the snake after eating food and
-        saving the previous state of the tile
+        This method deepcopies a snake tile and is used for increasing the length of the snake after eating food
 
         Tests:
             - Alle Variablen werden korrekt gesetzt
@@ -501,61 +546,71 @@ class SnakeTile(Image):
         Returns (SnakeTile): A new SnakeTile object exactly the same as the current object
         """
 
+        # Surfaces are never drawn on and can be shared instead of copied
         cloneTile = SnakeTile(self.getX(), self.getY(), self.tileType)
         cloneTile.direction = self.direction
-        cloneTile.image = self.image.copy()
-        if cloneTile.isBendable:
-            cloneTile.cornerImage.image = self.cornerImage.getImage().copy()
-
-        cloneTile.defaultImage = self.defaultImage.copy()
-        cloneTile.rect = pygame.rect.Rect(self.rect)
-        cloneTile.prevState = self.getPreviousState()
+        cloneTile.image = self.image
+        cloneTile.orientation = self.orientation
+        cloneTile.stateX, cloneTile.stateY = self.stateX, self.stateY
+        cloneTile.stateDirection = self.stateDirection
+        cloneTile.stateImage = self.stateImage
+        cloneTile.stateOrientation = self.stateOrientation
 
         return cloneTile
 
-    def move(self, rect, direction) -> None:
+    def move(self, x, y, direction) -> None:
         """
-        Moves the tile to a given position and facing in a specific direction.
+        Moves the tile to a given position and facing in a specific direction. The rect is updated in place.
 
         Tests:
             - Bewegung wird an die korrekte Stelle durchgeführt
             - Übergabeparameter gültig? (auf dem Spielfeld und Richtung aus dem Enum)
 
         Args:
-            rect (pygame.rect.Rect): The position to move the tile to
+            x (int): The x coordinate to move the tile to
+            y (int): The y coordinate to move the tile to
             direction (Direction): The direction the tile will be facing
 
         Returns: None
         """
 
-        self.setRect(rect)
+        self.setX(x)
+        self.setY(y)
         self.setDirection(direction)
 
-    def getPreviousState(self):
+    def saveState(self) -> None:
         """
-        Get the previous state of the tile
+        This method saves the position, direction and image of the tile to restore them once the snake has died.
+        Nothing is copied, the image is shared with the atlas anyway.
 
         Tests:
-            - Zurückgegebener Wert ist eine SnakeTiles Instanz
-            - prevState spiegelt tatsächlich den vorherigen Stand wieder
+            - Alle Werte werden gespeichert
+            - Keine neuen Objekte werden erzeugt
 
-        Returns (SnakeTile): A SnakeTile representing the previous state
+        Returns: None
         """
 
-        return self.prevState
+        self.stateX, self.stateY = self.rect.x, self.rect.y
+        self.stateDirection = self.direction
+        self.stateImage = self.image
+        self.stateOrientation = self.orientation
 
-    def saveState(self) -> None:
+    def restoreState(self) -> None:
         """
-        This method saves a copy of the element to the prevState variable.
+        This method moves the tile back to the state saved by saveState().
 
         Tests:
-            - Kopie wird ohne Fehler erzeugt
-            - Variable wird korrekt gesetzt
+            - Position, Richtung und Bild entsprechen dem gespeicherten Zustand
+            - Mehrfacher Aufruf verändert nichts
 
         Returns: None
         """
 
-        self.prevState = self.__copy__()
+        self.setX(self.stateX)
+        self.setY(self.stateY)
+        self.direction = self.stateDirection
+        self.image = self.stateImage
+        self.orientation = self.stateOrientation
 
     def getDirection(self) -> Direction:
         """
@@ -632,7 +687,7 @@ class SnakeTile(Image):
 
     def rotateTile(self, rotation) -> None:
         """
-        Rotate the image of a tile.
+        Rotate the image of a tile. The rotated image is looked up in the precomputed variants of the atlas.
 
         Tests:
             - Rotation wird korrekt durchgeführt
@@ -644,8 +699,8 @@ class SnakeTile(Image):
         Returns: None
         """
 
-        self.image = pygame.transform.rotate(self.defaultImage, rotation * 90)
-        self.defaultImage = self.image
+        self.orientation = (self.orientation + rotation) % 4
+        self.image = self.atlas.getVariant(self.tileType, self.orientation)
 
     def getDirectionDiff(self, newDirection) -> int:
         """
@@ -666,17 +721,17 @@ class SnakeTile(Image):
     def bendImage(self, angle, flip) -> None:
         """
         Replace the image of a body tile with the corner image. Also handle rotation and horizontal mirroring of the
-        image.
+        image by looking up the precomputed variant of the atlas.
 
         Tests:
             - Bild wird richtig rotiert und gespiegelt
             - Übergebene Parameter sind gültig
 
         Args:
-            angle (int): The angle to rotate the image by
+            angle (int): The angle to rotate the image by, a multiple of 90
             flip (bool): Specifies whether the image has to be mirrored horizontally
 
         Returns: None
         """
 
-        self.image = pygame.transform.flip(pygame.transform.rotate(self.cornerImage.getImage(), angle), flip, False)
+        self.image = self.atlas.getVariant("corner", angle // 90, flip)
@@ -8,15 +8,26 @@
 """
 
 import pygame
-from threading import Timer
 
 from typing import Tuple
 
 from config import Colors, Configuration
 from util import Game, Image
+from assets import FontRegistry, Prefetcher
 
 
 class TicTacToe(Game):
+    ASSETS = {
+        "images": {
+            "background": ("images/ttt/background.jpg", Configuration.windowSize, None),
+            "endscreen": ("images/ttt/TTTEndscreen.png", Configuration.windowSize, None)
+        },
+        "sounds": {
+            "click": "sounds/ttt/click.wav",
+            "win": "sounds/ttt/win.wav"
+        }
+    }
+
     def __init__(self):
         """
         TicTacToe is game where two players play against each other on a 3x3 field. The first player to reach 3 symbols
@@ -31,33 +42,28 @@ class TicTacToe(Game):
         # Disable score but still show name enter if someone won
         self.hasScore = False
         self.showGameOver = True
-        self.gameOverTimer = Timer(1, self.quit)
+        self.gameOverTimer = None
         self.draw = False
 
+        # The field only changes on input, the window isn't drawn again while nobody moves the mouse
+        self.isStatic = True
+
         # Center the field
         self.startX = Configuration.windowWidth // 2 - Configuration.TTT_TILE_SIZE * 1.5
         self.startY = Configuration.windowHeight // 2 - Configuration.TTT_TILE_SIZE * 1.5
+        self.fieldRect = pygame.rect.Rect(
+            self.startX, self.startY, 3 * Configuration.TTT_TILE_SIZE, 3 * Configuration.TTT_TILE_SIZE
+        )
 
         # Background image
         # From: https://www.vecteezy.com/vector-art/434094-wood-texture
-        self.backgroundImage = Image(
-            x=0,
-            y=0,
-            size=Configuration.windowSize,
-            image="background.jpg",
-            pathToImage="images/ttt",
-            hasColorkey=False
-        )
+        self.backgroundImage = Image.fromAsset(0, 0, self.ASSETS["images"]["background"])
+
+        # The board never changes, it is drawn once onto the background
+        self.addStaticLayer(self.drawBoard)
 
         # load endscreen image
-        self.nameBackground = Image(
-            x=0,
-            y=0,
-            size=Configuration.windowSize,
-            pathToImage="images/ttt/",
-            image="TTTEndscreen.png",
-            hasColorkey=False
-        )
+        self.nameBackground = Image.fromAsset(0, 0, self.ASSETS["images"]["endscreen"])
 
         # Background music
         # From: https://www.chosic.com/download-audio/?t=27247&tag=Games
@@ -66,15 +72,15 @@ class TicTacToe(Game):
         # Sounds
         self.sounds = {
             # From: https://mixkit.co/free-sound-effects/click/ "Modern click box check"
-            "click": pygame.mixer.Sound("sounds/ttt/click.wav"),
+            "click": Prefetcher.getSound(self.ASSETS["sounds"]["click"]),
             # From: https://mixkit.co/free-sound-effects/win/ "Quick win video game notification"
-            "win": pygame.mixer.Sound("sounds/ttt/win.wav")
+            "win": Prefetcher.getSound(self.ASSETS["sounds"]["win"])
         }
 
         # Fonts
-        self.mouseFont = pygame.font.SysFont("arial", Configuration.TTT_TILE_SIZE // 3, True)
-        self.symbolFont = pygame.font.SysFont("arial", Configuration.TTT_TILE_SIZE // 2, True)
-        self.notifyFont = pygame.font.SysFont("arial", Configuration.TTT_TILE_SIZE, True)
+        self.mouseFont = FontRegistry.get("arial", Configuration.TTT_TILE_SIZE // 3, True)
+        self.symbolFont = FontRegistry.get("arial", Configuration.TTT_TILE_SIZE // 2, True)
+        self.notifyFont = FontRegistry.get("arial", Configuration.TTT_TILE_SIZE, True)
 
         # Game specific variables
         self.players = ["X", "O"]
@@ -109,13 +115,38 @@ class TicTacToe(Game):
             [6, 7, 8]
         ]
 
+        # React to mouse clicks and motion
+        self.bind(pygame.MOUSEBUTTONDOWN, self.handleClick)
+        self.bind(pygame.MOUSEMOTION, self.handleMouseMotion)
+
         # Run the game
         self.run()
 
+    def drawBoard(self, surface) -> None:
+        """
+        This method draws the white board and the border of every field. It is a static layer of the background.
+
+        Tests:
+            - Spielfeld wird in der Mitte des Fensters gezeichnet
+            - Jedes Feld hat einen Rand
+
+        Args:
+            surface (pygame.surface.Surface): The surface of the background
+
+        Returns: None
+        """
+
+        # Draw white background
+        pygame.draw.rect(surface, Colors.White, self.fieldRect)
+
+        # Draw the border around every field
+        for field in self.fields.values():
+            pygame.draw.rect(surface, Colors.Black, field.getRect(), 4)
+
     def updateScreen(self) -> None:
         """
-        This method draws the field and placed symbols on the screen. It also draws the symbol of the current player at
-        the position of the mouse.
+        This method draws the placed symbols on the screen, the board is part of the background. It also draws the
+        symbol of the current player at the position of the mouse.
         It also notifies the players of a winner or draw.
 
         Tests:
@@ -125,36 +156,14 @@ class TicTacToe(Game):
         Returns: None
         """
 
-        # Draw white background
-        pygame.draw.rect(
-            self.surface,
-            Colors.White,
-            (self.startX, self.startY, 3 * Configuration.TTT_TILE_SIZE, 3 * Configuration.TTT_TILE_SIZE)
-        )
-
-        # Draw symbols and borders
+        # Draw symbols
         for field in self.fields.values():
-            fieldPos = field.getPos()
-
-            # Draw the border around the field
-            borderX, borderY = fieldPos
-            borderX -= Configuration.TTT_TILE_SIZE // 2
-            borderY -= Configuration.TTT_TILE_SIZE // 2
-            pygame.draw.rect(
-                self.surface,
-                Colors.Black,
-                (borderX, borderY, Configuration.TTT_TILE_SIZE, Configuration.TTT_TILE_SIZE),
-                4
-            )
-
-            # Draw the symbol
-            self.drawTextOnSurface(field.getPlayer(), fieldPos, Colors.Black, font=self.symbolFont)
+            self.drawTextOnSurface(field.getPlayer(), field.getPos(), Colors.Black, font=self.symbolFont)
 
         # Notify users of a draw or the winner
         if self.draw:
             self.gameStateNotification("It's a draw!", True)
         elif self.winner in self.players:
-            self.isGameOver = True
             self.gameStateNotification(f"{self.winner} won!")
         else:
             # Draw the symbol of the current user at the position of the mouse
@@ -187,47 +196,84 @@ class TicTacToe(Game):
 
         self.draw = self.turns == 9 and not self.winner
 
+        # End the game here instead of in updateScreen to also end headless runs
+        if self.winner in self.players:
+            self.isGameOver = True
+
+        # Play the sound once and quit the game in a second if the timer hasn't been started yet
+        if (self.draw or self.isGameOver) and self.gameOverTimer is None:
+            self.playSound("win", 0.5, priority=1)
+            self.gameOverTimer = self.schedule(1, self.quit)
+
         # Update the player
         self.currentPlayer = self.players[self.turns % 2]
 
-    def handleEvent(self, event) -> None:
+    def getState(self) -> tuple:
         """
-        This method handles the events needed for the game to work. It reacts to a mouse click with the primary button
-        and mouse motion.
+        This method returns the state of the game, which is compared when a recording is replayed.
+
+        Tests:
+            - Zustand ändert sich mit jedem gesetzten Symbol
+            - Gleiche Aufnahme ergibt immer den selben Zustand
+
+        Returns: The state of the parent class, the players of the fields, the number of turns and the winner
+        """
+
+        return super().getState() + (
+            tuple(field.getPlayer() for field in self.fields.values()),
+            self.turns,
+            self.winner
+        )
+
+    def handleClick(self, event) -> None:
+        """
+        This method sets the symbol of the current player on the field clicked with the primary mouse button.
 
         Tests:
             - Gleiches Event für immer zum selben Ergebnis
-            - Variablen werden korrekt gesetzt
+            - Klicks außerhalb des Spielfelds werden ignoriert
+
+        Args:
+            event (pygame.event.Event): The MOUSEBUTTONDOWN event
+
+        Returns: None
+        """
+
+        if not self.isGameOver and event.button == 1:
+            # Get the field the player clicked on
+            posX = event.pos[0]
+            posY = event.pos[1]
+            fieldX = int((posX - self.startX) // Configuration.TTT_TILE_SIZE)
+            fieldY = int((posY - self.startY) // Configuration.TTT_TILE_SIZE)
+
+            # Check if field is valid
+            if fieldX in range(3) and fieldY in range(3):
+                # Update the field and turn count
+                if self.fields[self.indexFromXY(fieldX, fieldY)].setPlayer(self.currentPlayer):
+                    self.playSound("click")
+                    self.turns += 1
+
+    def handleMouseMotion(self, event) -> None:
+        """
+        This method saves the position of the mouse to display the current player there.
+
+        Tests:
+            - Position wird korrekt gespeichert
+            - Nach Spielende wird die Position nicht mehr verändert
 
         Args:
-            event (pygame.event.Event):
+            event (pygame.event.Event): The MOUSEMOTION event
 
         Returns: None
         """
 
         if not self.isGameOver:
-            # Mouse left click
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # Get the field the player clicked on
-                posX = event.pos[0]
-                posY = event.pos[1]
-                fieldX = int((posX - self.startX) // Configuration.TTT_TILE_SIZE)
-                fieldY = int((posY - self.startY) // Configuration.TTT_TILE_SIZE)
-
-                # Check if field is valid
-                if fieldX in range(3) and fieldY in range(3):
-                    # Update the field and turn count
-                    if self.fields[self.indexFromXY(fieldX, fieldY)].setPlayer(self.currentPlayer):
-                        self.playSound("click")
-                        self.turns += 1
-            # Display the current player at the position of the mouse
-            elif event.type == pygame.MOUSEMOTION:
-                self.mousePos = event.pos
+            self.mousePos = event.pos
 
     def gameStateNotification(self, text, isDraw=False) -> None:
         """
         Notifies the user of a change in the game state. This means that either someone won or the game is a draw.
-        It also enables the regular mouse pointer again and plays a sound.
+        It also enables the regular mouse pointer again.
 
         Tests:
             - Parameter werden korrekt übergeben
@@ -241,7 +287,6 @@ class TicTacToe(Game):
         """
 
         pygame.mouse.set_visible(True)
-        self.playSound("win", 0.5)
 
         # Choose a different color for the draw text
         color = Colors.LightGreen
@@ -256,10 +301,6 @@ class TicTacToe(Game):
             font=self.notifyFont
         )
 
-        # Quit the game in a second if the timer isn't running
-        if not self.gameOverTimer.is_alive():
-            self.gameOverTimer.start()
-
     @staticmethod
     def indexFromXY(x, y) -> int:
         """
@@ -281,10 +322,12 @@ class TicTacToe(Game):
 
 
 class TTTTile:
+    __slots__ = ("x", "y", "pos", "rect", "player")
+
     def __init__(self, x, y):
         """
         This class represents a TicTacToeTile.
-        It contains the position of the tile and the player occupying it.
+        It contains the position and the border of the tile and the player occupying it.
 
         Tests:
             - Variablen werden korrekt übergeben
@@ -297,6 +340,16 @@ class TTTTile:
 
         self.x = x
         self.y = y
+        self.pos = (x, y)
+
+        # Border around the tile, created once instead of every frame
+        self.rect = pygame.rect.Rect(
+            x - Configuration.TTT_TILE_SIZE // 2,
+            y - Configuration.TTT_TILE_SIZE // 2,
+            Configuration.TTT_TILE_SIZE,
+            Configuration.TTT_TILE_SIZE
+        )
+
         self.player = ""
 
     def setPlayer(self, player) -> bool:
@@ -348,4 +401,17 @@ class TTTTile:
         Returns (tuple[int, int]: A tuple containing both the x and y coordinate.
         """
 
-        return self.x, self.y
+        return self.pos
+
+    def getRect(self) -> pygame.rect.Rect:
+        """
+        Returns the border of the tile.
+
+        Tests:
+            - Rechteck ist um die Position des Felds zentriert
+            - Größe entspricht Configuration.TTT_TILE_SIZE
+
+        Returns: The rect of the border
+        """
+
+        return self.rect
@@ -0,0 +1,325 @@
+"""
+    file: logpipeline.py
+    description: Contains the LogPipeline writing the log off the game thread. Messages are queued and written in
+    batches by a background thread, rotated files are compressed by another one. A budget of messages per frame
+    samples call sites logging on every step, so logging can't slow down a frame.
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+import gzip
+import os
+import shutil
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+
+from loguru import logger
+
+from config import Configuration
+
+
+class BatchedSink:
+    def __init__(self, path=None, stream=None):
+        """
+        A sink of loguru queueing the formatted messages. A background thread writes them in batches every
+        Configuration.LOG_FLUSH_INTERVAL seconds, so a slow disk or terminal never blocks the game. Log files are
+        rotated at Configuration.LOG_ROTATION bytes and compressed in the background.
+
+        Tests:
+            - Nachrichten werden in der richtigen Reihenfolge geschrieben
+            - Volle Warteschlange verwirft neue Nachrichten, statt zu blockieren
+
+        Args:
+            path (str): The path of the log files, {time} is replaced by the time the file was created
+            stream: A stream the messages are written to instead of a file, e.g. sys.stderr
+        """
+
+        self.path = path
+        self.stream = stream
+        self.file = None
+
+        # deque.append() and popleft() are thread-safe
+        self.queue = deque()
+        self.dropped = 0
+
+        self.wakeup = threading.Event()
+        self.isStopped = False
+        self.compressions = []
+
+        self.thread = threading.Thread(target=self.run, name="LogWriter", daemon=True)
+        self.thread.start()
+
+    def write(self, message) -> None:
+        """
+        This method is called by loguru on the logging thread and only queues the message.
+
+        Tests:
+            - Nachricht wird nicht sofort geschrieben
+            - Verworfene Nachrichten werden gezählt
+
+        Args:
+            message (str): The formatted message
+
+        Returns: None
+        """
+
+        if len(self.queue) >= Configuration.LOG_QUEUE_SIZE:
+            self.dropped += 1
+            return
+
+        # The message references its record, queueing it would keep every record alive for the garbage collector
+        self.queue.append(str(message))
+
+    def run(self) -> None:
+        """
+        This method is the loop of the background thread writing the queued messages until the sink is stopped.
+
+        Tests:
+            - Nachrichten werden spätestens nach dem Intervall geschrieben
+            - Verbleibende Nachrichten werden beim Stoppen geschrieben
+
+        Returns: None
+        """
+
+        while not self.isStopped:
+            self.wakeup.wait(Configuration.LOG_FLUSH_INTERVAL)
+            self.writeBatch()
+
+        self.writeBatch()
+
+    def writeBatch(self) -> None:
+        """
+        This method writes every queued message with a single call and rotates the log file once it is full.
+
+        Tests:
+            - Leere Warteschlange schreibt nichts
+            - Datei wird nach Erreichen der Größe rotiert
+
+        Returns: None
+        """
+
+        queue = self.queue
+        batch = []
+        while queue:
+            batch.append(queue.popleft())
+
+        if not batch:
+            return
+
+        if self.stream is not None:
+            self.stream.write("".join(batch))
+            self.stream.flush()
+            return
+
+        if self.file is None:
+            path = self.path.replace("{time}", datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f"))
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self.file = open(path, "a", encoding="utf-8")
+
+        self.file.write("".join(batch))
+        self.file.flush()
+
+        if self.file.tell() >= Configuration.LOG_ROTATION:
+            self.rotate()
+
+    def rotate(self) -> None:
+        """
+        This method closes the current log file and compresses it in the background. The next batch opens a new file.
+
+        Tests:
+            - Neue Datei wird mit neuem Zeitstempel angelegt
+            - Komprimierung blockiert das Schreiben nicht
+
+        Returns: None
+        """
+
+        self.file.close()
+
+        thread = threading.Thread(target=self.compress, args=(self.file.name,), name="LogCompression", daemon=True)
+        thread.start()
+        self.compressions.append(thread)
+
+        self.file = None
+
+    @staticmethod
+    def compress(path) -> None:
+        """
+        This method compresses a rotated log file with gzip and removes the original one.
+
+        Tests:
+            - Komprimierte Datei enthält den gesamten Inhalt
+            - Originaldatei wird erst nach erfolgreicher Komprimierung gelöscht
+
+        Args:
+            path (str): The path of the rotated log file
+
+        Returns: None
+        """
+
+        with open(path, "rb") as source, gzip.open(f"{path}.gz", "wb") as target:
+            shutil.copyfileobj(source, target)
+
+        os.remove(path)
+
+    def stop(self) -> None:
+        """
+        This method is called by loguru once the sink is removed, at the latest when python exits. It writes the
+        remaining messages and waits for running compressions.
+
+        Tests:
+            - Keine Nachricht geht beim Beenden verloren
+            - Laufende Komprimierungen werden abgeschlossen
+
+        Returns: None
+        """
+
+        self.isStopped = True
+        self.wakeup.set()
+        self.thread.join()
+
+        for thread in self.compressions:
+            thread.join()
+
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class LogPipeline:
+    """
+    A static class setting up the sinks of loguru. Every message of a frame beyond Configuration.LOG_FRAME_BUDGET is
+    sampled per call site, only every Configuration.LOG_SAMPLE_RATE-th message is kept. Warnings and errors are never
+    sampled.
+
+    Tests:
+        - Nachrichten innerhalb des Budgets werden immer geloggt
+        - Warnungen werden nie verworfen
+    """
+
+    sinks = []
+
+    # Messages of this level and above are never sampled
+    WARNING = logger.level("WARNING").no
+
+    # Messages of the current frame and messages beyond the budget, keyed by their call site
+    frameMessages = 0
+    sampledSites = {}
+    suppressed = 0
+
+    @classmethod
+    def setup(cls, path=Configuration.LOG_FILE) -> None:
+        """
+        This method replaces the default sink of loguru with a batched sink for the console and one for the log file.
+
+        Tests:
+            - Log-Datei wird im Hintergrund geschrieben
+            - Konsole wird weiterhin farbig ausgegeben
+
+        Args:
+            path (str): The path of the log files, {time} is replaced by the time the file was created
+
+        Returns: None
+        """
+
+        # The sampling is decided once per message, before it is passed to the sinks
+        logger.configure(patcher=cls.sample)
+        logger.remove()
+
+        console = BatchedSink(stream=sys.stderr)
+        logger.add(console, filter=cls.isKept, colorize=sys.stderr.isatty())
+
+        logFile = BatchedSink(path)
+        logger.add(logFile, filter=cls.isKept)
+
+        cls.sinks = [console, logFile]
+
+    @classmethod
+    def sample(cls, record) -> None:
+        """
+        This method is called by loguru for every message and marks the messages that are sampled out.
+
+        Tests:
+            - Budget wird pro Frame zurückgesetzt
+            - Jede n-te Nachricht einer Stelle wird behalten
+
+        Args:
+            record (dict): The record of the message
+
+        Returns: None
+        """
+
+        if record["level"].no >= cls.WARNING:
+            return
+
+        cls.frameMessages += 1
+        if cls.frameMessages <= Configuration.LOG_FRAME_BUDGET:
+            return
+
+        site = (record["name"], record["line"])
+        count = cls.sampledSites.get(site, 0)
+        cls.sampledSites[site] = count + 1
+
+        if count % Configuration.LOG_SAMPLE_RATE:
+            record["extra"]["isSampledOut"] = True
+            cls.suppressed += 1
+
+    @staticmethod
+    def isKept(record) -> bool:
+        """
+        This method is the filter of the sinks, dropping the messages that were sampled out.
+
+        Tests:
+            - Markierte Nachrichten werden verworfen
+            - Unmarkierte Nachrichten werden geloggt
+
+        Args:
+            record (dict): The record of the message
+
+        Returns: Whether the message is written
+        """
+
+        return not record["extra"].get("isSampledOut", False)
+
+    @classmethod
+    def nextFrame(cls) -> None:
+        """
+        This method is called once per frame of the main loop or step of a headless run and resets the budget.
+
+        Tests:
+            - Budget steht danach wieder vollständig zur Verfügung
+            - Zähler der Stellen bleiben erhalten
+
+        Returns: None
+        """
+
+        cls.frameMessages = 0
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        This method logs and returns the number of messages that were sampled out or dropped.
+
+        Tests:
+            - Alle Zähler sind enthalten
+            - Verworfene Nachrichten aller Sinks werden addiert
+
+        Returns: A dict containing the number of sampled out and dropped messages and the sampled call sites
+        """
+
+        stats = {
+            "suppressed": cls.suppressed,
+            "dropped": sum(sink.dropped for sink in cls.sinks),
+            "sites": len(cls.sampledSites)
+        }
+
+        if stats["suppressed"] or stats["dropped"]:
+            logger.warning(
+                "Logging: {suppressed} messages of {sites} call sites sampled out, {dropped} dropped by a full queue",
+                **stats
+            )
+
+        return stats
@@ -8,10 +8,20 @@
 """
 
 import os
+import sys
 # Hide pygame support message
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
 
-from util import GameContainer
+# Import first, the startup is measured from here on
+from perf import Startup
+
+from argparse import ArgumentParser
+
+with Startup.measureImport("config"):
+    from config import Configuration
+with Startup.measureImport("util"):
+    from util import GameContainer, runHeadless
+from logpipeline import LogPipeline
 from loguru import logger
 
 
@@ -20,6 +30,10 @@ from loguru import logger
 def main():
     """
     This method is starting the GameContainer and therefore the application.
+    With --headless a single game is simulated without a window instead, e.g.:
+    python main.py --headless Pong --players 2 --steps 100000
+    With --record the input of every played game is saved, --replay plays such a recording headless again and exits
+    with 1 if the game state diverged.
 
 
     Tests:
@@ -27,11 +41,58 @@ def main():
         - Spiel startet korrekt
     """
 
-    # Create logging file, rotate if filesize exceeds 1MB
-    logger.add("logs/{time}.log", rotation="1 MB")
+    parser = ArgumentParser(description=Configuration.windowTitle)
+    parser.add_argument(
+        "--headless",
+        choices=[Configuration.GAME_SNAKE, Configuration.GAME_TTT, Configuration.GAME_PONG],
+        help="Simulate the given game without a window, sound and frame limit"
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=Configuration.HEADLESS_STEPS,
+        help="Maximum number of steps of a headless run, 0 runs until the game quits itself"
+    )
+    parser.add_argument("--players", type=int, choices=[1, 2], default=1, help="Number of Pong players")
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help=f"Record the input of every played game to {Configuration.REPLAY_DIRECTORY}/"
+    )
+    parser.add_argument("--replay", metavar="FILE", help="Replay a recording headless and verify the game state")
+    parser.add_argument("--render", action="store_true", help="Draw every step of a headless run or replay")
+    args = parser.parse_args()
 
-    GameContainer()
+    # Write the log in the background, rotated files are compressed
+    LogPipeline.setup()
+
+    if args.headless:
+        kwargs = {}
+        if args.headless == Configuration.GAME_PONG:
+            kwargs["hasComputerPlayer"] = args.players == 1
+
+        # The steps per second are logged once the run has finished
+        runHeadless(args.headless, args.steps, args.render, **kwargs)
+        return
+
+    if args.replay:
+        from replay import replay
+
+        # The result is logged, a diverged replay exits with 1 to be usable in scripts
+        replayer = replay(args.replay, args.render)
+        if not replayer.isIdentical:
+            sys.exit(1)
+        return
+
+    if args.record:
+        from engine import Engine
+        from replay import Recorder
+
+        Engine.eventSource = Recorder()
+
+    # Runs until the application is quit
     logger.info("Started the game launcher. Make sure to support pygame!")
+    GameContainer()
 
 
 if __name__ == "__main__":
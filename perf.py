@@ -0,0 +1,338 @@
+"""
+    file: perf.py
+    description: Contains tools to measure the performance of the application, such as the Startup report containing
+    the import time of every module and the time until the first frame was drawn, the FrameProfiler and the
+    IdleMonitor.
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+import sys
+from contextlib import contextmanager
+from time import perf_counter, process_time
+
+from loguru import logger
+
+
+class Startup:
+    """
+    A static class measuring the startup of the application. The start is the first import of this module, which is
+    why it has to be imported first.
+
+    Tests:
+        - Importzeiten werden pro Modul nur einmal gespeichert
+        - Zeit bis zum ersten Frame wird nur einmal gemessen
+    """
+
+    startTime = perf_counter()
+    importTimes = {}
+    firstFrameTime = None
+
+    @classmethod
+    @contextmanager
+    def measureImport(cls, module):
+        """
+        This method is a context manager measuring the time needed to import a module. Only the first import is saved,
+        later imports of the same module are already cached by python.
+
+        Tests:
+            - Dauer des Imports wird korrekt gespeichert
+            - Wiederholte Imports überschreiben den ersten Wert nicht
+
+        Args:
+            module (str): The name of the imported module
+
+        Returns: None
+        """
+
+        start = perf_counter()
+        yield
+
+        if module not in cls.importTimes:
+            cls.importTimes[module] = perf_counter() - start
+
+    @classmethod
+    def markFirstFrame(cls) -> None:
+        """
+        This method is called once the first frame was drawn to the window and logs the startup report.
+
+        Tests:
+            - Nur der erste Aufruf wird gespeichert
+            - Bericht wird geloggt
+
+        Returns: None
+        """
+
+        if cls.firstFrameTime is None:
+            cls.firstFrameTime = perf_counter() - cls.startTime
+            cls.report()
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        This method logs and returns the import time of every measured module and the time to the first frame.
+
+        Tests:
+            - Alle gemessenen Module sind enthalten
+            - Zeiten werden in Millisekunden angegeben
+
+        Returns: A dict containing the import times and the time to the first frame in milliseconds
+        """
+
+        imports = {module: duration * 1000 for module, duration in cls.importTimes.items()}
+        firstFrame = cls.firstFrameTime * 1000 if cls.firstFrameTime is not None else None
+
+        logger.info(
+            "Startup: first frame after {} ms, imports: {}",
+            f"{firstFrame:.0f}" if firstFrame is not None else "-",
+            ", ".join(f"{module} {duration:.0f} ms" for module, duration in imports.items())
+        )
+
+        return {
+            "imports": imports,
+            "firstFrame": firstFrame
+        }
+
+
+class FrameProfiler:
+    """
+    A static profiler saving the duration of every phase of the last frames in a ring buffer. It only records while it
+    is enabled, the game loop doesn't even take timestamps otherwise. Toggled with F3 together with its overlay.
+    It also counts the memory blocks every frame leaves allocated, which should stay near zero once a game is running.
+
+    Tests:
+        - Ringpuffer überschreibt die ältesten Frames
+        - Ohne Aufzeichnung gibt es keine Zusammenfassung
+    """
+
+    PHASES = ("events", "update", "background", "screen", "tick")
+    FRAMES = 240  # Size of the ring buffer
+    SUMMARY_INTERVAL = 30  # Frames between two summaries, keeps the overlay readable
+
+    isEnabled = False
+
+    # Ring buffer, allocated once on enable
+    phaseTimes = []
+    frameTimes = []
+    allocations = []
+    index = 0
+    count = 0
+    recorded = 0
+
+    summary = None
+    summaryFrame = 0
+
+    @classmethod
+    def toggle(cls) -> None:
+        """
+        This method enables or disables the profiler. The ring buffer is cleared on enable, the statistics of the
+        recorded frames are logged on disable.
+
+        Tests:
+            - Puffer ist nach dem Aktivieren leer
+            - Bericht wird beim Deaktivieren geloggt
+
+        Returns: None
+        """
+
+        cls.isEnabled = not cls.isEnabled
+
+        if cls.isEnabled:
+            cls.phaseTimes = [[0.0] * cls.FRAMES for _ in cls.PHASES]
+            cls.frameTimes = [0.0] * cls.FRAMES
+            cls.allocations = [0] * cls.FRAMES
+            cls.index = cls.count = cls.recorded = 0
+            cls.summary = None
+
+            logger.info("Frame profiler enabled")
+        else:
+            cls.report()
+
+    @staticmethod
+    def getAllocatedBlocks() -> int:
+        """
+        This method returns the number of memory blocks currently allocated by the interpreter. The difference before
+        and after a frame is the number of objects it allocated without freeing them again.
+
+        Tests:
+            - Neue Objekte erhöhen den Wert
+            - Freigegebene Objekte verringern den Wert
+
+        Returns: The number of allocated memory blocks
+        """
+
+        return sys.getallocatedblocks()
+
+    @classmethod
+    def record(cls, *timestamps, allocations=0) -> None:
+        """
+        This method saves the durations of the phases of a frame in the ring buffer.
+
+        Tests:
+            - Dauer jeder Phase wird korrekt berechnet
+            - Index springt am Ende des Puffers zurück auf den Anfang
+
+        Args:
+            timestamps (float): The start of the frame followed by the end of every phase, taken with perf_counter
+            allocations (int): The memory blocks left allocated by the frame, see getAllocatedBlocks(). Frames freeing
+                more blocks than they allocate count as 0
+
+        Returns: None
+        """
+
+        index = cls.index
+        for phase, phaseTimes in enumerate(cls.phaseTimes):
+            phaseTimes[index] = timestamps[phase + 1] - timestamps[phase]
+        cls.frameTimes[index] = timestamps[-1] - timestamps[0]
+        cls.allocations[index] = max(allocations, 0)
+
+        cls.index = (index + 1) % cls.FRAMES
+        cls.count = min(cls.count + 1, cls.FRAMES)
+        cls.recorded += 1
+
+    @classmethod
+    def getSummary(cls) -> dict:
+        """
+        This method returns the statistics of the frames in the ring buffer. They are only recalculated every
+        SUMMARY_INTERVAL frames, a new summary is a new dict.
+
+        Tests:
+            - Perzentile werden korrekt berechnet
+            - Zusammenfassung wird nur im Intervall neu berechnet
+
+        Returns: A dict containing the fps, the p50 and p99 frame time and the average of every phase in milliseconds
+            and the average memory blocks left allocated per frame. None if no frame was recorded
+        """
+
+        if cls.count == 0:
+            return None
+
+        if cls.summary is None or cls.recorded - cls.summaryFrame >= cls.SUMMARY_INTERVAL:
+            frameTimes = sorted(cls.frameTimes[:cls.count])
+
+            cls.summary = {
+                "fps": cls.count / sum(frameTimes) if sum(frameTimes) else 0.0,
+                "p50": frameTimes[int(0.5 * (cls.count - 1))] * 1000,
+                "p99": frameTimes[int(0.99 * (cls.count - 1))] * 1000,
+                "allocations": sum(cls.allocations[:cls.count]) / cls.count,
+                "phases": {
+                    phase: sum(phaseTimes[:cls.count]) / cls.count * 1000
+                    for phase, phaseTimes in zip(cls.PHASES, cls.phaseTimes)
+                }
+            }
+            cls.summaryFrame = cls.recorded
+
+        return cls.summary
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        This method logs and returns the statistics of the recorded frames.
+
+        Tests:
+            - Alle Phasen sind enthalten
+            - Ohne Aufzeichnung wird nichts geloggt
+
+        Returns: The summary of the recorded frames, see getSummary()
+        """
+
+        cls.summary = None
+        summary = cls.getSummary()
+
+        if summary is not None:
+            logger.info(
+                "Frame profile of {} frames: {:.0f} FPS, p50 {:.1f} ms, p99 {:.1f} ms, {:.1f} allocations per frame, {}",
+                cls.count, summary["fps"], summary["p50"], summary["p99"], summary["allocations"],
+                ", ".join(f"{phase} {duration:.2f} ms" for phase, duration in summary["phases"].items())
+            )
+
+        return summary
+
+
+class IdleMonitor:
+    """
+    A static monitor measuring the CPU usage of the application per screen, e.g. the menu, a game or the pause menu.
+    Static screens wait for input instead of drawing the same frame again, the monitor shows how much of the time
+    they actually waited. The usage of every screen is logged once the application is quit.
+
+    Tests:
+        - Zeiten werden pro Bildschirm aufsummiert
+        - Wartezeit ist nie größer als die gesamte Zeit
+    """
+
+    # Frames, wall time, CPU time and waiting time in seconds of every screen, keyed by its name
+    screens = {}
+
+    @staticmethod
+    def getTimes() -> (float, float):
+        """
+        This method returns the current wall and CPU time, which are passed to record() after a frame.
+
+        Tests:
+            - CPU-Zeit des gesamten Prozesses wird verwendet
+            - Zeiten steigen monoton
+
+        Returns: The wall time and the CPU time of the process in seconds
+        """
+
+        return perf_counter(), process_time()
+
+    @classmethod
+    def record(cls, screen, start, idle) -> None:
+        """
+        This method adds a frame of a screen, including the time it waited for input afterwards.
+
+        Tests:
+            - Frame wird dem richtigen Bildschirm zugeordnet
+            - Wartezeit wird aufsummiert
+
+        Args:
+            screen (str): The name of the screen
+            start (tuple[float, float]): The wall and CPU time before the frame, see getTimes()
+            idle (float): The time in seconds the screen waited for input
+
+        Returns: None
+        """
+
+        wallTime, cpuTime = perf_counter(), process_time()
+
+        times = cls.screens.get(screen)
+        if times is None:
+            times = cls.screens[screen] = [0, 0.0, 0.0, 0.0]
+
+        times[0] += 1
+        times[1] += wallTime - start[0]
+        times[2] += cpuTime - start[1]
+        times[3] += idle
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        This method logs and returns the CPU usage of every screen. The usage includes the threads of the process,
+        e.g. prefetching assets in the menu.
+
+        Tests:
+            - Alle Bildschirme sind enthalten
+            - Auslastung wird in Prozent einer CPU angegeben
+
+        Returns: A dict containing the frames, the shown seconds, the CPU usage and the waiting share in percent of
+            every screen
+        """
+
+        stats = {}
+        for screen, (frames, wallTime, cpuTime, idle) in cls.screens.items():
+            stats[screen] = {
+                "frames": frames,
+                "seconds": wallTime,
+                "cpu": cpuTime / wallTime * 100 if wallTime else 0.0,
+                "idle": idle / wallTime * 100 if wallTime else 0.0
+            }
+
+            logger.info(
+                "CPU usage of {}: {:.1f}% over {:.1f}s and {} frames, waited for input {:.0f}% of the time",
+                screen, stats[screen]["cpu"], wallTime, frames, stats[screen]["idle"]
+            )
+
+        return stats
@@ -0,0 +1,436 @@
+"""
+    file: replay.py
+    description: Contains the Recorder saving the input of a game together with the seed of its random generators in
+    a compact binary file and the Replayer feeding a recording back to the game, headless and as fast as possible.
+    Checksums of the game state are saved every few steps, so a replay can verify that it reproduces the same game.
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+import json
+import os
+import struct
+import zlib
+from datetime import datetime
+
+import pygame
+from loguru import logger
+
+from config import Configuration
+from engine import Engine
+
+MAGIC = b"SKRP"
+VERSION = 1
+
+# Recorded event types, the index is saved in the file. Every other event is ignored
+EVENT_TYPES = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP
+)
+
+# Layout of the data of every event type, little endian
+EVENT_FORMATS = {
+    pygame.QUIT: struct.Struct("<"),
+    pygame.KEYDOWN: struct.Struct("<IH"),  # key, mod
+    pygame.KEYUP: struct.Struct("<IH"),
+    pygame.MOUSEMOTION: struct.Struct("<hhhhB"),  # pos, rel, pressed buttons as bits
+    pygame.MOUSEBUTTONDOWN: struct.Struct("<hhB"),  # pos, button
+    pygame.MOUSEBUTTONUP: struct.Struct("<hhB")
+}
+
+
+def encodeEvent(event) -> bytes:
+    """
+    This function encodes a pygame event to bytes.
+
+    Tests:
+        - Kodierte Events ergeben dekodiert wieder das selbe Event
+        - Nur aufgezeichnete Eventtypen werden kodiert
+
+    Args:
+        event (pygame.event.Event): The event, its type has to be in EVENT_TYPES
+
+    Returns: The type index followed by the data of the event
+    """
+
+    eventFormat = EVENT_FORMATS[event.type]
+
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        data = eventFormat.pack(event.key, event.mod)
+    elif event.type == pygame.MOUSEMOTION:
+        buttons = sum(bool(pressed) << index for index, pressed in enumerate(event.buttons))
+        data = eventFormat.pack(*event.pos, *event.rel, buttons)
+    elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        data = eventFormat.pack(*event.pos, event.button)
+    else:
+        data = eventFormat.pack()
+
+    return bytes([EVENT_TYPES.index(event.type)]) + data
+
+
+def decodeEvent(data, offset) -> (pygame.event.Event, int):
+    """
+    This function decodes a pygame event encoded by encodeEvent().
+
+    Tests:
+        - Alle Attribute werden wiederhergestellt
+        - Offset zeigt danach auf das nächste Event
+
+    Args:
+        data (bytes): The data of the recording
+        offset (int): The position of the event in data
+
+    Returns: The event and the offset of the next event
+    """
+
+    eventType = EVENT_TYPES[data[offset]]
+    eventFormat = EVENT_FORMATS[eventType]
+    values = eventFormat.unpack_from(data, offset + 1)
+    offset += 1 + eventFormat.size
+
+    if eventType in (pygame.KEYDOWN, pygame.KEYUP):
+        event = pygame.event.Event(eventType, key=values[0], mod=values[1], unicode="", scancode=0)
+    elif eventType == pygame.MOUSEMOTION:
+        buttons = tuple(int(values[4] >> index & 1) for index in range(3))
+        event = pygame.event.Event(eventType, pos=values[0:2], rel=values[2:4], buttons=buttons)
+    elif eventType in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        event = pygame.event.Event(eventType, pos=values[0:2], button=values[2])
+    else:
+        event = pygame.event.Event(eventType)
+
+    return event, offset
+
+
+def getChecksum(game) -> int:
+    """
+    This function returns the checksum of the state of a game.
+
+    Tests:
+        - Gleicher Zustand ergibt die selbe Prüfsumme
+        - Unterschiedlicher Zustand ergibt eine andere Prüfsumme
+
+    Args:
+        game (util.Game): The game
+
+    Returns: The CRC32 of the state returned by game.getState()
+    """
+
+    return zlib.crc32(repr(game.getState()).encode())
+
+
+class Recording:
+    def __init__(self, game, options, seed):
+        """
+        This class contains the input of a game. The events are saved per game step, the events of a step were
+        handled right before it. Frames without a step are merged into the next step, frames with multiple steps leave
+        the later steps empty. This way a recording is independent of the frame rate.
+
+        Tests:
+            - Gespeicherte Aufnahme ergibt geladen die selbe Aufnahme
+            - Ungültige Dateien werden abgelehnt
+
+        Args:
+            game (str): The name of the game
+            options (dict): The keyword arguments of the constructor of the game
+            seed (int): The seed of the random generators
+        """
+
+        self.game = game
+        self.options = options
+        self.seed = seed
+
+        self.length = 0  # Number of steps
+        self.events = {}  # Events of every step that has some
+        self.checkpoints = {}  # Checksum of the state of the game before every Configuration.REPLAY_CHECKPOINT_INTERVAL step
+        self.final = 0  # Checksum of the state of the game after it has ended
+
+    def save(self, path) -> None:
+        """
+        This method saves the recording to a binary file.
+
+        Tests:
+            - Ordner wird bei Bedarf angelegt
+            - Datei enthält alle Schritte mit Events
+
+        Args:
+            path (str): The path of the file
+
+        Returns: None
+        """
+
+        name = self.game.encode()
+        options = json.dumps(self.options).encode()
+
+        data = bytearray()
+        data += struct.pack("<4sBIB", MAGIC, VERSION, self.seed, len(name)) + name
+        data += struct.pack("<H", len(options)) + options
+        data += struct.pack("<III", self.length, self.final, len(self.events))
+
+        for step, events in sorted(self.events.items()):
+            data += struct.pack("<IH", step, len(events))
+            for event in events:
+                data += encodeEvent(event)
+
+        data += struct.pack("<I", len(self.checkpoints))
+        for step, checksum in sorted(self.checkpoints.items()):
+            data += struct.pack("<II", step, checksum)
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(data)
+
+    @classmethod
+    def load(cls, path):
+        """
+        This method loads a recording from a binary file.
+
+        Tests:
+            - Alle Werte werden korrekt gelesen
+            - Falsche Dateien oder Versionen führen zu einem ValueError
+
+        Args:
+            path (str): The path of the file
+
+        Returns (Recording): The recording
+        """
+
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, seed, nameLength = struct.unpack_from("<4sBIB", data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is no recording of version {VERSION}")
+        offset = struct.calcsize("<4sBIB")
+
+        game = data[offset:offset + nameLength].decode()
+        offset += nameLength
+
+        optionsLength, = struct.unpack_from("<H", data, offset)
+        offset += 2
+        options = json.loads(data[offset:offset + optionsLength].decode())
+        offset += optionsLength
+
+        recording = cls(game, options, seed)
+        recording.length, recording.final, stepCount = struct.unpack_from("<III", data, offset)
+        offset += 12
+
+        for _ in range(stepCount):
+            step, eventCount = struct.unpack_from("<IH", data, offset)
+            offset += 6
+
+            events = []
+            for _ in range(eventCount):
+                event, offset = decodeEvent(data, offset)
+                events.append(event)
+            recording.events[step] = events
+
+        checkpointCount, = struct.unpack_from("<I", data, offset)
+        offset += 4
+        for _ in range(checkpointCount):
+            step, checksum = struct.unpack_from("<II", data, offset)
+            offset += 8
+            recording.checkpoints[step] = checksum
+
+        return recording
+
+
+class Recorder:
+    def __init__(self, directory=Configuration.REPLAY_DIRECTORY):
+        """
+        An event source recording the input of every game started while it is set as Engine.eventSource. The events
+        of the menu aren't recorded. Every game is saved to its own file once it has ended.
+        Input of the pause menu is recorded at the paused step, but can't be replayed without the menu. That's why
+        its "Resume Playing" button presses ESC, which is recorded and resumes the replayed game as well.
+
+        Tests:
+            - Events werden unverändert an das Spiel weitergegeben
+            - Jedes Spiel wird in einer eigenen Datei gespeichert
+
+        Args:
+            directory (str): The folder to save the recordings to
+        """
+
+        self.directory = directory
+        self.game = None
+        self.recording = None
+        self.paths = []
+
+        # The events are read from the window, static scenes may wait for them
+        self.isLive = True
+
+    def getEvents(self, game) -> list:
+        """
+        This method returns the events of the window and records them if a game is running.
+
+        Tests:
+            - Events werden dem nächsten Schritt zugeordnet
+            - Prüfsumme wird nur beim ersten Aufruf eines Schritts gespeichert
+
+        Args:
+            game (util.Game): The game requesting the events
+
+        Returns: The events of the window
+        """
+
+        events = Engine.getEvents()
+
+        # Neither the menu nor the name input after the game is recorded
+        if game.game == "" or not game.isRunning:
+            return events
+
+        if game is not self.game:
+            self.game = game
+            self.recording = Recording(game.game, game.getOptions(), game.seed)
+
+        step = game.ticks
+        if step % Configuration.REPLAY_CHECKPOINT_INTERVAL == 0 and step not in self.recording.checkpoints:
+            self.recording.checkpoints[step] = getChecksum(game)
+
+        recorded = [event for event in events if event.type in EVENT_TYPES]
+        if recorded:
+            self.recording.events.setdefault(step, []).extend(recorded)
+
+        return events
+
+    def leave(self, game) -> None:
+        """
+        This method saves the recording of a game once it has ended.
+
+        Tests:
+            - Nur das aufgezeichnete Spiel wird gespeichert
+            - Endzustand wird in der Aufnahme gespeichert
+
+        Args:
+            game (util.Game): The game that has ended
+
+        Returns: None
+        """
+
+        if game is not self.game:
+            return
+
+        self.recording.length = game.ticks
+        self.recording.final = getChecksum(game)
+
+        path = os.path.join(self.directory, f"{game.game}-{datetime.now():%Y-%m-%d_%H-%M-%S}.replay")
+        self.recording.save(path)
+        self.paths.append(path)
+
+        logger.info("Saved recording of {} with {} steps to {}", game.game, game.ticks, path)
+
+        self.game = None
+        self.recording = None
+
+
+class Replayer:
+    def __init__(self, recording):
+        """
+        An event source feeding the events of a recording back to a game, step by step. The game is quit after the
+        last recorded step. The state of the game is compared against the checksums of the recording.
+
+        Tests:
+            - Events werden im richtigen Schritt zurückgegeben
+            - Abweichungen vom aufgezeichneten Zustand werden erkannt
+
+        Args:
+            recording (Recording): The recording to replay
+        """
+
+        self.recording = recording
+        self.lastStep = None
+        self.mismatches = []
+        self.isIdentical = None
+
+    def getEvents(self, game) -> list:
+        """
+        This method returns the recorded events of the next step of the game and compares its state.
+
+        Tests:
+            - Events jedes Schritts werden nur einmal zurückgegeben
+            - Nach dem letzten Schritt wird das Spiel beendet
+
+        Args:
+            game (util.Game): The game requesting the events
+
+        Returns: The events of the step
+        """
+
+        step = game.ticks
+
+        # The game is still paused or the recording has ended
+        if step == self.lastStep or step > self.recording.length:
+            return [pygame.event.Event(pygame.QUIT)]
+        self.lastStep = step
+
+        checksum = self.recording.checkpoints.get(step)
+        if checksum is not None and checksum != getChecksum(game):
+            self.mismatches.append(step)
+
+        events = self.recording.events.get(step, [])
+        if step == self.recording.length:
+            events = events + [pygame.event.Event(pygame.QUIT)]
+
+        return events
+
+    def leave(self, game) -> None:
+        """
+        This method compares the final state of the game once it has ended and logs the result.
+
+        Tests:
+            - Gleicher Endzustand ergibt ein identisches Ergebnis
+            - Erster abweichender Schritt wird geloggt
+
+        Args:
+            game (util.Game): The game that has ended
+
+        Returns: None
+        """
+
+        if game.ticks != self.recording.length or getChecksum(game) != self.recording.final:
+            self.mismatches.append(game.ticks)
+
+        self.isIdentical = not self.mismatches
+
+        if self.isIdentical:
+            logger.info("Replay of {} reproduced all {} steps", self.recording.game, self.recording.length)
+        else:
+            logger.warning("Replay of {} diverged at step {}", self.recording.game, self.mismatches[0])
+
+
+def replay(path, render=False) -> Replayer:
+    """
+    This function replays a recording headless and as fast as possible.
+
+    Tests:
+        - Spiel wird mit Seed und Optionen der Aufnahme gestartet
+        - Event-Quelle und Seed werden danach zurückgesetzt
+
+    Args:
+        path (str): The path of the recording
+        render (bool): Specifies whether a frame is drawn to the dummy display after every step, e.g. for profiling
+
+    Returns: The replayer containing the result of the comparison
+    """
+
+    from util import runHeadless
+
+    recording = Recording.load(path)
+    replayer = Replayer(recording)
+
+    Engine.seed = recording.seed
+    Engine.eventSource = replayer
+    try:
+        game = runHeadless(recording.game, 0, render, **recording.options)
+    finally:
+        Engine.seed = None
+        Engine.eventSource = None
+
+    logger.info("Replayed {} at {:.0f} steps/s", path, game.stepsPerSecond)
+
+    return replayer
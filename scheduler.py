@@ -0,0 +1,191 @@
+"""
+    file: scheduler.py
+    description: Contains the Scheduler running delayed and repeating callbacks of a game inside its game loop. The
+    timers are keyed by game time, so they pause with the game and fire at the same step in every run.
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+import heapq
+
+from config import Configuration
+
+
+class ScheduledTimer:
+    def __init__(self, name, callback, dueTick, interval=0):
+        """
+        A callback waiting in the Scheduler of a game. Returned by Game.schedule() to cancel it later.
+
+        Tests:
+            - Variablen werden korrekt angelegt
+            - Wiederholende Timer haben ein Intervall größer 0
+
+        Args:
+            name (str): The name of the timer, shown when debugging
+            callback (callable): Called without arguments once the timer is due
+            dueTick (int): The game step the timer fires at
+            interval (int): The steps between two calls of a repeating timer, 0 fires only once
+        """
+
+        self.name = name
+        self.callback = callback
+        self.dueTick = dueTick
+        self.interval = interval
+        self.isCancelled = False
+
+    def cancel(self) -> None:
+        """
+        This method cancels the timer. It stays in the heap until it is due, but isn't called anymore.
+
+        Tests:
+            - Abgebrochener Timer wird nicht mehr aufgerufen
+            - Wiederholender Timer wird nicht erneut eingeplant
+
+        Returns: None
+        """
+
+        self.isCancelled = True
+
+
+class Scheduler:
+    def __init__(self):
+        """
+        A heap of timers ordered by the game step they are due at. It is advanced by the game loop after every step,
+        there are no threads and callbacks always run on the main thread between two steps.
+
+        Tests:
+            - Timer werden in der Reihenfolge ihrer Fälligkeit aufgerufen
+            - Timer mit gleicher Fälligkeit in der Reihenfolge ihrer Erstellung
+        """
+
+        # Entries are (due tick, sequence number, timer), the sequence number keeps timers with the same due tick in
+        # the order they were scheduled
+        self.timers = []
+        self.sequence = 0
+
+    @staticmethod
+    def toTicks(seconds) -> int:
+        """
+        This method converts seconds of game time to game steps. A timer fires at least one step later.
+
+        Tests:
+            - Eine Sekunde entspricht Configuration.TICKRATE Schritten
+            - Verzögerung von 0 ergibt einen Schritt
+
+        Args:
+            seconds (float): The duration in seconds
+
+        Returns: The number of steps
+        """
+
+        return max(1, round(seconds * Configuration.TICKRATE))
+
+    def schedule(self, tick, delay, callback, repeat=False, name=None) -> ScheduledTimer:
+        """
+        This method adds a timer calling the callback after the given delay.
+
+        Tests:
+            - Timer wird nach der Verzögerung aufgerufen
+            - Wiederholender Timer wird im Intervall aufgerufen
+
+        Args:
+            tick (int): The current game step
+            delay (float): The delay in seconds of game time
+            callback (callable): Called without arguments once the timer is due
+            repeat (bool): Calls the callback every delay seconds until the timer is cancelled
+            name (str): The name of the timer, defaults to the name of the callback
+
+        Returns: The timer, used to cancel it
+        """
+
+        delayTicks = self.toTicks(delay)
+        timer = ScheduledTimer(
+            name or getattr(callback, "__name__", "timer"),
+            callback,
+            tick + delayTicks,
+            delayTicks if repeat else 0
+        )
+        self.push(timer)
+
+        return timer
+
+    def push(self, timer) -> None:
+        """
+        This method adds a timer to the heap.
+
+        Tests:
+            - Heap-Eigenschaft bleibt erhalten
+            - Sequenznummer wird erhöht
+
+        Args:
+            timer (ScheduledTimer): The timer to add
+
+        Returns: None
+        """
+
+        heapq.heappush(self.timers, (timer.dueTick, self.sequence, timer))
+        self.sequence += 1
+
+    def update(self, tick) -> None:
+        """
+        This method calls every timer due at the given game step. Repeating timers are scheduled again.
+
+        Tests:
+            - Nur fällige Timer werden aufgerufen
+            - Abgebrochene Timer werden entfernt ohne aufgerufen zu werden
+
+        Args:
+            tick (int): The current game step
+
+        Returns: None
+        """
+
+        timers = self.timers
+        while timers and timers[0][0] <= tick:
+            timer = heapq.heappop(timers)[2]
+            if timer.isCancelled:
+                continue
+
+            if timer.interval:
+                timer.dueTick += timer.interval
+                self.push(timer)
+
+            timer.callback()
+
+    def getPending(self, tick) -> list:
+        """
+        This method returns the timers that are still waiting, ordered by their due time. Used for debugging.
+
+        Tests:
+            - Abgebrochene Timer sind nicht enthalten
+            - Verbleibende Zeit wird korrekt berechnet
+
+        Args:
+            tick (int): The current game step
+
+        Returns: A list of tuples containing the name of every timer and the seconds until it fires
+        """
+
+        return [
+            (timer.name, (dueTick - tick) / Configuration.TICKRATE)
+            for dueTick, _, timer in sorted(self.timers)
+            if not timer.isCancelled
+        ]
+
+    def clear(self) -> None:
+        """
+        This method cancels every waiting timer.
+
+        Tests:
+            - Heap ist danach leer
+            - Abgebrochene Timer werden nicht mehr aufgerufen
+
+        Returns: None
+        """
+
+        for _, _, timer in self.timers:
+            timer.cancel()
+
+        self.timers.clear()
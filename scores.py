@@ -0,0 +1,682 @@
+"""
+    file: scores.py
+    description: Contains the ScoreStore keeping the scores of a game. Every result is appended to a log instead of
+    rewriting the csv file of the game, the scores are kept sorted in memory by the Leaderboard. The csv file is only
+    rewritten once the log is compacted.
+
+    author: Niklas Drössler, Simon Stauss
+    date: 16.10.2026
+    licence: free
+"""
+
+import csv
+import os
+import random
+from bisect import bisect_left, bisect_right
+
+from loguru import logger
+
+from config import Configuration
+
+
+class RankNode:
+    # Every score is a node, no __dict__ per node
+    __slots__ = ("key", "row", "next", "width")
+
+    def __init__(self, key, row, level):
+        """
+        A row in the RankIndex. On every level it links to the next node of that level and stores how many rows the
+        link skips.
+
+        Tests:
+            - Variablen werden korrekt angelegt
+            - Anzahl der Ebenen entspricht level
+
+        Args:
+            key (tuple): The key the rows are sorted by
+            row (tuple): The row shown in the score table
+            level (int): The number of levels the node is linked on
+        """
+
+        self.key = key
+        self.row = row
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class RankIndex:
+    MAX_LEVEL = 32
+
+    def __init__(self):
+        """
+        An indexable skip list of rows sorted by ascending key. It counts the rows before a key and finds the row at
+        a position in O(log n), inserting and removing a row takes O(log n) as well.
+
+        Tests:
+            - Rang entspricht der Anzahl kleinerer Schlüssel
+            - Zeilen bleiben nach dem Entfernen sortiert
+        """
+
+        self.head = RankNode(None, None, self.MAX_LEVEL)
+        self.levels = 1
+        self.size = 0
+
+        # The shape of the list must not depend on the seeded random generators of the games
+        self.random = random.Random(0)
+
+    def __len__(self):
+        """
+        This method returns the number of rows.
+
+        Tests:
+            - Leerer Index hat die Länge 0
+            - Länge ändert sich beim Einfügen und Entfernen
+
+        Returns: The number of rows
+        """
+
+        return self.size
+
+    def __iter__(self):
+        """
+        This method iterates over the rows in ascending order of their keys.
+
+        Tests:
+            - Reihenfolge entspricht der Sortierung
+            - Jede Zeile wird genau einmal zurückgegeben
+
+        Returns: A generator of the rows
+        """
+
+        node = self.head.next[0]
+        while node is not None:
+            yield node.row
+            node = node.next[0]
+
+    def find(self, key) -> tuple:
+        """
+        This method finds the last node before the key on every level.
+
+        Tests:
+            - Alle Knoten vor dem Schlüssel sind kleiner
+            - Positionen werden korrekt summiert
+
+        Args:
+            key (tuple): The searched key
+
+        Returns: A tuple containing the nodes and their positions, the position of the head is 0
+        """
+
+        nodes = [self.head] * self.MAX_LEVEL
+        positions = [0] * self.MAX_LEVEL
+
+        node = self.head
+        position = 0
+        for level in range(self.levels - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+
+            nodes[level] = node
+            positions[level] = position
+
+        return nodes, positions
+
+    def insert(self, key, row) -> None:
+        """
+        This method inserts a row behind every row with a smaller or equal key.
+
+        Tests:
+            - Zeile steht an der richtigen Position
+            - Breiten der Verbindungen bleiben korrekt
+
+        Args:
+            key (tuple): The key the row is sorted by, has to be unique
+            row (tuple): The row shown in the score table
+
+        Returns: None
+        """
+
+        nodes, positions = self.find(key)
+
+        # Every level is used by half of the nodes of the level below
+        level = 1
+        while level < self.MAX_LEVEL and self.random.random() < 0.5:
+            level += 1
+        self.levels = max(self.levels, level)
+
+        node = RankNode(key, row, level)
+        position = positions[0] + 1
+        for index in range(level):
+            previous = nodes[index]
+            node.next[index] = previous.next[index]
+            node.width[index] = positions[index] + previous.width[index] - positions[0]
+            previous.next[index] = node
+            previous.width[index] = position - positions[index]
+
+        # Links above the new node skip one more row
+        for index in range(level, self.levels):
+            nodes[index].width[index] += 1
+
+        self.size += 1
+
+    def remove(self, key) -> None:
+        """
+        This method removes the row with the given key.
+
+        Tests:
+            - Nur die Zeile mit dem Schlüssel wird entfernt
+            - Unbekannte Schlüssel führen zu einem KeyError
+
+        Args:
+            key (tuple): The key of the row
+
+        Returns: None
+        """
+
+        nodes, _ = self.find(key)
+
+        node = nodes[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+
+        for index in range(self.levels):
+            previous = nodes[index]
+            if previous.next[index] is node:
+                previous.width[index] += node.width[index] - 1
+                previous.next[index] = node.next[index]
+            else:
+                previous.width[index] -= 1
+
+        self.size -= 1
+
+    def countLess(self, key) -> int:
+        """
+        This method counts the rows with a smaller key.
+
+        Tests:
+            - Leerer Index ergibt 0
+            - Gleiche Schlüssel werden nicht gezählt
+
+        Args:
+            key (tuple): The compared key
+
+        Returns: The number of rows with a smaller key
+        """
+
+        _, positions = self.find(key)
+
+        return positions[0]
+
+    def select(self, index) -> RankNode:
+        """
+        This method returns the node at the given position.
+
+        Tests:
+            - Position 0 ist die kleinste Zeile
+            - Positionen außerhalb führen zu einem IndexError
+
+        Args:
+            index (int): The position starting at 0
+
+        Returns: The node at the position
+        """
+
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+
+        node = self.head
+        position = 0
+        for level in range(self.levels - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= index + 1:
+                position += node.width[level]
+                node = node.next[level]
+
+        return node
+
+
+class Leaderboard:
+    def __init__(self, size=Configuration.LEADERBOARD_SIZE):
+        """
+        The rows of a game sorted by ascending key, the best row first. Every row is kept in a RankIndex, which
+        answers the rank of a score in O(log n). The best rows are kept in a separate list bounded to size rows, so
+        the score table reads them in O(k).
+
+        Tests:
+            - Beste Zeilen entsprechen den ersten Zeilen des Index
+            - Rang einer neuen Punktzahl ist korrekt
+
+        Args:
+            size (int): The number of best rows kept in the list
+        """
+
+        self.size = size
+        self.index = RankIndex()
+
+        # Best rows and their keys at the same position
+        self.topKeys = []
+        self.topRows = []
+
+    def __len__(self):
+        """
+        This method returns the number of rows.
+
+        Tests:
+            - Entspricht der Länge des Index
+            - Liste der besten Zeilen wird nicht gezählt
+
+        Returns: The number of rows
+        """
+
+        return len(self.index)
+
+    def __iter__(self):
+        """
+        This method iterates over every row, the best row first.
+
+        Tests:
+            - Reihenfolge entspricht der Sortierung
+            - Alle Zeilen des Index werden zurückgegeben
+
+        Returns: An iterator of the rows
+        """
+
+        return iter(self.index)
+
+    def insert(self, key, row) -> None:
+        """
+        This method adds a row. It is only added to the best rows if it is better than the last of them.
+
+        Tests:
+            - Liste der besten Zeilen bleibt begrenzt
+            - Schlechtere Zeilen verändern die Liste nicht
+
+        Args:
+            key (tuple): The key the row is sorted by, has to be unique
+            row (tuple): The row shown in the score table
+
+        Returns: None
+        """
+
+        self.index.insert(key, row)
+
+        topKeys = self.topKeys
+        if len(topKeys) < self.size or key < topKeys[-1]:
+            position = bisect_right(topKeys, key)
+            topKeys.insert(position, key)
+            self.topRows.insert(position, row)
+
+            if len(topKeys) > self.size:
+                topKeys.pop()
+                self.topRows.pop()
+
+    def remove(self, key) -> None:
+        """
+        This method removes a row. If it was one of the best rows, the next row of the index moves up.
+
+        Tests:
+            - Beste Zeilen werden aus dem Index aufgefüllt
+            - Unbekannte Schlüssel führen zu einem KeyError
+
+        Args:
+            key (tuple): The key of the row
+
+        Returns: None
+        """
+
+        self.index.remove(key)
+
+        topKeys = self.topKeys
+        position = bisect_left(topKeys, key)
+        if position < len(topKeys) and topKeys[position] == key:
+            del topKeys[position]
+            del self.topRows[position]
+
+            if len(self.index) >= self.size:
+                node = self.index.select(self.size - 1)
+                topKeys.append(node.key)
+                self.topRows.append(node.row)
+
+    def getTop(self, count) -> list:
+        """
+        This method returns the best rows.
+
+        Tests:
+            - Höchstens count Zeilen werden zurückgegeben
+            - Mehr Zeilen als die Größe werden aus dem Index gelesen
+
+        Args:
+            count (int): The maximum number of rows
+
+        Returns: A list of the best rows
+        """
+
+        if count <= self.size:
+            return self.topRows[:count]
+
+        rows = []
+        for row in self.index:
+            if len(rows) == count:
+                break
+            rows.append(row)
+
+        return rows
+
+    def countLess(self, key) -> int:
+        """
+        This method counts the rows sorted before the given key.
+
+        Tests:
+            - Bester Schlüssel ergibt 0
+            - Ergebnis entspricht der Position im Index
+
+        Args:
+            key (tuple): The compared key
+
+        Returns: The number of rows with a smaller key
+        """
+
+        return self.index.countLess(key)
+
+
+class ScoreStore:
+    def __init__(self, game, headers):
+        """
+        The scores of a game. Every result is appended to the log <game>.log, which is replayed on top of the csv
+        file <game>.csv when the store is loaded. The csv file keeps its format and is rewritten once the log contains
+        Configuration.SCORE_COMPACT_INTERVAL results.
+        Games counting wins sum up the results of every player, the other games keep every single result.
+
+        Tests:
+            - Gespeicherte Ergebnisse sind nach dem Neuladen vorhanden
+            - Ergebnisse werden nach der Kompaktierung nicht doppelt gezählt
+
+        Args:
+            game (str): The name of the game
+            headers (list[str]): The headers of the csv file, the player and the score or wins
+        """
+
+        self.game = game
+        self.headers = headers
+        self.isCumulative = Configuration.WIN_HEADER in headers
+
+        self.csvPath = os.path.join(Configuration.SCORE_DIRECTORY, f"{game}.csv")
+        self.logPath = os.path.join(Configuration.SCORE_DIRECTORY, f"{game}.log")
+
+        # Results, sum and best value of every player
+        self.players = {}
+
+        # Rows sorted by their keys (-value, result), so by descending value and equal values in the order they were
+        # reached
+        self.leaderboard = Leaderboard()
+        self.rowKeys = {}  # Key of the row of every player of a cumulative game
+
+        # Results in the csv file and the log, used to number the entries of the log
+        self.results = 0
+        self.loggedResults = 0
+
+        self.load()
+
+    def load(self) -> None:
+        """
+        This method reads the csv file and replays the entries of the log that aren't part of it yet.
+
+        Tests:
+            - Fehlende oder leere Dateien ergeben einen leeren Speicher
+            - Beschädigte Einträge des Logs werden übersprungen
+
+        Returns: None
+        """
+
+        try:
+            with open(self.csvPath, newline="") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                for row in reader:
+                    try:
+                        player, value = row
+                        self.insert(player, int(float(value)))
+                    except ValueError:
+                        logger.warning("Skipped a damaged row of the CSV file of {}", self.game)
+        except FileNotFoundError:
+            logger.critical("CSV file for {} is missing", self.game)
+
+        if not self.leaderboard:
+            logger.debug("CSV file for {} is empty", self.game)
+
+        # Entries up to this number were already written to the csv file by a compaction that didn't finish
+        compacted = self.results
+
+        try:
+            with open(self.logPath) as file:
+                for line in file:
+                    try:
+                        result, player, value = line.rstrip("\n").split(",")
+                        result, value = int(result), int(value)
+                    except ValueError:
+                        logger.warning("Skipped a damaged entry of the score log of {}", self.game)
+                        continue
+
+                    if result > compacted:
+                        self.insert(player, value)
+                        self.loggedResults += 1
+        except FileNotFoundError:
+            pass
+
+        logger.info("Loaded {} scores of {}, {} from the log", len(self.leaderboard), self.game, self.loggedResults)
+
+    def add(self, player, value) -> int:
+        """
+        This method saves the result of a player. It is appended to the log, which is compacted once it is full.
+
+        Tests:
+            - Eintrag wird an das Log angehängt
+            - Sortierung bleibt erhalten
+
+        Args:
+            player (str): The name of the player
+            value (int): The score or 1 for a win
+
+        Returns: The rank of the new row, for games counting wins the rank of the total wins of the player
+        """
+
+        rank = self.getRank(self.insert(player, value))
+
+        try:
+            os.makedirs(Configuration.SCORE_DIRECTORY, exist_ok=True)
+            with open(self.logPath, "a") as file:
+                file.write(f"{self.results},{player},{value}\n")
+        except OSError:
+            logger.critical("Score could not be saved")
+            return rank
+
+        self.loggedResults += 1
+        if self.loggedResults >= Configuration.SCORE_COMPACT_INTERVAL:
+            self.compact()
+
+        return rank
+
+    def insert(self, player, value) -> int:
+        """
+        This method adds a result to the aggregates of the player and the sorted rows.
+
+        Tests:
+            - Siege eines Spielers werden summiert
+            - Gleiche Werte behalten die Reihenfolge, in der sie erreicht wurden
+
+        Args:
+            player (str): The name of the player
+            value (int): The score or the number of wins
+
+        Returns: The value of the inserted row
+        """
+
+        stats = self.players.get(player)
+        if stats is None:
+            stats = self.players[player] = {"results": 0, "total": 0, "best": value}
+
+        stats["total"] += value
+        stats["best"] = max(stats["best"], value)
+
+        # A row of a cumulative game counts as one result per win
+        if self.isCumulative:
+            stats["results"] += value
+            self.results += value
+
+            if player in self.rowKeys:
+                self.removeRow(self.rowKeys[player])
+            self.rowKeys[player] = self.insertRow(player, stats["total"])
+
+            return stats["total"]
+
+        stats["results"] += 1
+        self.results += 1
+
+        self.insertRow(player, value)
+
+        return value
+
+    def insertRow(self, player, value) -> tuple:
+        """
+        This method inserts a row into the leaderboard.
+
+        Tests:
+            - Zeile wird an der richtigen Stelle eingefügt
+            - Schlüssel ist eindeutig
+
+        Args:
+            player (str): The name of the player
+            value (int): The value shown in the row
+
+        Returns: The key of the row
+        """
+
+        key = (-value, self.results)
+        self.leaderboard.insert(key, (player, value))
+
+        return key
+
+    def removeRow(self, key) -> None:
+        """
+        This method removes the row with the given key from the leaderboard.
+
+        Tests:
+            - Nur die Zeile mit dem Schlüssel wird entfernt
+            - Sortierung bleibt erhalten
+
+        Args:
+            key (tuple[int, int]): The key returned by insertRow()
+
+        Returns: None
+        """
+
+        self.leaderboard.remove(key)
+
+    def compact(self) -> None:
+        """
+        This method writes every score to the csv file and empties the log. The csv file is replaced at once, so it
+        is never left half written.
+
+        Tests:
+            - Log ist danach leer
+            - CSV-Datei enthält alle Ergebnisse
+
+        Returns: None
+        """
+
+        temporary = f"{self.csvPath}.tmp"
+        try:
+            self.export(temporary)
+            os.replace(temporary, self.csvPath)
+
+            # If the log isn't emptied, its entries are skipped by their number on the next load
+            open(self.logPath, "w").close()
+        except OSError:
+            logger.critical("Scores of {} could not be compacted", self.game)
+            return
+
+        logger.info("Compacted {} results into the scores of {}", self.loggedResults, self.game)
+        self.loggedResults = 0
+
+    def export(self, path) -> None:
+        """
+        This method writes the scores as a csv file sorted by descending value, the format read by load().
+
+        Tests:
+            - Kopfzeile entspricht den Headern des Spiels
+            - Zeilen sind absteigend sortiert
+
+        Args:
+            path (str): The path of the csv file
+
+        Returns: None
+        """
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.headers)
+            writer.writerows(self.leaderboard)
+
+    def getTop(self, count) -> list:
+        """
+        This method returns the best rows.
+
+        Tests:
+            - Höchstens count Zeilen werden zurückgegeben
+            - Zeilen sind absteigend sortiert
+
+        Args:
+            count (int): The maximum number of rows
+
+        Returns: A list of tuples containing the player and the score or wins
+        """
+
+        return self.leaderboard.getTop(count)
+
+    def getRank(self, value) -> int:
+        """
+        This method returns the rank a score reaches, without saving it. Equal scores share a rank.
+
+        Tests:
+            - Beste Punktzahl erreicht Rang 1
+            - Gleiche Punktzahlen erhalten den gleichen Rang
+
+        Args:
+            value (int): The score or the number of wins
+
+        Returns: The rank starting at 1
+        """
+
+        # (-value,) is sorted before every key of the same value
+        return self.leaderboard.countLess((-value,)) + 1
+
+    def getPlayer(self, player) -> dict:
+        """
+        This method returns the aggregates of a player.
+
+        Tests:
+            - Unbekannte Spieler ergeben None
+            - Summe und Bestwert sind korrekt
+
+        Args:
+            player (str): The name of the player
+
+        Returns: A dict containing the number of results, the sum and the best value or None if the player is unknown
+        """
+
+        return self.players.get(player)
+
+    def isEmpty(self) -> bool:
+        """
+        This method returns whether there are no scores yet.
+
+        Tests:
+            - Neuer Speicher ist leer
+            - Nach dem ersten Ergebnis nicht mehr leer
+
+        Returns: Whether there are no scores
+        """
+
+        return not self.leaderboard
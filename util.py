@@ -9,19 +9,31 @@
 """
 
 import os
+import random
 import re
+from time import perf_counter
 
 import pygame
-from pandas import DataFrame
 from loguru import logger
 
-from pygame_textinput import TextInput
-import pygame_menu
-
 from config import Configuration, Colors
+from assets import BlitPipeline, TextureCache, TextCache, FontRegistry, Prefetcher
+from audio import AudioManager
+from engine import Engine, Scene
+from logpipeline import LogPipeline
+from perf import Startup, FrameProfiler
+from scheduler import Scheduler
+
+
+class Game(Scene):
+    # Manifest of the assets the constructor loads, prefetched by the Prefetcher while the menu is idle. Images are
+    # (path, size, colorkey) and sounds are paths, both keyed by a name. Children add their own with getAssets()
+    ASSETS = {
+        "images": {
+            "nameInput": ("images/nameInput.png", Configuration.windowSize, None)
+        }
+    }
 
-
-class Game:
     def __init__(self, game="", windowSize=Configuration.windowSize):
         """
         Superclass for every component in this application.
@@ -46,82 +58,117 @@ class Game:
         self.hasScore = True
         self.score = 0
         self.scoreX, self.scoreY = (windowSize[0] // 2, 100)
-        try:
-            self.scores = Configuration.SCORE_DATA[game]
-        except KeyError:
-            self.scores = None
-            # no logging, because the logging happens in Configuration.SCORE_DATA
+        self.scores = None  # ScoreStore of the game, loaded from Configuration.SCORE_DATA once the score is saved
 
         self.windowSize = windowSize
         self.events = None
 
         self.clock = pygame.time.Clock()
+        self.stepsPerSecond = 0.0
 
-        # Pygame specific stuff
-        pygame.init()
+        # A static game only changes on input or timers, the main loop waits for them instead of drawing the same frame
+        # again. Set it to False while something is animated
+        self.isStatic = False
+        self.inputTick = 0  # Game step of the last handled events
 
-        # Display
-        title = Configuration.windowTitle
-        if self.game != "":
-            title += f" | {self.game}"
-        pygame.display.set_caption(title)
+        # Fixed timestep: The game logic runs at Configuration.TICKRATE, drawing interpolates between two steps
+        self.ticks = 0
+        self.interpolation = 0.0
 
-        if Configuration.isFullscreen:
-            self.surface = pygame.display.set_mode(size=self.windowSize, flags=pygame.FULLSCREEN)
-        else:
-            self.surface = pygame.display.set_mode(size=self.windowSize)
+        # Delayed and repeating callbacks, run by the game loop in game time
+        self.scheduler = Scheduler()
+        self.interpolatedImages = []
+
+        # Display, mixer and fonts are initialized once by the engine and reused by every game
+        self.surface = Engine.enter(self)
+        self.switchLatency = None
+
+        # Seed the random generators, so a recording of the game can be replayed exactly
+        self.seed = Engine.getSeed()
+        random.seed(self.seed)
+
+        # Overlay of the frame profiler, rendered once per summary
+        self.profilerSummary = None
+        self.profilerOverlay = None
 
         self.backgroundImage = None
 
+        # Static layers drawn over the background image, composited once into self.backgroundSurface until one of
+        # them changes
+        self.staticLayers = []
+        self.backgroundSurface = None
+
+        # Dirty rects: Regions of the window drawn in the current and the previous frame
+        self.useDirtyRects = Configuration.DIRTY_RECTS
+        self.dirtyRects = []
+        self.prevDirtyRects = []
+        self.redrawAll = True
+
         # Music
-        pygame.mixer.init()
         self.backgroundMusic = None
         self.sounds = {}
 
         # Font
-        pygame.font.init()
         try:
-            self.defaultFont = pygame.font.SysFont("arial", 25)
+            self.defaultFont = FontRegistry.get("arial", 25)
         except():
             logger.critical("Default font could not be loaded")
 
-        # Create the pause menu
-        self.pauseMenu = pygame_menu.Menu(
-            title="Spiel pausiert",
-            width=self.windowSize[0] / 2,
-            height=self.windowSize[1] / 2,
-            theme=pygame_menu.themes.THEME_DARK  # title_close_button=False
-        )
-        self.pauseMenu.add.button("Resume Playing", self.togglePause)
-        self.pauseMenu.add.button("Quit", self.quit)
+        # Event handlers keyed by event type and key, key None handles every event of the type
+        self.bindings = {}
+        self.bind(pygame.QUIT, lambda event: self.quit())
+        self.bind(pygame.KEYDOWN, lambda event: self.togglePause(), pygame.K_ESCAPE)
+        self.bind(pygame.KEYDOWN, lambda event: self.toggleFullscreen(), pygame.K_F11)
+        self.bind(pygame.KEYDOWN, lambda event: self.toggleProfiler(), pygame.K_F3)
 
-        # Draw the pause menu by default on pause (ESC)
-        self.pauseBehaviour = self.drawMenu
+        # The window has to be drawn again once it was covered, static games wouldn't draw it otherwise
+        self.bind(pygame.WINDOWEXPOSED, lambda event: self.invalidateScreen())
+
+        # Event types handled by handleEvent() instead of a binding. None allows every event, e.g. for menus
+        self.eventTypes = set()
 
         # Create variables needed for the game end screen
 
         self.score = 0
         self.gameOverText = ""  # has to be set by the specific game
-        self.endFont = pygame.font.SysFont("arial", 50)
-        self.nameSubmit = False
+        self.endFont = FontRegistry.get("arial", 50)
         self.nameInputX, self.nameInputY = (Configuration.windowWidth // 2, Configuration.windowHeight // 2)
         try:
-            self.nameBackground = Image(
-                x=0,
-                y=0,
-                size=Configuration.windowSize,
-                image="nameInput.png",
-                hasColorkey=False
-            )
+            self.nameBackground = Image.fromAsset(0, 0, Game.ASSETS["images"]["nameInput"])
         except FileNotFoundError:
             logger.critical("File: nameInput.png could not be loaded")
 
+    @classmethod
+    def getAssets(cls) -> dict:
+        """
+        This method merges the asset manifests of the class and its parents, as every child loads the assets of its
+        parents as well.
+
+        Tests:
+            - Assets der Elternklassen sind enthalten
+            - Gleiche Namen werden durch die Kindklasse überschrieben
+
+        Returns: The images, sprite sheets and sounds loaded by the constructor of the class
+        """
+
+        assets = {"images": {}, "sheets": [], "sounds": {}}
+
+        for parent in reversed(cls.__mro__):
+            manifest = parent.__dict__.get("ASSETS", {})
+            assets["images"].update(manifest.get("images", {}))
+            assets["sheets"].extend(manifest.get("sheets", []))
+            assets["sounds"].update(manifest.get("sounds", {}))
+
+        return assets
+
     def run(self) -> None:
         """
-        Main loop of the application.
-        Calls methods self.updateEvents(), self.updateGameState() and self.updateScreen() while self.isRunning is True.
-        If self.isRunning is False, self.gameOver() will be called to ask the user for their name.
-        
+        Starts the game, called at the end of the constructor of every child.
+        The game is run by the main loop of the Engine, which calls self.frame() while the game is the active scene.
+        Only the first scene, the menu, starts the main loop and returns once the application is quit. Any later game
+        returns right away, its frames are run by the loop of the menu instead of a nested loop.
+        Headless runs are simulated by self.simulate() and return once the game has ended.
+
         !DO NOT OVERWRITE THIS METHOD!
 
         Tests:
@@ -132,40 +179,345 @@ class Game:
         """
 
         # Log the start of the gameloop
-        if self.game:
-            game = self.game
-        else:
-            game = "Menu"
-        logger.info("Start the gameloop of {}", game)
+        logger.info("Start the gameloop of {}", self.game or "Menu")
 
         # Play background music
         if self.backgroundMusic is not None:
             try:
                 pygame.mixer.music.load(self.backgroundMusic)
-            except FileNotFoundError:
+                pygame.mixer.music.set_volume(Configuration.MUSIC_VOLUME)
+                pygame.mixer.music.play(-1)
+            except (FileNotFoundError, pygame.error):
                 logger.critical("Background music could not be loaded")
-            pygame.mixer.music.set_volume(Configuration.MUSIC_VOLUME)
-            pygame.mixer.music.play(-1)
 
-        # Main loop
-        while self.isRunning:
-            self.updateEvents()
+        # Keep the events the game doesn't handle out of the event queue
+        self.allowEvents()
+
+        if Configuration.isHeadless:
+            self.simulate()
+            self.end()
+        else:
+            # Time of the last frame consumed by fixed game steps
+            self.accumulator = 0.0
+            self.previousTime = perf_counter()
+
+            # The window may still show something else, e.g. the menu or a pre-game screen
+            self.invalidateScreen()
+
+            Engine.run()
+
+    def frame(self) -> None:
+        """
+        A single frame of the main loop.
+        Calls self.updateEvents(), the number of self.step() calls the passed time requires and self.updateScreen().
+        Once self.isRunning is False, the game ends and leaves the scene stack.
 
-            if not self.isPaused:
-                self.updateGameState()
+        !DO NOT OVERWRITE THIS METHOD!
+
+        Tests:
+            - Spielgeschwindigkeit ist unabhängig von der Bildrate
+            - Spiel verlässt den Stapel, sobald es beendet wurde
+
+        Returns: None
+        """
+
+        if not self.isRunning:
+            self.end()
+            return
+
+        stepDuration = 1 / Configuration.TICKRATE
+
+        # Collect the time passed since the last frame to be consumed by fixed game steps
+        currentTime = perf_counter()
+        self.accumulator += min(currentTime - self.previousTime, Configuration.MAX_STEPS_PER_FRAME * stepDuration)
+        self.previousTime = currentTime
+
+        # The phases of the frame are only timed while the profiler is enabled
+        isProfiling = FrameProfiler.isEnabled
+        if isProfiling:
+            allocatedBlocks = FrameProfiler.getAllocatedBlocks()
+
+        self.updateEvents()
+        if isProfiling:
+            eventsEnd = perf_counter()
+
+        # Multiple steps on a slow frame, none on a fast one. The game speed stays the same
+        while self.accumulator >= stepDuration and self.isRunning and not self.isPaused:
+            self.step()
+            self.accumulator -= stepDuration
+
+        if isProfiling:
+            updateEnd = perf_counter()
+
+        # The pause menu is drawn by its own scene
+        if self.isPaused:
+            return
+
+        # Progress between the last and the next game step
+        self.interpolation = self.accumulator / stepDuration
+
+        self.drawBackground()
 
-            if self.backgroundImage is not None:
-                self.drawImageOnSurface(self.backgroundImage)
+        if isProfiling:
+            backgroundEnd = perf_counter()
+
+        self.updateScreen()
+
+        if isProfiling:
+            screenEnd = perf_counter()
+
+        # Target 60 FPS
+        self.clock.tick(Configuration.FRAMERATE)
+
+        if isProfiling:
+            FrameProfiler.record(
+                currentTime, eventsEnd, updateEnd, backgroundEnd, screenEnd, perf_counter(),
+                allocations=FrameProfiler.getAllocatedBlocks() - allocatedBlocks
+            )
+
+    def end(self) -> None:
+        """
+        This method is called once the game has ended. The game leaves the scene stack and the name input is entered
+        instead, if the score of the game is saved.
+
+        !DO NOT OVERWRITE THIS METHOD!
+
+        Tests:
+            - Ausstehende Timer werden abgebrochen
+            - Namenseingabe wird nur bei beendeten Spielen mit Score angezeigt
+
+        Returns: None
+        """
+
+        # Timers still waiting once the game has ended are never called
+        pendingTimers = self.getPendingTimers()
+        if pendingTimers:
+            logger.debug(
+                "Cancelled {} pending timers of {}: {}",
+                len(pendingTimers), self.game or "Menu",
+                ", ".join(f"{name} in {delay:.2f}s" for name, delay in pendingTimers)
+            )
+        self.scheduler.clear()
 
-            self.updateScreen()
+        # The composited background is as large as the window
+        self.backgroundSurface = None
 
-            # Target 60 FPS
-            self.clock.tick(Configuration.FRAMERATE)
+        TextureCache.report()
+        TextCache.report()
+        BlitPipeline.report()
+        AudioManager.report()
 
-        if self.isGameOver and (self.hasScore or self.showGameOver):
+        # Return to the previous scene, usually the menu
+        Engine.leave(self)
+
+        # Nobody can enter a name in a headless run
+        if self.isGameOver and (self.hasScore or self.showGameOver) and not Configuration.isHeadless:
             self.gameOver()
 
-    def updateEvents(self, nameInput=False) -> None:
+    def getIdleTimeout(self):
+        """
+        This method lets the main loop wait for input after the frame if the game is static. The game is drawn
+        continuously until a game step has followed the last input and while it has pending timers, a key is held or
+        the profiler is shown. Timers run in game time, which only passes while the game is drawn.
+
+        Tests:
+            - Animierte Spiele warten nie
+            - Statische Spiele werden nach einer Eingabe noch einmal gezeichnet
+
+        Returns (float): Configuration.IDLE_TIMEOUT if the game can wait for input, otherwise None
+        """
+
+        if (not self.isStatic or not self.isRunning or self.ticks <= self.inputTick or self.scheduler.timers
+                or FrameProfiler.isEnabled or any(pygame.key.get_pressed())):
+            return None
+
+        return Configuration.IDLE_TIMEOUT
+
+    def resume(self) -> None:
+        """
+        This method is called once the game is the active scene again, e.g. after the pause menu or a game launched
+        from the menu has ended. Nothing is created again.
+
+        Tests:
+            - Wechselzeit wird erneut gemessen
+            - Verstrichene Zeit der anderen Szene wird nicht nachgeholt
+
+        Returns: None
+        """
+
+        # Measure the time until the game draws again
+        self.switchLatency = None
+
+        self.allowEvents()
+        self.invalidateScreen()
+
+        # Don't catch up on the time spent in the other scene
+        self.previousTime = perf_counter()
+
+    def simulate(self) -> None:
+        """
+        Headless variant of the main loop.
+        Calls self.updateEvents() and self.updateGameState() as fast as possible without waiting for the next frame.
+        Nothing is drawn unless Configuration.HEADLESS_RENDER is set, then every step is followed by a frame drawn to
+        the dummy display. Stops once the game quits itself or Configuration.HEADLESS_STEPS steps were simulated.
+        The achieved steps per second are saved in self.stepsPerSecond.
+
+        !DO NOT OVERWRITE THIS METHOD!
+
+        Tests:
+            - Abbruch nach der konfigurierten Anzahl an Schritten
+            - Schritte pro Sekunde werden korrekt berechnet
+
+        Returns: None
+        """
+
+        maxSteps = Configuration.HEADLESS_STEPS
+        render = Configuration.HEADLESS_RENDER
+        steps = 0
+        startTime = perf_counter()
+
+        while self.isRunning and (maxSteps <= 0 or steps < maxSteps):
+            self.updateEvents()
+
+            # Like the main loop, no step is done after the game has been quit
+            if not self.isPaused and self.isRunning:
+                self.step()
+
+            if render:
+                self.drawBackground()
+                self.updateScreen()
+
+            LogPipeline.nextFrame()
+            steps += 1
+
+        duration = perf_counter() - startTime
+        if duration > 0:
+            self.stepsPerSecond = steps / duration
+
+        logger.info(
+            "Headless run of {} finished after {} steps in {:.2f}s ({:.0f} steps/s)",
+            self.game or "Menu", steps, duration, self.stepsPerSecond
+        )
+        LogPipeline.report()
+
+    def step(self) -> None:
+        """
+        This method advances the game by a single fixed timestep of 1 / Configuration.TICKRATE seconds.
+        The positions of interpolated images are saved beforehand to draw them between two steps, the timers due at
+        the new game time are called afterwards.
+
+        !DO NOT OVERWRITE THIS METHOD!
+
+        Tests:
+            - Spielzeit wird pro Schritt um genau einen Tick erhöht
+            - Vorherige Positionen werden vor dem Schritt gespeichert
+
+        Returns: None
+        """
+
+        for image in self.interpolatedImages:
+            image.savePosition()
+
+        self.updateGameState()
+
+        self.ticks += 1
+        self.scheduler.update(self.ticks)
+
+    def schedule(self, delay, callback, repeat=False, name=None):
+        """
+        This method calls the callback after the given delay of game time. The callback is called by the game loop
+        between two steps, so it pauses with the game and never blocks or runs on another thread.
+
+        Tests:
+            - Callback wird nach genau delay * Configuration.TICKRATE Schritten aufgerufen
+            - Während der Pause läuft der Timer nicht weiter
+
+        Args:
+            delay (float): The delay in seconds of game time
+            callback (callable): Called without arguments
+            repeat (bool): Calls the callback every delay seconds until the timer is cancelled
+            name (str): The name of the timer shown when debugging, defaults to the name of the callback
+
+        Returns (scheduler.ScheduledTimer): The timer, call its cancel() method to cancel it
+        """
+
+        return self.scheduler.schedule(self.ticks, delay, callback, repeat, name)
+
+    def getPendingTimers(self) -> list:
+        """
+        This method returns the timers that are still waiting. They are shown in the overlay of the frame profiler.
+
+        Tests:
+            - Timer sind nach Fälligkeit sortiert
+            - Abgebrochene Timer sind nicht enthalten
+
+        Returns: A list of tuples containing the name of every timer and the seconds of game time until it fires
+        """
+
+        return self.scheduler.getPending(self.ticks)
+
+    def getGameTime(self) -> float:
+        """
+        This method returns the simulated time of the game. It only advances while the game is not paused and is
+        independent of the frame rate.
+
+        Tests:
+            - Wert entspricht der Anzahl der Schritte geteilt durch die Tickrate
+            - Pausen werden nicht mitgezählt
+
+        Returns: The game time in seconds
+        """
+
+        return self.ticks / Configuration.TICKRATE
+
+    def getState(self) -> tuple:
+        """
+        This method returns the state of the game, which is compared when a recording is replayed. Children add their
+        own state to it.
+
+        Tests:
+            - Gleicher Spielverlauf ergibt den selben Zustand
+            - Zustand enthält nur unveränderliche Werte
+
+        Returns: A tuple containing the ticks, score and whether the game is over
+        """
+
+        return self.ticks, self.score, self.isGameOver
+
+    def getOptions(self) -> dict:
+        """
+        This method returns the arguments needed to construct the game again, e.g. to replay a recording.
+
+        Tests:
+            - Spiel kann mit den Argumenten erneut erstellt werden
+            - Spiele ohne Argumente liefern ein leeres Dict
+
+        Returns: The keyword arguments of the constructor
+        """
+
+        return {}
+
+    def addInterpolatedImages(self, *images) -> None:
+        """
+        This method registers images whose drawn position is interpolated between the last two game steps.
+        Use it for smoothly moving images, not for images jumping between fields.
+
+        Tests:
+            - Bilder werden korrekt registriert
+            - Registrierte Bilder werden zwischen zwei Schritten gezeichnet
+
+        Args:
+            images (Image): The images to interpolate
+
+        Returns: None
+        """
+
+        for image in images:
+            image.interpolate = True
+            image.savePosition()
+            self.interpolatedImages.append(image)
+
+    def updateEvents(self) -> None:
         """
         This functions gets every pygame event and handles quit and pause.
         Unhandled Events are passed down to self.handleEvent() to be handled by children classes.
@@ -176,46 +528,77 @@ class Game:
             - Nur Events abfangen, die in Kinderklassen nicht benötigt werden
             - Kein Event überspringen / Nicht beachten -> Logging überprüfen
 
-        Args:
-            nameInput (bool): Specifies whether the game is currently waiting for the user to input their name
-
         Returns: None
         """
 
-        self.events = pygame.event.get()
+        # Scripted or replayed events replace the events of the window
+        if Engine.eventSource is not None:
+            self.events = Engine.eventSource.getEvents(self)
+        else:
+            self.events = Engine.getEvents()
+
+        if self.events:
+            self.inputTick = self.ticks
+
+        bindings = self.bindings
 
         # Loop through every event
         for event in self.events:
-            eventHandled = False
+            # A handler bound to the key of the event takes precedence over one bound to the whole event type
+            handler = bindings.get((event.type, getattr(event, "key", None)))
+            if handler is None:
+                handler = bindings.get((event.type, None))
+
+            if handler is not None:
+                handler(event)
+            else:
+                # Further event handling
+                self.handleEvent(event)
+
+    def bind(self, eventType, handler, key=None) -> None:
+        """
+        This method binds a handler to an event type and optionally a key. Bound events are dispatched by a lookup
+        in self.bindings instead of being passed to self.handleEvent(). The event type is allowed on the event queue
+        while the game is running.
 
-            if event.type == pygame.QUIT:
-                self.quit()
-                eventHandled = True
+        Tests:
+            - Handler wird bei passendem Event aufgerufen
+            - Spätere Bindung ersetzt eine frühere mit gleichem Typ und Taste
 
-            if event.type == pygame.KEYDOWN:
-                # Toggle pause on ESC
-                if event.key == pygame.K_ESCAPE:
-                    self.togglePause()
-                    eventHandled = True
+        Args:
+            eventType (int): The type of the event, e.g. pygame.KEYDOWN
+            handler (callable): Called with the event
+            key (int): The key of the event, e.g. pygame.K_UP. None handles every event of the type
 
-                # Toggle Fullscreen on F11
-                elif event.key == pygame.K_F11:
-                    self.toggleFullscreen()
-                    eventHandled = True
+        Returns: None
+        """
 
-                # Enter name on Enter
-                elif event.key == pygame.K_RETURN and nameInput:
-                    self.nameSubmit = True
-                    eventHandled = True
+        self.bindings[(eventType, key)] = handler
 
-            if not eventHandled:
-                # Further event handling
-                self.handleEvent(event)
+    def allowEvents(self, everyEvent=False) -> None:
+        """
+        This method keeps every event type out of the event queue that isn't bound or listed in self.eventTypes.
+
+        Tests:
+            - Nur benötigte Eventtypen landen in der Warteschlange
+            - Menüs erhalten alle Events
+
+        Args:
+            everyEvent (bool): Allows every event type, e.g. while a menu or the name input is shown
+
+        Returns: None
+        """
+
+        if everyEvent or self.eventTypes is None:
+            pygame.event.set_allowed(None)
+        else:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list({eventType for eventType, key in self.bindings} | self.eventTypes))
 
     def handleEvent(self, event) -> None:
         """
-        This method specifies game-specific behavior on pygame events.
-        Overwrite this method in your class!
+        This method specifies game-specific behavior on pygame events, that aren't bound with self.bind().
+        Overwrite this method in your class and add the handled event types to self.eventTypes!
 
         Tests:
             - Korrektes Logging des Events
@@ -253,18 +636,161 @@ class Game:
         Returns: None
         """
 
-        if self.isPaused:
-            self.pauseBehaviour()
+        if self.hasScore:
+            # Print score at a given position
+            self.drawTextOnSurface(f"Score: {self.score}", (self.scoreX, self.scoreY))
+
+        if FrameProfiler.isEnabled:
+            self.drawProfiler()
+
+        # Menus are drawn over the whole window
+        if self.redrawAll or not self.useDirtyRects:
+            pygame.display.update()
+            self.redrawAll = False
+        else:
+            # Update where something was drawn now and where something was drawn in the previous frame
+            pygame.display.update(self.prevDirtyRects + self.dirtyRects)
+
+        if self.switchLatency is None:
+            self.switchLatency = Engine.markFirstFrame(self)
+
+        # Reuse the lists to avoid allocating new ones every frame
+        self.prevDirtyRects, self.dirtyRects = self.dirtyRects, self.prevDirtyRects
+        self.dirtyRects.clear()
+
+    def drawBackground(self) -> None:
+        """
+        This method draws the background image and the static layers, composited into a single surface. Only the
+        regions which were drawn over in the previous frame are restored if dirty rects are used, the rest of the
+        window still contains the background.
+
+        Tests:
+            - Hintergrund wird beim ersten Frame vollständig gezeichnet
+            - Nur die Bereiche des letzten Frames werden wiederhergestellt
+
+        Returns: None
+        """
+
+        if self.backgroundImage is None and not self.staticLayers:
+            return
+
+        if self.backgroundSurface is None:
+            self.composeBackground()
+
+        background = self.backgroundSurface
+
+        if self.redrawAll or not self.useDirtyRects:
+            self.surface.blit(background, (0, 0))
+        else:
+            for rect in self.prevDirtyRects:
+                self.surface.blit(background, rect, rect)
+
+    def composeBackground(self) -> None:
+        """
+        This method composites the background image and every static layer, in the order they were added, into
+        self.backgroundSurface. It is called by drawBackground() once the background has been invalidated.
+
+        Tests:
+            - Ebenen werden in der Reihenfolge ihres Hinzufügens gezeichnet
+            - Ohne Hintergrundbild ist der Hintergrund schwarz
+
+        Returns: None
+        """
+
+        self.backgroundSurface = pygame.Surface(self.surface.get_size()).convert()
+
+        if self.backgroundImage is not None:
+            self.backgroundSurface.blit(self.backgroundImage.getImage(), self.backgroundImage.getRect())
+
+        for drawLayer in self.staticLayers:
+            drawLayer(self.backgroundSurface)
+
+    def addStaticLayer(self, drawLayer) -> None:
+        """
+        This method adds a static layer to the background. A static layer contains everything that doesn't change
+        from frame to frame, e.g. the field of a game. It is only drawn again once the background has been
+        invalidated, every other frame just restores it from the composited background.
+
+        Tests:
+            - Ebene wird beim nächsten Frame gezeichnet
+            - Ebene wird nicht in jedem Frame neu gezeichnet
+
+        Args:
+            drawLayer (callable): Called with the surface of the background to draw the layer on
+
+        Returns: None
+        """
+
+        self.staticLayers.append(drawLayer)
+        self.invalidateBackground()
+
+    def removeStaticLayer(self, drawLayer) -> None:
+        """
+        This method removes a static layer from the background.
+
+        Tests:
+            - Ebene ist ab dem nächsten Frame nicht mehr zu sehen
+            - Andere Ebenen bleiben erhalten
+
+        Args:
+            drawLayer (callable): The layer added with addStaticLayer()
+
+        Returns: None
+        """
+
+        self.staticLayers.remove(drawLayer)
+        self.invalidateBackground()
+
+    def invalidateBackground(self) -> None:
+        """
+        This method forces the next frame to composite the background again. Call it once something a static layer
+        draws has changed.
+
+        Tests:
+            - Hintergrund wird beim nächsten Frame neu zusammengesetzt
+            - Das ganze Fenster wird aktualisiert
+
+        Returns: None
+        """
+
+        self.backgroundSurface = None
+        self.invalidateScreen()
+
+    def markDirty(self, rect) -> None:
+        """
+        This method marks a region of the window as changed, so that it is updated on the display with the next frame.
+        Drawing with drawTextOnSurface() and drawImageOnSurface() marks the regions automatically.
+
+        Tests:
+            - Region wird im aktuellen und im nächsten Frame aktualisiert
+            - Keine Auswirkung, wenn das ganze Fenster aktualisiert wird
+
+        Args:
+            rect (pygame.rect.Rect): The changed region
+
+        Returns: None
+        """
+
+        self.dirtyRects.append(rect)
+
+    def invalidateScreen(self) -> None:
+        """
+        This method forces the next frame to draw the background and update the whole window, e.g. after a menu was
+        closed or static elements changed.
+
+        Tests:
+            - Nächster Frame aktualisiert das ganze Fenster
+            - Danach werden wieder nur die Dirty Rects aktualisiert
 
-        if self.hasScore:
-            # Print score at a given position
-            self.drawTextOnSurface(f"Score: {self.score}", (self.scoreX, self.scoreY))
+        Returns: None
+        """
 
-        pygame.display.update()
+        self.redrawAll = True
 
-    def drawTextOnSurface(self, text, position, color=Colors.White, font=None, surface=None, center=True) -> None:
+    def drawTextOnSurface(self, text, position, color=Colors.White, font=None, surface=None, center=True,
+                          markDirty=True) -> None:
         """
-        This method draws a given text on a surface.
+        This method draws a given text on a surface. The rendered text is reused from the TextCache.
 
         Tests:
             - Korrekte Defaultparameter
@@ -279,6 +805,7 @@ class Game:
             surface (pygame.surface.Surface): The surface to draw the text on. Defaults to the default surface of the
                 class
             center (Boolean): When True, center of the text is moved to position, defaults to True
+            markDirty (Boolean): When True, the drawn region is updated on the display. Disable for static elements
 
         Returns: None
         """
@@ -289,15 +816,18 @@ class Game:
         if font is None:
             font = self.defaultFont
 
-        textSurface = font.render(text, True, color)
+        textSurface = TextCache.render(font, text, color)
 
         if center:
             textRect = textSurface.get_rect()
             position = (position[0] - textRect.width / 2, position[1] - textRect.height / 2)
 
-        surface.blit(textSurface, position)
+        rect = self.blit(surface, textSurface, position)
 
-    def drawImageOnSurface(self, image, position=None, surface=None) -> None:
+        if markDirty and surface is self.surface:
+            self.dirtyRects.append(rect)
+
+    def drawImageOnSurface(self, image, position=None, surface=None, markDirty=True) -> None:
         """
         This method draws a given image on a surface.
 
@@ -311,17 +841,51 @@ class Game:
              class
             surface (pygame.surface.Surface): The surface to draw the image on. Defaults to the default surface of the
              game
+            markDirty (Boolean): When True, the drawn region is updated on the display. Disable for static elements
 
         Returns: None
         """
 
         if position is None:
-            position = image.getRect()
+            if image.interpolate:
+                position = image.getInterpolatedPos(self.interpolation)
+            else:
+                position = image.getRect()
 
         if surface is None:
             surface = self.surface
 
-        surface.blit(image.getImage(), position)
+        rect = self.blit(surface, image.getImage(), position)
+
+        if markDirty and surface is self.surface:
+            self.dirtyRects.append(rect)
+
+    @staticmethod
+    def blit(surface, source, position) -> pygame.rect.Rect:
+        """
+        This method draws a surface on another one. While the FrameProfiler is enabled, the blit is timed for the
+        report of the BlitPipeline.
+
+        Tests:
+            - Ergebnis entspricht surface.blit()
+            - Unvorbereitete Surfaces werden nur bei aktivem Profiler erfasst
+
+        Args:
+            surface (pygame.surface.Surface): The surface to draw on
+            source (pygame.surface.Surface): The surface to draw
+            position: The position to draw the surface at
+
+        Returns: The drawn region
+        """
+
+        if not FrameProfiler.isEnabled:
+            return surface.blit(source, position)
+
+        start = perf_counter()
+        rect = surface.blit(source, position)
+        BlitPipeline.track(source, perf_counter() - start)
+
+        return rect
 
     def drawMenu(self, menu=None) -> None:
         """
@@ -338,16 +902,31 @@ class Game:
         """
 
         if not menu:
-            menu = self.pauseMenu
+            menu = self.getPauseMenu()
 
         # Pass events to the menu und draw it onto the surface if enabled
         if menu.is_enabled():
             menu.update(self.events)
             menu.draw(self.surface)
 
+    def getPauseMenu(self):
+        """
+        This method returns the pause menu, which is shared by every game through the engine.
+
+        Tests:
+            - Menü wird nur einmal erstellt
+            - Buttons rufen die Methoden des aktiven Spiels auf
+
+        Returns (pygame_menu.Menu): The pause menu
+        """
+
+        return Engine.getPauseMenu()
+
     def togglePause(self) -> None:
         """
         This method toggles self.isPaused and is called once the user pressed the ESC-key.
+        Pausing enters the pause menu as a scene on top of the game, it leaves the stack again once the game is
+        resumed.
 
         Tests:
             - Toggle der Variable immer fehlerlos
@@ -358,6 +937,17 @@ class Game:
 
         self.isPaused = not self.isPaused
 
+        # The pause menu needs every event
+        self.allowEvents(self.isPaused)
+
+        # Remove the pause menu from the window
+        self.invalidateScreen()
+
+        # A headless run is only paused, there is no window to show the menu in. Resuming through the menu presses
+        # ESC, so a replay resumes at the same step
+        if self.isPaused and not Configuration.isHeadless:
+            PauseScene(self)
+
         # Only log if game is not over and not in the main menu
         if not self.isGameOver and self.game != "":
             if self.isPaused:
@@ -365,6 +955,80 @@ class Game:
             else:
                 logger.info("The game was unpaused")
 
+    def toggleProfiler(self) -> None:
+        """
+        This method toggles the frame profiler and its overlay. It is called once the user pressed the F3-key.
+
+        Tests:
+            - Overlay wird nach dem Deaktivieren entfernt
+            - Profiler wird für alle Spiele gemeinsam umgeschaltet
+
+        Returns: None
+        """
+
+        FrameProfiler.toggle()
+        if not FrameProfiler.isEnabled:
+            BlitPipeline.report()
+
+        # Remove the overlay from the window
+        self.invalidateScreen()
+
+    def drawProfiler(self) -> None:
+        """
+        This method draws the overlay of the frame profiler in the top left corner of the window. It shows the FPS,
+        the p50 and p99 frame time, the allocations per frame, a bar for the average duration of every phase of a frame
+        and the pending timers.
+        The overlay is only rendered again once the profiler has a new summary.
+
+        Tests:
+            - Overlay wird nur bei neuer Zusammenfassung neu gerendert
+            - Balken sind relativ zur Dauer eines Frames bei Configuration.FRAMERATE
+
+        Returns: None
+        """
+
+        summary = FrameProfiler.getSummary()
+        if summary is None:
+            return
+
+        if summary is not self.profilerSummary:
+            self.profilerSummary = summary
+
+            lineHeight = self.defaultFont.get_linesize()
+            width, barWidth = 600, 200
+            self.profilerOverlay = pygame.Surface((width, lineHeight * (len(summary["phases"]) + 2) + 10)).convert()
+            self.profilerOverlay.set_alpha(200)
+
+            # The text changes with every summary, so it isn't rendered through the TextCache
+            text = f"{summary['fps']:.0f} FPS | p50 {summary['p50']:.1f} ms | p99 {summary['p99']:.1f} ms | " \
+                   f"{summary['allocations']:.1f} allocs"
+            self.profilerOverlay.blit(self.defaultFont.render(text, True, Colors.White), (5, 5))
+
+            # One bar per phase, the full bar is the duration of a frame at the target framerate
+            frameDuration = 1000 / Configuration.FRAMERATE
+            for line, (phase, duration) in enumerate(summary["phases"].items(), start=1):
+                y = 5 + line * lineHeight
+                self.profilerOverlay.blit(self.defaultFont.render(phase, True, Colors.White), (5, y))
+
+                length = min(int(duration / frameDuration * barWidth), barWidth)
+                pygame.draw.rect(self.profilerOverlay, Colors.LightGreen, (160, y + 4, max(length, 1), lineHeight - 8))
+                self.profilerOverlay.blit(
+                    self.defaultFont.render(f"{duration:.2f} ms", True, Colors.White),
+                    (170 + barWidth, y)
+                )
+
+            # The next timers of the game
+            pendingTimers = self.getPendingTimers()
+            text = f"{len(pendingTimers)} timers"
+            if pendingTimers:
+                text += ": " + ", ".join(f"{name} {delay:.1f}s" for name, delay in pendingTimers[:3])
+            self.profilerOverlay.blit(
+                self.defaultFont.render(text, True, Colors.White),
+                (5, 5 + (len(summary["phases"]) + 1) * lineHeight)
+            )
+
+        self.markDirty(self.surface.blit(self.profilerOverlay, (10, 10)))
+
     def toggleFullscreen(self, *args) -> None:
         """
         This method toggles pygame fullscreen.
@@ -389,9 +1053,11 @@ class Game:
 
         pygame.display.toggle_fullscreen()
 
-    def playSound(self, sound, volume=1.0) -> None:
+        self.invalidateScreen()
+
+    def playSound(self, sound, volume=1.0, priority=0) -> None:
         """
-        This method plays a sound.
+        This method plays a sound on a channel of the AudioManager.
 
         Tests:
             - Korrekte Wiedergabe des Sounds
@@ -400,6 +1066,7 @@ class Game:
         Args:
             sound (str): The name of the sound
             volume (float): The volume of the sound. Ranges from 0.0 to 1.0, where 1.0 is the loudest
+            priority (int): Sounds with a higher priority stop sounds with a lower one if every channel is busy
 
         Returns: None
         """
@@ -407,17 +1074,16 @@ class Game:
         sound = self.sounds[sound]
 
         if sound:
-            sound.set_volume(volume)
-            sound.play()
+            AudioManager.play(sound, volume, priority)
 
     def gameOver(self) -> None:
         """
         This method is called once the game finished.
-        It asks the user to input a name and saves their score afterwards.
+        It enters the name input for the user to input a name, their score is saved once it was submitted.
 
         Tests:
-            - Korrektes Anlegen des pandas DataFrame
-            - Korrektes Abfangen von Fehlern
+            - Namenseingabe wird als Szene betreten
+            - Spiel ist nicht mehr auf dem Stapel
 
         Returns: None
         """
@@ -425,87 +1091,35 @@ class Game:
         logger.info("Gameover in game: {game}", game=self.game)
 
         # Ask the user for their name to save the score
-        name = self.getUserName()
-
-        # Create the values to be saved to the DataFrame
-        values = {
-            Configuration.PLAYER_HEADER: name
-        }
-
-        try:
-            dataHeader = Configuration.DATA_HEADERS[self.game]
-        except KeyError:
-            dataHeader = None
-            logger.critical("Game score could not be saved")
-
-        if dataHeader:
-            for header in dataHeader:
-                if header != Configuration.PLAYER_HEADER:
-                    # Add 1 win or the score
-                    value = 1
-                    if header == Configuration.SCORE_HEADER:
-                        value = self.score
-
-                    values.update({
-                        header: [value]
-                    })
+        NameInput(self)
 
-            self.saveScore(DataFrame(data=values))
-
-        self.gameOverText = ""  # clear gameover text
-
-    def getUserName(self) -> str:
+    def submitName(self, name) -> None:
         """
-        This method shows an input dialog for the user to write their name.
-        The name will be used in the scoreboard.
+        This method saves the score of the user once they submitted their name.
 
         Tests:
-            - Name wird vom TextInput korrekt zurückgegeben
-            - Darstellung mit richtigem Hintergrund
-
-        Returns: The name of the user as a string
-        """
-
-        nameInput = TextInput(text_color=Colors.White, font_family="Arial", font_size=50)
-
-        while not self.nameSubmit:
-            self.updateEvents(True)
-
-            nameInput.update(self.events)
-
-            self.drawImageOnSurface(self.nameBackground)
-            nameSurface = nameInput.get_surface()
-            self.surface.blit(nameSurface, (self.nameInputX + 10, self.nameInputY - nameSurface.get_height() // 2))
+            - Korrekter Wert wird gespeichert
+            - Korrektes Abfangen von Fehlern
 
-            # Draw the game over notification
-            self.drawTextOnSurface(
-                self.gameOverText,
-                (Configuration.windowWidth / 2, Configuration.windowHeight * 5 / 12),
-                Colors.White,
-                font=self.endFont
-            )
+        Args:
+            name (str): The validated name of the user
 
-            # Notify user of validity of their name
-            text = "Your name is valid! Press Enter to submit!"
-            color = Colors.Green
-            if not self.validateName(nameInput.get_text()):
-                self.nameSubmit = False
-                text = "Your name is not valid!"
-                color = Colors.Red
-
-            self.drawTextOnSurface(
-                text,
-                (Configuration.windowWidth / 2, Configuration.windowHeight * 55 / 100),
-                color
-            )
+        Returns: None
+        """
 
-            pygame.display.update()
+        logger.info("User has entered his name: {}", name)
 
-            self.clock.tick(Configuration.FRAMERATE)
+        if self.game in Configuration.DATA_HEADERS:
+            # Add 1 win or the score
+            value = 1
+            if Configuration.SCORE_HEADER in Configuration.DATA_HEADERS[self.game]:
+                value = self.score
 
-        logger.info("User has entered his name: {}", nameInput.get_text())
+            self.saveScore(name, value)
+        else:
+            logger.critical("Game score could not be saved")
 
-        return nameInput.get_text()
+        self.gameOverText = ""  # clear gameover text
 
     @staticmethod
     def validateName(name) -> bool:
@@ -524,63 +1138,30 @@ class Game:
         pattern = re.compile(r"[A-Za-z0-9.]+")
         return bool(re.fullmatch(pattern, name)) and len(name) <= 25
 
-    def saveScore(self, values) -> None:
+    def saveScore(self, player, value) -> None:
         """
-        This method saves the score of the user in a game
+        This method saves the score of the user in a game. It is appended to the log of the ScoreStore of the game,
+        the csv file is only rewritten once the log is compacted.
 
         Tests:
-            - Übergebener Parameter ist ein DataFrame
             - Richtiges Summieren der Wins
-            - Korrekte Sortierung des DataFrames
-            - Schreiben der CSV-Datei korrekt
+            - Korrekte Sortierung der Scores
 
         Args:
-            values (DataFrame): The data to be appended to the dataframe. It contains the player name and other
-                value(s)
+            player (str): The name of the player
+            value (int): The score or 1 for a win
 
         Returns: None
         """
 
-        if self.scores is not None:
-            self.scores = self.scores.append(values, ignore_index=True)
+        # Accessing the scores loads them if they weren't loaded yet
+        self.scores = Configuration.SCORE_DATA[self.game]
+        rank = self.scores.add(player, value)
 
-            # Sum wins grouped by Player
-            if Configuration.WIN_HEADER in self.scores.columns:
-                self.scores = self.scores. \
-                    groupby(Configuration.PLAYER_HEADER, as_index=False)[Configuration.WIN_HEADER]. \
-                    sum()
+        logger.info("Score {} has been added for {} in game {} at rank {}", value, player, self.game, rank)
 
-            # Sort the DataFrame
-            # Sort after score by default
-            sortType = Configuration.SCORE_HEADER
-
-            if sortType not in self.scores.columns:
-                # Sort after wins
-                sortType = Configuration.WIN_HEADER
-
-            # Sort the data in a descending order
-            self.scores.sort_values(
-                by=[sortType],
-                ascending=False,
-                inplace=True
-            )
-
-            # Save the csv file without the index
-            try:
-                self.scores.to_csv(f"scores/{self.game}.csv", index=False)
-
-                # logging
-                try:
-                    score = values["Score"][0]
-                except KeyError:
-                    score = values["Wins"][0]
-                logger.info("Score {} has been added for {} in game {}", score, values["Player"][0], self.game)
-            except():
-                logger.critical("Score could not be saved")
-
-            # Update global scores
-            Configuration.SCORE_DATA[self.game] = self.scores
-            Configuration.UPDATE_GAME_SCORE = self.game
+        # Update the highscore table
+        Configuration.UPDATE_GAME_SCORE = self.game
 
     def setGameOverText(self, text) -> None:
         """
@@ -624,6 +1205,240 @@ class Game:
         self.isRunning = False
 
 
+class PauseScene(Scene):
+    def __init__(self, game):
+        """
+        The pause menu shown on top of a paused game. The game is suspended below it and keeps its state. The events
+        are still read through the game, so its bindings keep working and pressing ESC again resumes it.
+
+        Tests:
+            - Spiel wird während der Pause nicht aktualisiert
+            - Szene verlässt den Stapel, sobald das Spiel fortgesetzt oder beendet wird
+
+        Args:
+            game (Game): The paused game
+        """
+
+        self.pausedGame = game
+        self.game = game.game
+
+        self.surface = Engine.enter(self)
+        self.menu = Engine.getPauseMenu()
+
+    def frame(self) -> None:
+        """
+        This method draws the pause menu over the last frame of the game.
+
+        Tests:
+            - Menü erhält die Events des Spiels
+            - Fenster wird vollständig aktualisiert
+
+        Returns: None
+        """
+
+        game = self.pausedGame
+
+        # The events are recorded at the step the game was paused at
+        game.updateEvents()
+
+        if game.isPaused and game.isRunning:
+            game.drawMenu(self.menu)
+            pygame.display.update()
+
+            game.clock.tick(Configuration.FRAMERATE)
+        else:
+            Engine.leave(self)
+
+    def togglePause(self) -> None:
+        """
+        This method resumes the paused game. It is called by the "Resume Playing" button of the pause menu.
+        The button is mapped to the ESC-key: A replay has no pause menu to click, but the key is recorded at the
+        paused step and resumes the game through its binding in the replay as well.
+
+        Tests:
+            - Spiel wird im nächsten Frame fortgesetzt
+            - Aufnahme enthält die ESC-Taste statt des Klicks
+
+        Returns: None
+        """
+
+        # The game reads the key in the next frame like one pressed by the player
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode="\x1b", scancode=0))
+
+    def quit(self) -> None:
+        """
+        This method quits the paused game. It is called by the "Quit" button of the pause menu.
+
+        Tests:
+            - Spiel wird beendet
+            - Pausenmenü verlässt den Stapel
+
+        Returns: None
+        """
+
+        self.pausedGame.quit()
+
+    def getIdleTimeout(self):
+        """
+        This method lets the main loop wait for input, the pause menu only changes on input.
+
+        Tests:
+            - Menü wird nach einer Eingabe neu gezeichnet
+            - Gehaltene Tasten werden weiter verarbeitet
+
+        Returns (float): Configuration.IDLE_TIMEOUT or None while a key is held
+        """
+
+        if any(pygame.key.get_pressed()):
+            return None
+
+        return Configuration.IDLE_TIMEOUT
+
+    def getScreenName(self) -> str:
+        """
+        This method returns the name of the scene in reports.
+
+        Tests:
+            - Name enthält das pausierte Spiel
+            - Name unterscheidet sich vom Spiel
+
+        Returns: The name of the scene
+        """
+
+        return f"{self.pausedGame.getScreenName()} paused"
+
+
+class NameInput(Scene):
+    def __init__(self, game):
+        """
+        The input dialog for the user to write their name after a game has ended. The name will be used in the
+        scoreboard, it is passed to game.submitName() once the user pressed Enter.
+
+        Tests:
+            - Name wird vom TextInput korrekt übergeben
+            - Darstellung mit richtigem Hintergrund
+
+        Args:
+            game (Game): The finished game
+        """
+
+        with Startup.measureImport("pygame_textinput"):
+            from pygame_textinput import TextInput
+
+        self.playedGame = game
+        self.game = game.game
+
+        # Rank the score reaches in the highscores, games counting wins are ranked by the total wins of the player
+        self.rankText = ""
+        if Configuration.SCORE_HEADER in Configuration.DATA_HEADERS.get(self.game, []):
+            rank = Configuration.SCORE_DATA[self.game].getRank(game.score)
+            self.rankText = f"You placed #{rank}!"
+
+        # Pass the file of the font to prevent TextInput from scanning the system fonts
+        fontFile, _ = FontRegistry.resolve("arial")
+        self.nameInput = TextInput(text_color=Colors.White, font_family=fontFile, font_size=50)
+
+        self.surface = Engine.enter(self)
+
+        # The text input needs every event
+        pygame.event.set_allowed(None)
+
+    def frame(self) -> None:
+        """
+        This method updates and draws the text input. The name is submitted on Enter if it is valid.
+
+        Tests:
+            - Ungültige Namen können nicht abgeschickt werden
+            - Szene verlässt den Stapel nach dem Abschicken
+
+        Returns: None
+        """
+
+        game = self.playedGame
+
+        if Engine.eventSource is not None:
+            events = Engine.eventSource.getEvents(game)
+        else:
+            events = Engine.getEvents()
+
+        self.nameInput.update(events)
+        name = self.nameInput.get_text()
+        isValid = game.validateName(name)
+
+        # Submit the name on Enter
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN and isValid:
+                game.submitName(name)
+                Engine.leave(self)
+                return
+
+        game.drawImageOnSurface(game.nameBackground)
+        nameSurface = self.nameInput.get_surface()
+        self.surface.blit(nameSurface, (game.nameInputX + 10, game.nameInputY - nameSurface.get_height() // 2))
+
+        # Draw the game over notification
+        game.drawTextOnSurface(
+            game.gameOverText,
+            (Configuration.windowWidth / 2, Configuration.windowHeight * 5 / 12),
+            Colors.White,
+            font=game.endFont
+        )
+
+        if self.rankText:
+            game.drawTextOnSurface(
+                self.rankText,
+                (Configuration.windowWidth / 2, Configuration.windowHeight * 60 / 100),
+                Colors.White
+            )
+
+        # Notify user of validity of their name
+        text = "Your name is valid! Press Enter to submit!"
+        color = Colors.Green
+        if not isValid:
+            text = "Your name is not valid!"
+            color = Colors.Red
+
+        game.drawTextOnSurface(
+            text,
+            (Configuration.windowWidth / 2, Configuration.windowHeight * 55 / 100),
+            color
+        )
+
+        pygame.display.update()
+
+        game.clock.tick(Configuration.FRAMERATE)
+
+    def getIdleTimeout(self):
+        """
+        This method lets the main loop wait for input until the cursor of the text input blinks the next time.
+
+        Tests:
+            - Cursor blinkt weiterhin im richtigen Takt
+            - Gehaltene Tasten werden wiederholt
+
+        Returns (float): The time until the cursor blinks in seconds or None while a key is repeated
+        """
+
+        nameInput = self.nameInput
+        if nameInput.keyrepeat_counters:
+            return None
+
+        return max(nameInput.cursor_switch_ms - nameInput.cursor_ms_counter, 1) / 1000
+
+    def getScreenName(self) -> str:
+        """
+        This method returns the name of the scene in reports.
+
+        Tests:
+            - Name enthält das beendete Spiel
+            - Name unterscheidet sich vom Spiel
+
+        Returns: The name of the scene
+        """
+
+        return f"{self.playedGame.getScreenName()} name input"
+
+
 class GameContainer(Game):
     def __init__(self):
         """
@@ -641,6 +1456,16 @@ class GameContainer(Game):
         # Disable the score display
         self.hasScore = False
 
+        # The menus are drawn over the whole window, but only change on input
+        self.useDirtyRects = False
+        self.isStatic = True
+
+        # pygame_menu handles every kind of event
+        self.eventTypes = None
+
+        with Startup.measureImport("pygame_menu"):
+            import pygame_menu
+
         # Create menus
         # https://pygame-menu.readthedocs.io/en/4.0.7/index.html
         self.mainMenu = pygame_menu.Menu(
@@ -716,8 +1541,8 @@ class GameContainer(Game):
         self.pongMenu.add.button("Two players", self.startPongMultiplayer)
         self.pongMenu.add.button("Back", pygame_menu.events.BACK)
 
-        # Quit the game on esc
-        self.pauseBehaviour = self.quit
+        # Quit the application on esc instead of pausing
+        self.bind(pygame.KEYDOWN, lambda event: self.quit(), pygame.K_ESCAPE)
 
         # Run the container
         self.run()
@@ -738,6 +1563,26 @@ class GameContainer(Game):
 
         super().updateScreen()
 
+        # Decode the assets of the games in the background while the menu is idle
+        Prefetcher.update()
+
+    def getIdleTimeout(self):
+        """
+        This method lets the main loop wait for input once the assets of every game are prefetched. Until then every
+        frame finalizes some of them.
+
+        Tests:
+            - Menü wartet erst nach dem Vorladen auf Eingaben
+            - Vorladen wird nicht durch das Warten verzögert
+
+        Returns (float): The time to wait for input in seconds or None while assets are prefetched
+        """
+
+        if not Prefetcher.isDone():
+            return None
+
+        return super().getIdleTimeout()
+
     @staticmethod
     def startSnake() -> None:
         """
@@ -752,6 +1597,7 @@ class GameContainer(Game):
 
         logger.info("Start snake game")
 
+        Prefetcher.finish(Configuration.GAME_SNAKE)
         from games.Snake import Snake
         Snake()
 
@@ -769,6 +1615,7 @@ class GameContainer(Game):
 
         logger.info("Start TikTakToe game")
 
+        Prefetcher.finish(Configuration.GAME_TTT)
         from games.TicTacToe import TicTacToe
         TicTacToe()
 
@@ -786,6 +1633,7 @@ class GameContainer(Game):
 
         logger.info("Start Pong multiplayer")
 
+        Prefetcher.finish(Configuration.GAME_PONG)
         from games.Pong import Pong
         Pong(False)
 
@@ -803,6 +1651,7 @@ class GameContainer(Game):
 
         logger.info("Start Pong with computer player")
 
+        Prefetcher.finish(Configuration.GAME_PONG)
         from games.Pong import Pong
         Pong(True)
 
@@ -851,8 +1700,8 @@ class GameContainer(Game):
 
         Tests:
             - Übergebener Parameter enthält das ausgewählte Spiel
-            - Korrekter DataFrame wird ausgewählt
-            - Tabelle spiegelt genau den DataFrame wieder
+            - Korrekte Scores werden ausgewählt
+            - Tabelle spiegelt genau die besten Scores wieder
 
         Args:
             selectValue (tuple[tuple[str, str], int]): The value of the dropdown select
@@ -875,7 +1724,7 @@ class GameContainer(Game):
         # Check if data exists
         scores = Configuration.SCORE_DATA[game]
         if scores is not None:
-            if not scores.empty:
+            if not scores.isEmpty():
                 if self.highscoreMenu.get_widget("no_scores"):
                     self.highscoreMenu.remove_widget("no_scores")
 
@@ -894,8 +1743,8 @@ class GameContainer(Game):
                     cells=Configuration.DATA_HEADERS[game]
                 )
 
-                # Add a row for the top 10
-                for row in scores.head(10).itertuples(index=False):
+                # Add a row for the best scores
+                for row in scores.getTop(Configuration.LEADERBOARD_SIZE):
                     table.add_row(row)
 
                 # Create a draw callback to be fired each time the table is drawn.
@@ -956,28 +1805,54 @@ class GameContainer(Game):
 
         return selectValue[0][0]
 
-    def quit(self) -> None:
-        """
-        This method quits the application.
 
-        Tests:
-            - Applikation wird ohne Fehler beendet
-            - Rückgabecode wird korrekt übergeben
+def runHeadless(game, steps=Configuration.HEADLESS_STEPS, render=False, **kwargs) -> Game:
+    """
+    This function runs a game headless, meaning without a window, sound or frame pacing. The game logic is simulated
+    as fast as the CPU allows, which is used for soak tests and bots.
 
-        Returns: None
-        """
+    Tests:
+        - Jedes Spiel kann ohne Fenster gestartet werden
+        - Unbekannte Spiele werden abgelehnt
 
-        super().quit()
+    Args:
+        game (str): The name of the game. One of Configuration.GAME_SNAKE, GAME_TTT or GAME_PONG
+        steps (int): The maximum number of steps to simulate, 0 runs until the game quits itself
+        render (bool): Specifies whether a frame is drawn to the dummy display after every step
+        kwargs: Passed to the constructor of the game, e.g. hasComputerPlayer for Pong
 
-        pygame.quit()
-        exit(0)
+    Returns: The finished game. Its steps per second are saved in stepsPerSecond
+    """
 
+    Configuration.isHeadless = True
+    Configuration.HEADLESS_STEPS = steps
+    Configuration.HEADLESS_RENDER = render
 
-class Image(pygame.sprite.Sprite):
-    def __init__(self, x, y, size, image, pathToImage="images/", colorkey=(0, 0, 0), hasColorkey=True):
+    if game == Configuration.GAME_SNAKE:
+        from games.Snake import Snake as GameClass
+    elif game == Configuration.GAME_TTT:
+        from games.TicTacToe import TicTacToe as GameClass
+    elif game == Configuration.GAME_PONG:
+        from games.Pong import Pong as GameClass
+        kwargs.setdefault("hasComputerPlayer", True)
+    else:
+        raise ValueError(f"Unknown game: {game}")
+
+    logger.info("Start headless run of {} with at most {} steps", game, steps)
+
+    return GameClass(**kwargs)
+
+
+class Image:
+    # No __dict__ per image, children declare their own attributes in __slots__ as well
+    __slots__ = ("image", "rect", "SIZE", "interpolate", "prevX", "prevY")
+
+    def __init__(self, x, y, size, image=None, pathToImage="images/", colorkey=(0, 0, 0), hasColorkey=True,
+                 surface=None):
         """
         This class represents a image in a game. This can be a texture, character, etc.
-        It's parent is pygame.sprite.Sprite
+        Images of the same file, size and colorkey share their surface through the TextureCache, so never draw on
+        the surface of an image. The rect of an image is only ever updated in place.
 
         Tests:
             - Bild wird korrekt geladen
@@ -991,18 +1866,23 @@ class Image(pygame.sprite.Sprite):
             pathToImage (str): The name of the folder of the image
             colorkey (tuple[int, int, int]): The color to be replaced with transparent pixels
             hasColorkey (bool): Specifies whether the color given in colorkey will be replaced
+            surface (pygame.surface.Surface): An already loaded surface, e.g. a sprite of an Atlas. Replaces loading
+                the image file
         """
-        super().__init__()
 
-        # Load the given image
+        # Load the given image, the colorkey is applied by the cache
+        if not hasColorkey:
+            colorkey = None
+
         try:
-            self.image = pygame.transform.smoothscale(pygame.image.load(os.path.join(pathToImage, image)).convert(), size)
+            if surface is not None:
+                self.image = surface
+            else:
+                self.image = TextureCache.get(os.path.join(pathToImage, image), size, colorkey)
         except FileNotFoundError:
             logger.info("Image {} could not be loaded", image)
-
-        # Apply colorkey
-        if hasColorkey:
-            self.image.set_colorkey(colorkey)
+            # Use an empty surface instead to keep the game running
+            self.image = pygame.Surface(size).convert()
 
         # Create size variable and position the image on the screen
         self.SIZE = pygame.Rect(0, 0, size[0], size[1])
@@ -1011,6 +1891,31 @@ class Image(pygame.sprite.Sprite):
         self.rect.x = x
         self.rect.y = y
 
+        # Position before the last game step. Only used if the image is drawn interpolated
+        self.interpolate = False
+        self.prevX, self.prevY = self.rect.x, self.rect.y
+
+    @classmethod
+    def fromAsset(cls, x, y, asset):
+        """
+        This method creates an image of an entry of the asset manifest of a game, see Game.ASSETS.
+
+        Tests:
+            - Bild erhält Größe und Colorkey des Eintrags
+            - Einträge ohne Colorkey werden ohne Transparenz geladen
+
+        Args:
+            x (int): The position on the screen on the x-axis
+            y (int): The position on the screen on the y-axis
+            asset (tuple[str, tuple[int, int], tuple[int, int, int]]): The path, size and colorkey of the image
+
+        Returns (Image): The image
+        """
+
+        path, size, colorkey = asset
+
+        return cls(x, y, size, path, pathToImage="", colorkey=colorkey, hasColorkey=colorkey is not None)
+
     def getX(self) -> int:
         """
         This method returns the most left x value of the image
@@ -1069,6 +1974,39 @@ class Image(pygame.sprite.Sprite):
 
         self.rect.y = y
 
+    def savePosition(self) -> None:
+        """
+        This method saves the current position as the position before the next game step.
+        Call it after teleporting the image to prevent it from being drawn in between.
+
+        Tests:
+            - Position wird korrekt gespeichert
+            - Kein Interpolieren nach dem Aufruf
+
+        Returns: None
+        """
+
+        self.prevX, self.prevY = self.rect.x, self.rect.y
+
+    def getInterpolatedPos(self, interpolation) -> (float, float):
+        """
+        This method returns the position between the saved and the current position of the image.
+
+        Tests:
+            - 0 ergibt die gespeicherte, 1 die aktuelle Position
+            - Werte dazwischen liegen auf der Strecke der beiden Positionen
+
+        Args:
+            interpolation (float): The progress between the two positions ranging from 0.0 to 1.0
+
+        Returns: The interpolated top left corner of the image
+        """
+
+        return (
+            self.prevX + (self.rect.x - self.prevX) * interpolation,
+            self.prevY + (self.rect.y - self.prevY) * interpolation
+        )
+
     def getRect(self) -> pygame.rect.Rect:
         """
         This method returns the rect of the image.
@@ -1084,19 +2022,19 @@ class Image(pygame.sprite.Sprite):
 
     def setRect(self, rect) -> None:
         """
-        This method updates the rect of the image.
+        This method updates the rect of the image in place.
 
         Tests:
             - Variable wird korrekt gesetzt
             - Übergebener Parameter ist ein gültiges Rechteck
 
         Args:
-            rect (pygame.rect.Rect): The new rect object
+            rect (pygame.rect.Rect): The rect to copy the position and size from
 
         Returns: None
         """
 
-        self.rect = pygame.rect.Rect(rect)
+        self.rect.update(rect)
 
     def getImage(self) -> pygame.surface.Surface:
         """